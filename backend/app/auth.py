@@ -1,16 +1,22 @@
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from app.config import settings
-from app.database import get_db
+from app.database import get_read_db
+from app.services.token_cache import token_cache
+from app.utils.password_pool import password_pool
 
-# 비밀번호 해싱
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 비밀번호 해싱 (cost 가 설정과 다른 해시는 verify_and_update 가 새 해시를 돌려줌)
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
 security = HTTPBearer()
+# 운영용 엔드포인트는 같은 호스트의 요청이면 토큰 없이 허용하므로 선택적으로 읽음
+optional_security = HTTPBearer(auto_error=False)
+
+_LOOPBACK_HOSTS = {"127.0.0.1", "::1", "localhost"}
 
 def verify_password(plain_password, hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
@@ -18,6 +24,14 @@ def verify_password(plain_password, hashed_password):
 def get_password_hash(password):
     return pwd_context.hash(password)
 
+async def hash_password(password: str) -> str:
+    """get_password_hash 를 해싱 전용 풀에서 실행 (이벤트 루프를 막지 않음)"""
+    return await password_pool.run(pwd_context.hash, password)
+
+async def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """(일치 여부, 다시 저장할 해시) - cost 가 바뀐 해시면 두 번째 값이 새 해시"""
+    return await password_pool.run(pwd_context.verify_and_update, plain_password, hashed_password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -28,28 +42,86 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
-def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
+def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+    """서명/만료를 확인한 토큰 클레임 (sub 필수, 이미 검증한 토큰은 캐시에서)"""
+    payload = token_cache.get(credentials.credentials)
+    if payload is not None:
+        return payload
     try:
         payload = jwt.decode(credentials.credentials, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        user_id: int = payload.get("sub")
-        if user_id is None:
+        if payload.get("sub") is None:
             raise HTTPException(status_code=401, detail="Invalid token")
-        return user_id
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid token")
+    token_cache.put(credentials.credentials, payload)
+    return payload
 
-def get_current_user(user_id: int = Depends(verify_token), db: Session = Depends(get_db)):
-    from app.models.user import User
-    user = db.query(User).filter(User.user_id == user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    # 사용자 정보를 딕셔너리로 반환 (모델 객체 대신)
+def user_principal(user) -> dict:
+    """인증된 사용자 정보 (get_current_user 반환값, 캐시에 저장되는 형태)"""
     return {
         "user_id": user.user_id,
         "email": user.email,
         "name": user.name,
         "major": user.major,
         "year": user.year,
-        "user_type": user.user_type
-    }
\ No newline at end of file
+        "user_type": user.user_type,
+        "profile_info": user.profile_info,
+        "sejong_student_id": user.sejong_student_id,
+        "created_at": user.created_at
+    }
+
+def get_current_user(claims: dict = Depends(verify_token), db: Session = Depends(get_read_db)):
+    """토큰의 사용자 정보 (캐시 적중 시 DB 조회 없음)
+
+    세션은 실제로 쿼리할 때 연결을 잡으므로 캐시 적중이면 DB 왕복이 없고,
+    같은 요청 안에서는 FastAPI 가 결과를 재사용하므로 핸들러도 다시 조회할 필요가 없습니다.
+    """
+    from app.models.user import User
+    from app.services.principal_cache import principal_cache
+    try:
+        user_id = int(claims["sub"])
+        # "ver" 가 없는 이전 토큰은 버전 0
+        token_version = int(claims.get("ver", 0))
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=401, detail="Invalid token")
+    
+    principal = principal_cache.get(user_id, token_version)
+    if principal is not None:
+        return principal
+    
+    user = db.query(User).filter(User.user_id == user_id).first()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    if user.token_version != token_version:
+        raise HTTPException(status_code=401, detail="Token revoked")
+    
+    principal = user_principal(user)
+    principal_cache.put(user_id, token_version, principal)
+    return principal
+
+def _is_local_request(request: Request) -> bool:
+    """프록시를 거치지 않은 같은 호스트의 직접 요청 (프록시가 붙인 전달 헤더가 있으면 아님)"""
+    client = request.client
+    if client is None or client.host not in _LOOPBACK_HOSTS:
+        return False
+    return "x-forwarded-for" not in request.headers and "forwarded" not in request.headers
+
+def require_operator(
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+    db: Session = Depends(get_read_db)
+) -> Optional[dict]:
+    """운영용 엔드포인트 접근 확인: localhost 직접 요청이거나 ADMIN_EMAILS 계정의 토큰"""
+    if _is_local_request(request):
+        return None
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    
+    principal = get_current_user(verify_token(credentials), db)
+    if (principal["email"] or "").lower() not in settings.ADMIN_EMAILS:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="관리자만 접근할 수 있습니다.")
+    return principal
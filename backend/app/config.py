@@ -4,11 +4,45 @@ from dotenv import load_dotenv
 load_dotenv()
 
 class Settings:
-    DATABASE_URL: str = os.getenv("DATABASE_URL")
+    DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./sejong_startup.db")
+    # 조회 전용 라우트가 쓸 복제본 (없으면 SQLite 파일을 읽기 전용으로 연결)
+    DATABASE_READ_URL: str = os.getenv("DATABASE_READ_URL")
+    # 커넥션 풀 (스레드풀 워커 수 + 백그라운드 작업을 감당할 크기)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "20"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    # SQLite 연결 PRAGMA
+    SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    SQLITE_CACHE_SIZE_KIB: int = int(os.getenv("SQLITE_CACHE_SIZE_KIB", str(64 * 1024)))
+    SQLITE_MMAP_SIZE: int = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+    # 서버 시작 시 마이그레이션 자동 적용 (기본은 버전 확인만, 적용은 python -m app.migrations upgrade)
+    AUTO_MIGRATE: bool = os.getenv("AUTO_MIGRATE", "False").lower() == "true"
     SECRET_KEY: str = os.getenv("SECRET_KEY")
     ALGORITHM: str = os.getenv("ALGORITHM", "HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "1440"))
+    # 서명 검증을 마친 JWT 클레임 캐시 (토큰 해시 → 클레임, exp 까지만 유지)
+    TOKEN_CACHE_MAX_ENTRIES: int = int(os.getenv("TOKEN_CACHE_MAX_ENTRIES", "10000"))
+    # 비밀번호 해싱: bcrypt cost 를 바꾸면 다음 로그인 때 새 cost 로 다시 해싱됨
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    # 해싱 전용 스레드 수와 대기 한도 (넘으면 503)
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+    PASSWORD_HASH_MAX_PENDING: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY")
     DEBUG: bool = os.getenv("DEBUG", "True").lower() == "true"
+    RECOMMENDATION_CACHE_MAX_ENTRIES: int = int(os.getenv("RECOMMENDATION_CACHE_MAX_ENTRIES", "1024"))
+    RECOMMENDATION_CACHE_MAX_BYTES: int = int(os.getenv("RECOMMENDATION_CACHE_MAX_BYTES", str(8 * 1024 * 1024)))
+    # 인증 주체(get_current_user) 캐시: 프로세스별이므로 다른 워커의 변경은 TTL 안에 반영됨
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", "10000"))
+    PRINCIPAL_CACHE_TTL_SECONDS: float = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "60"))
+    # 운영용 엔드포인트(/metrics, /debug/event-loop)에 토큰으로 접근할 수 있는 관리자 이메일 (쉼표 구분)
+    ADMIN_EMAILS: frozenset = frozenset(
+        email.strip().lower() for email in os.getenv("ADMIN_EMAILS", "").split(",") if email.strip()
+    )
+    # 이벤트 루프 정체 스택 조회(/debug/event-loop) - 코드 경로가 노출되므로 명시적으로 켤 때만
+    LOOP_DEBUG_ENDPOINT: bool = os.getenv("LOOP_DEBUG_ENDPOINT", "False").lower() == "true"
+    EVENT_LOOP_MONITOR_ENABLED: bool = os.getenv("EVENT_LOOP_MONITOR_ENABLED", "True").lower() == "true"
+    EVENT_LOOP_MONITOR_INTERVAL_MS: int = int(os.getenv("EVENT_LOOP_MONITOR_INTERVAL_MS", "50"))
+    EVENT_LOOP_STALL_THRESHOLD_MS: int = int(os.getenv("EVENT_LOOP_STALL_THRESHOLD_MS", "100"))
 
 settings = Settings()
\ No newline at end of file
@@ -1,22 +1,190 @@
-from sqlalchemy import create_engine
+from typing import Callable, TypeVar
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+from starlette.concurrency import run_in_threadpool
 import os
 from dotenv import load_dotenv
 
+from app.config import settings
+
 load_dotenv()
 
-# SQLite 사용 (해커톤용 빠른 개발)
-DATABASE_URL = "sqlite:///./sejong_startup.db"
+T = TypeVar("T")
+
+# 기본값은 SQLite (해커톤용 빠른 개발), DATABASE_URL로 변경 가능
+DATABASE_URL = settings.DATABASE_URL
+
+# 동기 드라이버 → async def 라우터용 비동기 드라이버
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+}
+
+
+def to_async_url(url: str) -> str:
+    """동기 DB URL을 같은 DB를 가리키는 비동기 드라이버 URL로 변환"""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if parsed.get_dialect().is_async or backend not in ASYNC_DRIVERS:
+        return url
+    return parsed.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+def to_read_only_url(url: str) -> str:
+    """같은 SQLite 파일을 읽기 전용(mode=ro)으로 여는 URL (SQLite가 아니면 그대로)"""
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite" or _is_sqlite_memory(url):
+        return url
+    if parsed.query.get("mode") == "ro":
+        return url
+    database = parsed.database
+    if not database.startswith("file:"):
+        database = f"file:{os.path.abspath(database)}"
+    return parsed.set(
+        database=database,
+        query={**parsed.query, "mode": "ro", "uri": "true"}
+    ).render_as_string(hide_password=False)
+
+
+def _is_sqlite_memory(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:")
+
+
+def _apply_connection_pragmas(cursor) -> None:
+    """읽기/쓰기 연결 공통 PRAGMA (잠금 대기, 페이지 캐시, mmap)"""
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+    # 음수는 KiB 단위
+    cursor.execute(f"PRAGMA cache_size=-{int(settings.SQLITE_CACHE_SIZE_KIB)}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """연결마다 SQLite PRAGMA 적용
+
+    WAL 모드에서는 읽기가 쓰기 트랜잭션을 기다리지 않고, synchronous=NORMAL은
+    WAL에서 안전하면서 커밋마다 fsync하지 않습니다. busy_timeout 동안은 잠금을
+    재시도하므로 동시 쓰기가 바로 "database is locked"로 실패하지 않습니다.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        _apply_connection_pragmas(cursor)
+    finally:
+        cursor.close()
+
+
+def _set_sqlite_read_pragmas(dbapi_connection, connection_record) -> None:
+    """읽기 전용 연결 PRAGMA (journal_mode는 쓰기 연결이 설정, 쓰기 시도는 오류)"""
+    cursor = dbapi_connection.cursor()
+    try:
+        _apply_connection_pragmas(cursor)
+        cursor.execute("PRAGMA query_only=ON")
+    finally:
+        cursor.close()
+
+
+def _engine_options(url: str) -> dict:
+    """드라이버에 맞는 create_engine 옵션 (풀 크기, SQLite 연결 인자)"""
+    if _is_sqlite_memory(url):
+        # 메모리 DB는 연결마다 별도 DB가 되므로 하나의 연결을 공유
+        return {"connect_args": {"check_same_thread": False}, "poolclass": StaticPool}
+
+    options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_pre_ping": True,
+    }
+    if make_url(url).get_backend_name() == "sqlite":
+        # 드라이버 수준 잠금 대기도 busy_timeout과 맞춤
+        options["connect_args"] = {
+            "check_same_thread": False,
+            "timeout": settings.SQLITE_BUSY_TIMEOUT_MS / 1000
+        }
+    else:
+        options["pool_recycle"] = settings.DB_POOL_RECYCLE
+    return options
+
+
+def create_db_engine(url: str = DATABASE_URL, read_only: bool = False) -> Engine:
+    """설정된 URL로 동기 엔진 생성 (SQLite면 연결 시 PRAGMA 적용)"""
+    db_engine = create_engine(url, **_engine_options(url))
+    if db_engine.dialect.name == "sqlite":
+        event.listen(db_engine, "connect", _set_sqlite_read_pragmas if read_only else _set_sqlite_pragmas)
+    return db_engine
+
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+def create_async_db_engine(url: str = DATABASE_URL, read_only: bool = False) -> AsyncEngine:
+    """같은 DB를 가리키는 비동기 엔진 생성 (풀/PRAGMA 설정 동일)"""
+    async_url = to_async_url(url)
+    db_engine = create_async_engine(async_url, **_engine_options(async_url))
+    if db_engine.dialect.name == "sqlite":
+        event.listen(db_engine.sync_engine, "connect", _set_sqlite_read_pragmas if read_only else _set_sqlite_pragmas)
+    return db_engine
+
+
+# 읽기 전용 풀: 복제본 URL이 있으면 그쪽으로, 없으면 같은 SQLite 파일을 mode=ro로 연결
+DATABASE_READ_URL = settings.DATABASE_READ_URL or to_read_only_url(DATABASE_URL)
+
+engine = create_db_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
-# 의존성 주입용 함수
+# 메모리 SQLite는 연결마다 별도 DB라 읽기용도 같은 엔진을 사용
+read_engine = engine if _is_sqlite_memory(DATABASE_READ_URL) else create_db_engine(DATABASE_READ_URL, read_only=True)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+# async def 라우터용 (aiosqlite 드라이버로 이벤트 루프를 막지 않음)
+# 커밋 후에도 속성을 다시 읽지 않도록 expire_on_commit=False (비동기 세션은 지연 로딩 불가)
+async_engine = create_async_db_engine()
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+async_read_engine = async_engine if _is_sqlite_memory(DATABASE_READ_URL) else create_async_db_engine(DATABASE_READ_URL, read_only=True)
+AsyncReadSessionLocal = async_sessionmaker(bind=async_read_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+# 의존성 주입용 함수 (읽기/쓰기)
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+# 조회 전용 라우트용 (읽기 풀, 쓰기와 경합하지 않음)
+def get_read_db():
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+# 비동기 라우터용 의존성 주입 함수 (읽기/쓰기)
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+# 비동기 조회 전용 라우트용
+async def get_async_read_db():
+    async with AsyncReadSessionLocal() as db:
+        yield db
+
+# 동기 서비스(매칭, 카탈로그 색인 등)를 async def 라우터에서 호출할 때
+# AsyncSession.run_sync 는 이벤트 루프 스레드에서 greenlet 으로 실행되어 루프를 그대로 막으므로,
+# 스레드풀에서 별도의 동기 세션으로 실행
+async def run_in_session(work: Callable[[Session], T], read_only: bool = False) -> T:
+    session_factory = ReadSessionLocal if read_only else SessionLocal
+    
+    def run() -> T:
+        with session_factory() as session:
+            return work(session)
+    
+    return await run_in_threadpool(run)
@@ -1,7 +1,11 @@
 ﻿# backend/app/main.py 업데이트 (법적 문서 라우터 추가)
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, HTTPException, status
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
+from app.auth import require_operator
+from app.config import settings
 from app.database import engine, Base
+from app.migrations import check_schema, upgrade as run_migrations
 
 # 모든 모델 import (테이블 생성을 위해)
 from app.models import *
@@ -12,14 +16,16 @@ from app.routers import (
     team_matching, resumes, dashboard, research_labs,
     legal_documents  # 새로 추가
 )
-
-# 데이터베이스 테이블 생성
-Base.metadata.create_all(bind=engine)
+from app.services.rematch_queue import rematch_queue, register_listeners
+from app.utils.loop_monitor import loop_monitor
+from app.utils.password_pool import password_pool
+from app.utils.responses import FastJSONResponse
 
 app = FastAPI(
     title="세종 스타트업 네비게이터 API",
     description="해커톤 MVP + 연구실 매칭 + 법적 문서 생성 시스템",
-    version="1.2.0"
+    version="1.2.0",
+    default_response_class=FastJSONResponse  # response_model 없는 라우트도 orjson 으로
 )
 
 # CORS 설정
@@ -31,6 +37,38 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 스키마 버전 확인 (AUTO_MIGRATE 면 밀린 마이그레이션을 먼저 적용)
+@app.on_event("startup")
+def verify_schema():
+    if settings.AUTO_MIGRATE:
+        run_migrations(engine)
+    check_schema(engine)
+
+# 프로젝트/연구실 변경 시 저장된 매칭 결과를 백그라운드에서 다시 계산
+@app.on_event("startup")
+async def start_rematch_worker():
+    register_listeners()
+    rematch_queue.start()
+
+@app.on_event("shutdown")
+async def stop_rematch_worker():
+    rematch_queue.stop()
+
+# 이벤트 루프 지연 측정 (블로킹 호출이 있는 라우트를 찾기 위함)
+@app.on_event("startup")
+async def start_loop_monitor():
+    if settings.EVENT_LOOP_MONITOR_ENABLED:
+        loop_monitor.register_routes(app.routes)
+        loop_monitor.start()
+
+@app.on_event("shutdown")
+async def stop_loop_monitor():
+    await loop_monitor.stop()
+
+@app.on_event("shutdown")
+def stop_password_pool():
+    password_pool.shutdown()
+
 # 라우터 등록
 app.include_router(auth.router, prefix="/auth", tags=["auth"])
 app.include_router(users.router, prefix="/users", tags=["users"])
@@ -47,6 +85,21 @@ app.include_router(legal_documents.router, prefix="/legal-docs", tags=["Legal Do
 async def health_check():
     return {"status": "healthy", "message": "세종 스타트업 네비게이터 + 법적 문서 생성 API"}
 
+@app.get("/metrics", response_class=PlainTextResponse, dependencies=[Depends(require_operator)])
+async def metrics():
+    """Prometheus 형식 지표 (이벤트 루프 지연, 비밀번호 해싱 대기열) - localhost 또는 관리자만"""
+    return loop_monitor.render_metrics() + password_pool.render_metrics()
+
+def loop_debug_enabled():
+    # 꺼져 있으면 인증 확인 전에 404 (엔드포인트 존재도 드러내지 않음)
+    if not settings.LOOP_DEBUG_ENDPOINT:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+@app.get("/debug/event-loop", dependencies=[Depends(loop_debug_enabled), Depends(require_operator)])
+async def debug_event_loop():
+    """최근 이벤트 루프 정체와 원인 스택 (LOOP_DEBUG_ENDPOINT 를 켠 경우, localhost 또는 관리자만)"""
+    return loop_monitor.snapshot()
+
 @app.get("/")
 async def root():
     return {"message": "세종 스타트업 네비게이터 + 법적 문서 생성 API에 오신 것을 환영합니다!"}
@@ -0,0 +1,18 @@
+# backend/app/migrations/__init__.py
+# 버전이 매겨진 스키마 마이그레이션 (versions/ 아래 NNNN_이름.py, 각 파일에 upgrade(conn))
+# 적용: python -m app.migrations upgrade
+from .runner import (
+    Migration, SchemaOutdatedError, check_schema, current_version,
+    latest_version, load_migrations, schema_migrations, upgrade
+)
+
+__all__ = [
+    "Migration",
+    "SchemaOutdatedError",
+    "check_schema",
+    "current_version",
+    "latest_version",
+    "load_migrations",
+    "schema_migrations",
+    "upgrade"
+]
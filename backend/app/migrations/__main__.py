@@ -0,0 +1,75 @@
+# backend/app/migrations/__main__.py
+"""
+스키마 마이그레이션 명령 (backend/ 에서 실행)
+
+    python -m app.migrations upgrade            # 밀린 마이그레이션 모두 적용
+    python -m app.migrations upgrade --target 3 # 0003 까지만 적용
+    python -m app.migrations current            # DB 스키마 버전
+    python -m app.migrations history            # 마이그레이션 목록과 적용 여부
+    python -m app.migrations check              # 최신이 아니면 종료 코드 1 (배포 전 확인용)
+"""
+import argparse
+import logging
+import sys
+
+from app.database import DATABASE_URL, engine
+from app.migrations.runner import (
+    SchemaOutdatedError, applied_versions, check_schema, current_version,
+    latest_version, load_migrations, upgrade
+)
+
+
+def cmd_upgrade(args) -> int:
+    print(f"🛠️ 마이그레이션 적용을 시작합니다... ({DATABASE_URL})")
+    applied = upgrade(engine, target=args.target)
+    for migration in applied:
+        print(f"   ✅ {migration.version:04d}_{migration.name}")
+    if not applied:
+        print("   - 적용할 마이그레이션이 없습니다.")
+    print(f"📌 현재 스키마 버전: {current_version(engine):04d}")
+    return 0
+
+
+def cmd_current(args) -> int:
+    print(f"📌 현재 스키마 버전: {current_version(engine):04d} (최신 {latest_version():04d})")
+    return 0
+
+
+def cmd_history(args) -> int:
+    with engine.connect() as conn:
+        done = applied_versions(conn)
+    for migration in load_migrations():
+        mark = "✅" if migration.version in done else "⏳"
+        print(f"   {mark} {migration.version:04d}_{migration.name}")
+    return 0
+
+
+def cmd_check(args) -> int:
+    try:
+        version = check_schema(engine)
+    except SchemaOutdatedError as e:
+        print(f"❌ {e}")
+        return 1
+    print(f"✅ 스키마가 최신입니다 ({version:04d})")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.migrations", description="스키마 마이그레이션")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    upgrade_parser = subparsers.add_parser("upgrade", help="밀린 마이그레이션 적용")
+    upgrade_parser.add_argument("--target", type=int, default=None, help="이 버전까지만 적용")
+    upgrade_parser.set_defaults(handler=cmd_upgrade)
+
+    subparsers.add_parser("current", help="DB 스키마 버전").set_defaults(handler=cmd_current)
+    subparsers.add_parser("history", help="마이그레이션 목록과 적용 여부").set_defaults(handler=cmd_history)
+    subparsers.add_parser("check", help="최신이 아니면 종료 코드 1").set_defaults(handler=cmd_check)
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+# backend/app/migrations/operations.py
+"""서비스를 멈추지 않고 적용할 수 있는 스키마 변경 헬퍼
+
+모두 이미 적용된 상태면 아무것도 하지 않으므로, 실패 후 다시 실행해도 안전합니다.
+"""
+from typing import Sequence
+
+from sqlalchemy import Column, inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateColumn
+
+
+def has_column(conn: Connection, table: str, column: str) -> bool:
+    return any(info["name"] == column for info in inspect(conn).get_columns(table))
+
+
+def has_index(conn: Connection, table: str, name: str) -> bool:
+    return any(info["name"] == name for info in inspect(conn).get_indexes(table))
+
+
+def _is_autocommit(conn: Connection) -> bool:
+    return conn.get_execution_options().get("isolation_level") == "AUTOCOMMIT"
+
+
+def add_column(conn: Connection, table: str, column: Column) -> bool:
+    """컬럼 추가 (이미 있으면 건너뜀), 추가했으면 True
+
+    NULL 허용이거나 server_default 가 있는 컬럼만 받습니다. 이 경우 SQLite/PostgreSQL 모두
+    기존 행을 다시 쓰지 않고 메타데이터만 바꾸므로 테이블 크기와 무관하게 바로 끝납니다.
+    """
+    if has_column(conn, table, column.name):
+        return False
+    if not column.nullable and column.server_default is None:
+        raise ValueError(f"{table}.{column.name}: NOT NULL 컬럼은 server_default 가 있어야 온라인으로 추가할 수 있습니다.")
+
+    preparer = conn.dialect.identifier_preparer
+    definition = CreateColumn(column).compile(dialect=conn.dialect)
+    conn.execute(text(f"ALTER TABLE {preparer.quote(table)} ADD COLUMN {definition}"))
+    return True
+
+
+def create_index(conn: Connection, name: str, table: str, columns: Sequence[str], unique: bool = False) -> bool:
+    """인덱스 생성 (이미 있으면 건너뜀), 생성했으면 True
+
+    PostgreSQL 에서 autocommit 연결(TRANSACTIONAL = False 마이그레이션)이면
+    CONCURRENTLY 로 만들어 생성 중에도 테이블 쓰기를 막지 않습니다.
+    """
+    if has_index(conn, table, name):
+        return False
+
+    preparer = conn.dialect.identifier_preparer
+    concurrently = "CONCURRENTLY " if conn.dialect.name == "postgresql" and _is_autocommit(conn) else ""
+    conn.execute(text(
+        f"CREATE {'UNIQUE ' if unique else ''}INDEX {concurrently}{preparer.quote(name)} "
+        f"ON {preparer.quote(table)} ({', '.join(preparer.quote(column) for column in columns)})"
+    ))
+    return True
+
+
+def drop_index(conn: Connection, name: str, table: str) -> bool:
+    """인덱스 삭제 (없으면 건너뜀), 삭제했으면 True"""
+    if not has_index(conn, table, name):
+        return False
+    conn.execute(text(f"DROP INDEX {conn.dialect.identifier_preparer.quote(name)}"))
+    return True
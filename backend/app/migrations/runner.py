@@ -0,0 +1,139 @@
+# backend/app/migrations/runner.py
+import importlib
+import logging
+import pkgutil
+import re
+from types import ModuleType
+from typing import List, NamedTuple, Optional, Set
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, inspect, insert, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+from app.migrations import versions
+
+logger = logging.getLogger(__name__)
+
+# 적용된 마이그레이션 버전 기록 테이블
+schema_migrations = Table(
+    "schema_migrations", MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("name", String(200), nullable=False),
+    Column("applied_at", DateTime(timezone=True), server_default=func.now())
+)
+
+# versions/ 아래 파일 이름 규칙: 0001_initial_schema.py
+_MODULE_NAME = re.compile(r"^(\d{4})_(\w+)$")
+
+
+class SchemaOutdatedError(RuntimeError):
+    """DB 스키마 버전이 코드의 마이그레이션과 맞지 않음"""
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    module: ModuleType
+
+    @property
+    def transactional(self) -> bool:
+        # CREATE INDEX CONCURRENTLY 처럼 트랜잭션 밖에서 실행해야 하는 마이그레이션은 TRANSACTIONAL = False
+        return getattr(self.module, "TRANSACTIONAL", True)
+
+    def apply(self, conn: Connection) -> None:
+        self.module.upgrade(conn)
+
+
+def _discover() -> List[tuple]:
+    """versions/ 의 (버전, 이름, 모듈명) 목록 (모듈은 import 하지 않음)"""
+    found = []
+    for module_info in pkgutil.iter_modules(versions.__path__):
+        match = _MODULE_NAME.match(module_info.name)
+        if match:
+            found.append((int(match.group(1)), match.group(2), module_info.name))
+    return sorted(found)
+
+
+def load_migrations() -> List[Migration]:
+    """versions/ 패키지의 마이그레이션을 버전 순으로 로드"""
+    migrations = [
+        Migration(version, name, importlib.import_module(f"{versions.__name__}.{module_name}"))
+        for version, name, module_name in _discover()
+    ]
+    seen = set()
+    for migration in migrations:
+        if migration.version in seen:
+            raise RuntimeError(f"마이그레이션 버전이 중복되었습니다: {migration.version:04d}")
+        seen.add(migration.version)
+    return migrations
+
+
+def applied_versions(conn: Connection) -> Set[int]:
+    if not inspect(conn).has_table(schema_migrations.name):
+        return set()
+    return set(conn.execute(select(schema_migrations.c.version)).scalars())
+
+
+def latest_version() -> int:
+    """코드에 포함된 가장 최근 마이그레이션 버전"""
+    return max((version for version, _, _ in _discover()), default=0)
+
+
+def current_version(engine: Engine) -> int:
+    """DB에 기록된 가장 최근 스키마 버전 (기록이 없으면 0)
+
+    테이블 존재 여부를 reflection 으로 확인하지 않고 바로 조회합니다 (서버 시작 시 비용 고정).
+    """
+    try:
+        with engine.connect() as conn:
+            return conn.execute(select(func.max(schema_migrations.c.version))).scalar() or 0
+    except (OperationalError, ProgrammingError):
+        return 0
+
+
+def check_schema(engine: Engine) -> int:
+    """DB 스키마가 최신 마이그레이션과 같은지 확인하고 현재 버전을 반환"""
+    current, latest = current_version(engine), latest_version()
+    if current < latest:
+        raise SchemaOutdatedError(
+            f"DB 스키마 버전 {current:04d} < 최신 {latest:04d}: "
+            f"'python -m app.migrations upgrade' 로 마이그레이션을 먼저 적용하세요."
+        )
+    if current > latest:
+        raise SchemaOutdatedError(f"DB 스키마 버전 {current:04d} 이 코드의 최신 버전 {latest:04d} 보다 높습니다.")
+    return current
+
+
+def upgrade(engine: Engine, target: Optional[int] = None) -> List[Migration]:
+    """아직 적용되지 않은 마이그레이션을 순서대로 적용하고 적용한 목록을 반환
+
+    마이그레이션마다 하나의 트랜잭션으로 실행하고 같은 트랜잭션 안에서 버전을 기록하므로,
+    중간에 실패하면 그 마이그레이션만 되돌려지고 다음 실행에서 다시 시도됩니다.
+    TRANSACTIONAL = False 인 마이그레이션은 autocommit 연결에서 실행되므로
+    각 단계가 다시 실행해도 안전해야 합니다 (operations.py 의 헬퍼는 모두 그렇게 동작).
+    """
+    with engine.begin() as conn:
+        schema_migrations.create(conn, checkfirst=True)
+        done = applied_versions(conn)
+
+    applied = []
+    for migration in load_migrations():
+        if migration.version in done:
+            continue
+        if target is not None and migration.version > target:
+            break
+        logger.info("마이그레이션 적용: %04d_%s", migration.version, migration.name)
+        if migration.transactional:
+            with engine.begin() as conn:
+                migration.apply(conn)
+                _stamp(conn, migration)
+        else:
+            with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                migration.apply(conn)
+                _stamp(conn, migration)
+        applied.append(migration)
+    return applied
+
+
+def _stamp(conn: Connection, migration: Migration) -> None:
+    conn.execute(insert(schema_migrations).values(version=migration.version, name=migration.name))
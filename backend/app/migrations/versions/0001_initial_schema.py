@@ -0,0 +1,188 @@
+# backend/app/migrations/versions/0001_initial_schema.py
+"""초기 스키마 (create_all 시절 모델을 그대로 고정)
+
+모델이 바뀌어도 이 파일은 수정하지 않습니다. 컬럼/인덱스 변경은 새 마이그레이션으로 추가합니다.
+이미 create_all 로 만든 DB 에서는 존재하는 테이블을 건너뛰므로 그대로 버전만 기록됩니다.
+"""
+from sqlalchemy import (
+    Boolean, Column, DateTime, Float, ForeignKey, Integer, MetaData, String, Table, Text
+)
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import func
+
+metadata = MetaData()
+
+Table(
+    "departments", metadata,
+    Column("department_id", Integer, primary_key=True, index=True),
+    Column("name", String(200), nullable=False),
+    Column("name_en", String(200)),
+    Column("college", String(200)),
+    Column("description", Text),
+    Column("building", String(100)),
+    Column("phone", String(50)),
+    Column("email", String(200)),
+    Column("created_at", DateTime(timezone=True), server_default=func.now())
+)
+
+Table(
+    "users", metadata,
+    Column("user_id", Integer, primary_key=True, index=True),
+    Column("email", String(255), index=True, unique=True, nullable=False),
+    Column("password_hash", String(255), nullable=False),
+    Column("name", String(100), nullable=False),
+    Column("major", String(100)),
+    Column("year", Integer),
+    Column("user_type", String(50)),
+    Column("profile_info", String),
+    Column("sejong_student_id", String(20)),
+    Column("created_at", DateTime(timezone=True), server_default=func.now())
+)
+
+Table(
+    "professors", metadata,
+    Column("professor_id", Integer, primary_key=True, index=True),
+    Column("department_id", Integer, ForeignKey("departments.department_id"), nullable=False),
+    Column("name", String(100), nullable=False),
+    Column("name_en", String(100)),
+    Column("position", String(50)),
+    Column("email", String(200)),
+    Column("phone", String(50)),
+    Column("office_location", String(200)),
+    Column("research_fields", Text),
+    Column("is_active", Boolean),
+    Column("created_at", DateTime(timezone=True), server_default=func.now())
+)
+
+Table(
+    "projects", metadata,
+    Column("project_id", Integer, primary_key=True, index=True),
+    Column("owner_id", Integer, ForeignKey("users.user_id"), nullable=False),
+    Column("name", String(200), nullable=False),
+    Column("description", Text, nullable=False),
+    Column("idea_name", String(200)),
+    Column("service_type", String(50), nullable=False),
+    Column("target_type", String(50), nullable=False),
+    Column("stage", String(50)),
+    Column("is_active", Boolean),
+    Column("is_public", Boolean),
+    Column("created_at", DateTime(timezone=True), server_default=func.now())
+)
+
+Table(
+    "resumes", metadata,
+    Column("resume_id", Integer, primary_key=True, index=True),
+    Column("user_id", Integer, ForeignKey("users.user_id"), unique=True, nullable=False),
+    Column("introduction", Text),
+    Column("tech_stack", Text),
+    Column("work_experience", Text),
+    Column("awards", Text),
+    Column("external_links", Text),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True), server_default=func.now())
+)
+
+Table(
+    "ai_reports", metadata,
+    Column("report_id", Integer, primary_key=True, index=True),
+    Column("project_id", Integer, ForeignKey("projects.project_id"), nullable=False),
+    Column("requester_id", Integer, ForeignKey("users.user_id"), nullable=False),
+    Column("report_type", String(50), nullable=False),
+    Column("idea_info", Text),
+    Column("existing_services", Text),
+    Column("service_limitations", Text),
+    Column("lean_canvas_detailed", Text),
+    Column("confidence_score", Float),
+    Column("data_sources", Text),
+    Column("generation_time_seconds", Integer),
+    Column("token_usage", Integer),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("is_latest", Boolean),
+    Column("user_feedback_rating", Integer),
+    Column("user_feedback_comment", Text),
+    Column("status", String(20)),
+    Column("error_message", Text)
+)
+
+Table(
+    "lean_canvas", metadata,
+    Column("canvas_id", Integer, primary_key=True, index=True),
+    Column("project_id", Integer, ForeignKey("projects.project_id"), nullable=False),
+    Column("problem", Text),
+    Column("customer_segments", Text),
+    Column("unique_value_proposition", Text),
+    Column("solution", Text),
+    Column("unfair_advantage", Text),
+    Column("revenue_streams", Text),
+    Column("cost_structure", Text),
+    Column("key_metrics", Text),
+    Column("channels", Text),
+    Column("canvas_version", Integer),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True), server_default=func.now())
+)
+
+Table(
+    "research_labs", metadata,
+    Column("lab_id", Integer, primary_key=True, index=True),
+    Column("director_id", Integer, ForeignKey("professors.professor_id"), nullable=False),
+    Column("name", String(200), nullable=False),
+    Column("name_en", String(200)),
+    Column("location", String(200)),
+    Column("phone", String(50)),
+    Column("email", String(200)),
+    Column("website", String(500)),
+    Column("research_areas", Text),
+    Column("keywords", Text),
+    Column("description", Text),
+    Column("tech_stack", Text),
+    Column("collaboration_history", Text),
+    Column("recent_projects", Text),
+    Column("is_active", Boolean),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True), server_default=func.now())
+)
+
+Table(
+    "team_openings", metadata,
+    Column("opening_id", Integer, primary_key=True, index=True),
+    Column("project_id", Integer, ForeignKey("projects.project_id"), nullable=False),
+    Column("role_name", String(100), nullable=False),
+    Column("description", Text, nullable=False),
+    Column("required_skills", Text),
+    Column("commitment_type", String(50)),
+    Column("status", String(50)),
+    Column("created_at", DateTime(timezone=True), server_default=func.now())
+)
+
+Table(
+    "project_lab_matchings", metadata,
+    Column("matching_id", Integer, primary_key=True, index=True),
+    Column("project_id", Integer, ForeignKey("projects.project_id"), nullable=False),
+    Column("lab_id", Integer, ForeignKey("research_labs.lab_id"), nullable=False),
+    Column("similarity_score", Float),
+    Column("matching_reason", Text),
+    Column("matching_factors", Text),
+    Column("status", String(50)),
+    Column("contacted_at", DateTime(timezone=True)),
+    Column("response_at", DateTime(timezone=True)),
+    Column("created_at", DateTime(timezone=True), server_default=func.now())
+)
+
+Table(
+    "team_applications", metadata,
+    Column("application_id", Integer, primary_key=True, index=True),
+    Column("opening_id", Integer, ForeignKey("team_openings.opening_id"), nullable=False),
+    Column("applicant_id", Integer, ForeignKey("users.user_id"), nullable=False),
+    Column("message", Text, nullable=False),
+    Column("portfolio_url", String(500)),
+    Column("expected_commitment", String(50)),
+    Column("available_hours", Integer),
+    Column("status", String(50)),
+    Column("applied_at", DateTime(timezone=True), server_default=func.now()),
+    Column("reviewed_at", DateTime(timezone=True))
+)
+
+
+def upgrade(conn: Connection) -> None:
+    metadata.create_all(conn, checkfirst=True)
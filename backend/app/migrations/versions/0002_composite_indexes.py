@@ -0,0 +1,32 @@
+# backend/app/migrations/versions/0002_composite_indexes.py
+"""자주 쓰는 조회 조건용 복합 인덱스
+
+query_plan_audit.py 에서 전체 스캔으로 나온 라우터 쿼리 기준입니다.
+모델의 __table_args__ 에도 같은 이름으로 선언되어 있습니다.
+"""
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+# (인덱스 이름, 테이블, 컬럼)
+INDEXES = [
+    # 내 프로젝트 목록 / 개인 대시보드
+    ("ix_projects_owner_active_created", "projects", "owner_id, is_active, created_at"),
+    # 공개 프로젝트 목록 / 플랫폼 통계
+    ("ix_projects_active_public_created", "projects", "is_active, is_public, created_at"),
+    # 모집 중 공고 목록 / 팀 매칭 통계
+    ("ix_team_openings_status_created", "team_openings", "status, created_at"),
+    ("ix_team_openings_project_id", "team_openings", "project_id"),
+    # 내 지원 현황
+    ("ix_team_applications_applicant_status", "team_applications", "applicant_id, status"),
+    ("ix_team_applications_opening_id", "team_applications", "opening_id"),
+    # 프로젝트별 최신 보고서
+    ("ix_ai_reports_project_status_created", "ai_reports", "project_id, status, created_at"),
+    # 프로젝트별 추천 연구실 (점수순)
+    ("ix_project_lab_matchings_project_score", "project_lab_matchings", "project_id, similarity_score"),
+    ("ix_lean_canvas_project_id", "lean_canvas", "project_id"),
+]
+
+
+def upgrade(conn: Connection) -> None:
+    for name, table, columns in INDEXES:
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"))
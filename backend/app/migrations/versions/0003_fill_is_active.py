@@ -0,0 +1,12 @@
+# backend/app/migrations/versions/0003_fill_is_active.py
+"""lab_data_parser.py 로 넣은 교수/연구실의 is_active NULL → 활성
+
+예전 fix_is_active.py 를 손으로 실행하던 작업입니다.
+"""
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+
+def upgrade(conn: Connection) -> None:
+    for table in ("research_labs", "professors"):
+        conn.execute(text(f"UPDATE {table} SET is_active = :active WHERE is_active IS NULL"), {"active": True})
@@ -0,0 +1,65 @@
+# backend/app/migrations/versions/0004_professor_emails.py
+"""크롤링 데이터에 빠진 교수/연구실 이메일 채우기
+
+예전 update_emails.py 를 손으로 실행하던 작업입니다. 이미 이메일이 있으면 덮어쓰지 않습니다.
+"""
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+# (교수 이름, 이메일)
+PROFESSOR_EMAILS = [
+    # 정보보호학과
+    ('이종혁', 'jonghyouk@sejong.ac.kr'),
+    ('신지선', 'jsshin@sejong.ac.kr'),
+    ('송재승', 'jssong@sejong.ac.kr'),
+    ('김영갑', 'alwaysgabi@sejong.ac.kr'),
+    ('윤주범', 'jbyun@sejong.ac.kr'),
+    ('이광수', 'kwangsu@sejong.ac.kr'),
+    ('박기웅', 'woongbak@sejong.ac.kr'),
+    ('김종현', 'jhk@sejong.ac.kr'),
+    ('Lewis Nkenyereye', 'nkenyele@sejong.ac.kr'),
+
+    # 콘텐츠소프트웨어학과
+    ('권순일', 'sikwon@sejong.ac.kr'),
+    ('백성욱', 'sbaik@sejong.ac.kr'),
+    ('이종원', 'jwlee@sejong.ac.kr'),
+    ('송오영', 'oysong@sejong.ac.kr'),
+    ('최준연', 'zoon@sejong.ac.kr'),
+    ('박상일', 'sipark@sejong.ac.kr'),
+    ('변재욱', 'jwbyun@sejong.ac.kr'),
+    ('이은상', 'eslee3209@sejong.ac.kr'),
+
+    # 인공지능데이터사이언스학과
+    ('유성준', 'sjyoo@sejong.ac.kr'),
+    ('최우석', 'wschoi@sejong.ac.kr'),
+
+    # AI로봇학과
+    ('김형석', 'hyungkim@sejong.ac.kr'),
+    ('송진우', 'jwsong@sejong.ac.kr'),
+    ('서재규', 'jksuhr@sejong.ac.kr'),
+    ('최유경', 'ykchoi@sejong.ac.kr'),
+    ('강병현', 'brianbkang@sejong.ac.kr'),
+]
+
+# (연구실 이름, 이메일)
+LAB_EMAILS = [
+    ('정보보호 연구실', 'jsshin@sejong.ac.kr'),
+    ('보안공학 연구실', 'alwaysgabi@sejong.ac.kr'),
+    ('지능형 미디어 연구실', 'sbaik@sejong.ac.kr'),
+    ('Mixed Reality & Interaction Lab', 'jwlee@sejong.ac.kr'),
+    ('Data Frameworks and Platforms Lab', 'jwbyun@sejong.ac.kr'),
+    ('프라이버시보호 AI 연구실', 'eslee3209@sejong.ac.kr'),
+    ('AI-빅데이터 연구센터', 'sjyoo@sejong.ac.kr'),
+    ('기후환경 데이터사이언스 연구실', 'wschoi@sejong.ac.kr'),
+    ('Intelligent Navigation and Control Systems Lab', 'jwsong@sejong.ac.kr'),
+    ('Intelligent Vehicle Perception Lab', 'jksuhr@sejong.ac.kr'),
+    ('Intelligent Robotics Lab', 'brianbkang@sejong.ac.kr'),
+]
+
+
+def upgrade(conn: Connection) -> None:
+    for table, updates in (("professors", PROFESSOR_EMAILS), ("research_labs", LAB_EMAILS)):
+        conn.execute(
+            text(f"UPDATE {table} SET email = :email WHERE name = :name AND email IS NULL"),
+            [{"name": name, "email": email} for name, email in updates]
+        )
@@ -0,0 +1,55 @@
+# backend/app/migrations/versions/0005_research_labs_fts.py
+"""연구실 전문 검색용 FTS5 색인 (SQLite 전용)
+
+research_labs 를 외부 콘텐츠로 쓰는 색인이라 본문은 중복 저장하지 않고,
+트리거로 연구실 추가/수정/삭제 시 색인을 함께 갱신합니다.
+trigram 토크나이저는 세 글자 이상 검색어를 어느 위치에서든 부분 문자열로 찾으므로
+붙여 쓴 한글 복합어 안쪽/뒤쪽 일치("음식AI" 에서 "AI")도 찾습니다.
+세 글자 미만 검색어는 저장소가 같은 색인에 LIKE 조건으로 찾습니다.
+"""
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+# 색인할 컬럼 (research_labs 컬럼명과 같아야 함)
+COLUMNS = "name, name_en, description, keywords, research_areas, tech_stack"
+
+STATEMENTS = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS research_labs_fts USING fts5(
+        {COLUMNS},
+        content='research_labs', content_rowid='lab_id',
+        tokenize='trigram'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS research_labs_fts_insert AFTER INSERT ON research_labs BEGIN
+        INSERT INTO research_labs_fts(rowid, {COLUMNS})
+        VALUES (new.lab_id, new.name, new.name_en, new.description, new.keywords, new.research_areas, new.tech_stack);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS research_labs_fts_delete AFTER DELETE ON research_labs BEGIN
+        INSERT INTO research_labs_fts(research_labs_fts, rowid, {COLUMNS})
+        VALUES ('delete', old.lab_id, old.name, old.name_en, old.description, old.keywords, old.research_areas, old.tech_stack);
+    END
+    """,
+    # 색인 컬럼이 바뀔 때만 다시 색인 (is_active 등 다른 컬럼 변경은 건너뜀)
+    f"""
+    CREATE TRIGGER IF NOT EXISTS research_labs_fts_update AFTER UPDATE OF {COLUMNS} ON research_labs BEGIN
+        INSERT INTO research_labs_fts(research_labs_fts, rowid, {COLUMNS})
+        VALUES ('delete', old.lab_id, old.name, old.name_en, old.description, old.keywords, old.research_areas, old.tech_stack);
+        INSERT INTO research_labs_fts(rowid, {COLUMNS})
+        VALUES (new.lab_id, new.name, new.name_en, new.description, new.keywords, new.research_areas, new.tech_stack);
+    END
+    """,
+    # 기존 연구실 색인
+    "INSERT INTO research_labs_fts(research_labs_fts) VALUES ('rebuild')",
+]
+
+
+def upgrade(conn: Connection) -> None:
+    # 다른 DB에서는 라우터가 ilike 검색을 그대로 사용
+    if conn.dialect.name != "sqlite":
+        return
+    for statement in STATEMENTS:
+        conn.execute(text(statement))
@@ -0,0 +1,78 @@
+# backend/app/migrations/versions/0006_team_opening_skills.py
+"""모집 공고 요구 기술 태그 테이블 + 기존 공고 태그 채우기
+
+태그는 기술 이름 그대로(소문자, 공백 정리)이며 같은 기술의 다른 표기만 합칩니다.
+표기 사전은 이 파일에 고정하며, app.services.skill_tags.SKILL_ALIASES 가 바뀌면
+새 마이그레이션으로 기존 태그를 다시 채웁니다.
+"""
+import re
+
+from sqlalchemy import Column, ForeignKey, Index, Integer, MetaData, String, Table, insert, select
+from sqlalchemy.engine import Connection
+
+SEPARATORS = re.compile(r"[,/;|·\n]+")
+SPACES = re.compile(r"\s+")
+MAX_TAG_LENGTH = 100
+
+ALIASES = {
+    "파이썬": "python",
+    "py": "python",
+    "js": "javascript",
+    "자바스크립트": "javascript",
+    "ts": "typescript",
+    "타입스크립트": "typescript",
+    "reactjs": "react",
+    "react.js": "react",
+    "리액트": "react",
+    "vue": "vue.js",
+    "vuejs": "vue.js",
+    "node": "node.js",
+    "nodejs": "node.js",
+    "golang": "go",
+    "k8s": "kubernetes",
+    "ml": "머신러닝",
+    "machine learning": "머신러닝",
+    "deep learning": "딥러닝",
+}
+
+metadata = MetaData()
+
+team_openings = Table(
+    "team_openings", metadata,
+    Column("opening_id", Integer, primary_key=True),
+    Column("required_skills", String)
+)
+
+team_opening_skills = Table(
+    "team_opening_skills", metadata,
+    Column("opening_id", Integer, ForeignKey("team_openings.opening_id", ondelete="CASCADE"), primary_key=True),
+    Column("skill", String(100), primary_key=True),
+    Index("ix_team_opening_skills_skill_opening", "skill", "opening_id")
+)
+
+
+def tags(skills: str) -> list:
+    result = []
+    for skill in SEPARATORS.split(skills):
+        tag = SPACES.sub(" ", skill).strip().lower()
+        if not tag:
+            continue
+        tag = ALIASES.get(tag, tag)[:MAX_TAG_LENGTH]
+        if tag not in result:
+            result.append(tag)
+    return result
+
+
+def upgrade(conn: Connection) -> None:
+    team_opening_skills.create(conn, checkfirst=True)
+
+    rows = [
+        {"opening_id": opening.opening_id, "skill": tag}
+        for opening in conn.execute(
+            select(team_openings.c.opening_id, team_openings.c.required_skills)
+            .where(team_openings.c.required_skills.isnot(None))
+        )
+        for tag in tags(opening.required_skills)
+    ]
+    if rows:
+        conn.execute(insert(team_opening_skills), rows)
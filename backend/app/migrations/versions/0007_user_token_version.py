@@ -0,0 +1,13 @@
+# backend/app/migrations/versions/0007_user_token_version.py
+"""users.token_version 추가 (발급한 토큰 무효화 + 인증 주체 캐시 키)
+
+server_default 가 있어 기존 행을 다시 쓰지 않고 바로 추가됩니다.
+"""
+from sqlalchemy import Column, Integer
+from sqlalchemy.engine import Connection
+
+from app.migrations.operations import add_column
+
+
+def upgrade(conn: Connection) -> None:
+    add_column(conn, "users", Column("token_version", Integer, nullable=False, server_default="0"))
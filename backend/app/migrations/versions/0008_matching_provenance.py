@@ -0,0 +1,34 @@
+# backend/app/migrations/versions/0008_matching_provenance.py
+"""저장된 매칭 결과의 계산 조건 기록
+
+- project_lab_matchings.match_fingerprint: 점수를 계산한 프로젝트 + 카탈로그 지문
+- project_matching_runs: 프로젝트별 마지막 전체 매칭의 지문과 상위 개수 / 최소 점수
+
+기존 행은 지문이 없으므로 추천 API 가 처음 한 번은 다시 계산합니다.
+"""
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, MetaData, String, Table, func
+from sqlalchemy.engine import Connection
+
+from app.migrations.operations import add_column
+
+metadata = MetaData()
+
+# 외래 키 대상 (생성하지 않음)
+projects = Table(
+    "projects", metadata,
+    Column("project_id", Integer, primary_key=True)
+)
+
+project_matching_runs = Table(
+    "project_matching_runs", metadata,
+    Column("project_id", Integer, ForeignKey("projects.project_id", ondelete="CASCADE"), primary_key=True),
+    Column("match_fingerprint", String(40), nullable=False),
+    Column("max_results", Integer, nullable=False),
+    Column("min_score", Float, nullable=False),
+    Column("matched_at", DateTime(timezone=True), server_default=func.now())
+)
+
+
+def upgrade(conn: Connection) -> None:
+    add_column(conn, "project_lab_matchings", Column("match_fingerprint", String(40)))
+    project_matching_runs.create(conn, checkfirst=True)
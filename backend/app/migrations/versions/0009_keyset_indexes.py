@@ -0,0 +1,23 @@
+# backend/app/migrations/versions/0009_keyset_indexes.py
+"""커서 페이지네이션 정렬 키용 인덱스
+
+목록이 (created_at, id) 순으로 정렬되는데 지원하는 인덱스가 없어 페이지마다
+전체 스캔 + 임시 B-tree 정렬을 했습니다. 인덱스 순서대로 읽으면 첫 페이지든
+깊은 페이지든 limit + 1 행만 읽습니다. 모델의 __table_args__ 에도 같은 이름으로 선언되어 있습니다.
+"""
+from sqlalchemy.engine import Connection
+
+from app.migrations.operations import create_index
+
+# (인덱스 이름, 테이블, 컬럼)
+INDEXES = [
+    # 연구실 목록 (활성 연구실, 최신순)
+    ("ix_research_labs_active_created_id", "research_labs", ["is_active", "created_at", "lab_id"]),
+    # 프로젝트별 보고서 목록 (상태 조건 없이 최신순)
+    ("ix_ai_reports_project_created_id", "ai_reports", ["project_id", "created_at", "report_id"]),
+]
+
+
+def upgrade(conn: Connection) -> None:
+    for name, table, columns in INDEXES:
+        create_index(conn, name, table, columns)
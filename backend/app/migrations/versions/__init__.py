@@ -0,0 +1 @@
+# backend/app/migrations/versions/__init__.py
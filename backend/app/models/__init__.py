@@ -3,10 +3,10 @@
 from .user import User
 from .project import Project
 from .lean_canvas import LeanCanvas
-from .team_matching import TeamOpening, TeamApplication
+from .team_matching import TeamOpening, TeamApplication, TeamOpeningSkill
 from .ai_report import AIReport
 from .resume import Resume
-from .research_lab import Department, Professor, ResearchLab, ProjectLabMatching  # 새로 추가
+from .research_lab import Department, Professor, ResearchLab, ProjectLabMatching, ProjectMatchingRun  # 새로 추가
 
 # __all__로 export할 모델들 정의
 __all__ = [
@@ -15,10 +15,12 @@ __all__ = [
     "LeanCanvas",
     "TeamOpening",
     "TeamApplication",
+    "TeamOpeningSkill",
     "AIReport",
     "Resume",
     "Department",      # 새로 추가
     "Professor",       # 새로 추가
     "ResearchLab",     # 새로 추가
-    "ProjectLabMatching"  # 새로 추가
+    "ProjectLabMatching",  # 새로 추가
+    "ProjectMatchingRun"
 ]
\ No newline at end of file
@@ -1,21 +1,27 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Float, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Float, Boolean, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
+from app.models.types import JSONText
 
 class AIReport(Base):
     __tablename__ = "ai_reports"
+    __table_args__ = (
+        Index("ix_ai_reports_project_status_created", "project_id", "status", "created_at"),
+        # 프로젝트별 보고서 목록 커서 (created_at, report_id)
+        Index("ix_ai_reports_project_created_id", "project_id", "created_at", "report_id"),
+    )
     
     report_id = Column(Integer, primary_key=True, index=True)
     project_id = Column(Integer, ForeignKey("projects.project_id"), nullable=False)
     requester_id = Column(Integer, ForeignKey("users.user_id"), nullable=False)
     report_type = Column(String(50), nullable=False)  # LEAN_CANVAS, MARKET_ANALYSIS, IDEA_VALIDATION
     
-    # SQLite에서는 JSON을 TEXT로 저장
-    idea_info = Column(Text)  # JSON 문자열로 저장
-    existing_services = Column(Text)  # JSON 문자열로 저장
-    service_limitations = Column(Text)  # JSON 문자열로 저장
-    lean_canvas_detailed = Column(Text)  # JSON 문자열로 저장
+    # SQLite에서는 JSON을 TEXT로 저장 (읽을 때 dict로 디코딩)
+    idea_info = Column(JSONText)
+    existing_services = Column(JSONText)
+    service_limitations = Column(JSONText)
+    lean_canvas_detailed = Column(JSONText)
     
     # 메타데이터
     confidence_score = Column(Float)  # AI 분석 신뢰도 (0.0-1.0)
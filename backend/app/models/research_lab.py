@@ -1,8 +1,9 @@
 # backend/app/models/research_lab.py
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Float, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Float, Boolean, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
+from app.models.types import JSONText
 
 class Department(Base):
     """학과 정보"""
@@ -50,6 +51,10 @@ class Professor(Base):
 class ResearchLab(Base):
     """연구실 정보"""
     __tablename__ = "research_labs"
+    __table_args__ = (
+        # 활성 연구실 목록 커서 (created_at, lab_id)
+        Index("ix_research_labs_active_created_id", "is_active", "created_at", "lab_id"),
+    )
     
     lab_id = Column(Integer, primary_key=True, index=True)
     director_id = Column(Integer, ForeignKey("professors.professor_id"), nullable=False)
@@ -61,14 +66,14 @@ class ResearchLab(Base):
     website = Column(String(500))
     
     # 연구 분야 및 키워드
-    research_areas = Column(Text)  # JSON 형태로 저장
+    research_areas = Column(JSONText)  # JSON 배열
     keywords = Column(Text)  # 검색용 키워드들
     description = Column(Text)  # 연구실 소개
     
     # 매칭을 위한 메타데이터
-    tech_stack = Column(Text)  # 사용 기술스택 (JSON)
-    collaboration_history = Column(Text)  # 협력 이력 (JSON)
-    recent_projects = Column(Text)  # 최근 프로젝트 (JSON)
+    tech_stack = Column(JSONText)  # 사용 기술스택 (JSON 배열)
+    collaboration_history = Column(JSONText)  # 협력 이력 (JSON)
+    recent_projects = Column(JSONText)  # 최근 프로젝트 (JSON)
     
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -83,6 +88,9 @@ class ResearchLab(Base):
 class ProjectLabMatching(Base):
     """프로젝트-연구실 매칭 결과"""
     __tablename__ = "project_lab_matchings"
+    __table_args__ = (
+        Index("ix_project_lab_matchings_project_score", "project_id", "similarity_score"),
+    )
     
     matching_id = Column(Integer, primary_key=True, index=True)
     project_id = Column(Integer, ForeignKey("projects.project_id"), nullable=False)
@@ -91,7 +99,9 @@ class ProjectLabMatching(Base):
     # 매칭 점수 및 근거
     similarity_score = Column(Float)  # 0.0 ~ 1.0
     matching_reason = Column(Text)  # 매칭 근거 설명
-    matching_factors = Column(Text)  # 매칭 요소들 (JSON)
+    matching_factors = Column(JSONText)  # 매칭 요소들 (JSON)
+    # 점수를 계산한 프로젝트 + 카탈로그 지문 (lab_index.matching_fingerprint)
+    match_fingerprint = Column(String(40))
     
     # 상태 관리
     status = Column(String(50), default="SUGGESTED")  # SUGGESTED, CONTACTED, INTERESTED, DECLINED
@@ -105,4 +115,17 @@ class ProjectLabMatching(Base):
     lab = relationship("ResearchLab")
     
     def __repr__(self):
-        return f"<ProjectLabMatching(project_id={self.project_id}, lab_id={self.lab_id}, score={self.similarity_score})>"
\ No newline at end of file
+        return f"<ProjectLabMatching(project_id={self.project_id}, lab_id={self.lab_id}, score={self.similarity_score})>"
+
+class ProjectMatchingRun(Base):
+    """프로젝트별 마지막 전체 매칭 실행 조건 (저장된 매칭 결과를 추천에 그대로 써도 되는지 판단)"""
+    __tablename__ = "project_matching_runs"
+    
+    project_id = Column(Integer, ForeignKey("projects.project_id", ondelete="CASCADE"), primary_key=True)
+    match_fingerprint = Column(String(40), nullable=False)
+    max_results = Column(Integer, nullable=False)  # 저장한 상위 개수
+    min_score = Column(Float, nullable=False)  # 저장한 최소 점수
+    matched_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    def __repr__(self):
+        return f"<ProjectMatchingRun(project_id={self.project_id}, max_results={self.max_results}, min_score={self.min_score})>"
\ No newline at end of file
@@ -1,8 +1,9 @@
 # backend/app/models/resume.py
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, JSON
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
+from app.models.types import JSONText
 
 class Resume(Base):
     __tablename__ = "resumes"
@@ -12,10 +13,10 @@ class Resume(Base):
     
     # 기본 정보는 User 테이블에서 가져옴
     introduction = Column(Text)  # 자기소개서
-    tech_stack = Column(Text)  # 기술 스택 (JSON 문자열로 저장)
-    work_experience = Column(Text)  # 업무 경력 (JSON 문자열로 저장)
-    awards = Column(Text)  # 수상 이력 (JSON 문자열로 저장)
-    external_links = Column(Text)  # 외부 링크 (JSON 문자열로 저장)
+    tech_stack = Column(JSONText)  # 기술 스택 (JSON 배열)
+    work_experience = Column(JSONText)  # 업무 경력 (JSON 배열)
+    awards = Column(JSONText)  # 수상 이력 (JSON 배열)
+    external_links = Column(JSONText)  # 외부 링크 (JSON 배열)
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Boolean, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
 
 class TeamOpening(Base):
     __tablename__ = "team_openings"
+    __table_args__ = (
+        Index("ix_team_openings_status_created", "status", "created_at"),
+        Index("ix_team_openings_project_id", "project_id")
+    )
     
     opening_id = Column(Integer, primary_key=True, index=True)
     project_id = Column(Integer, ForeignKey("projects.project_id"), nullable=False)
@@ -21,8 +25,26 @@ class TeamOpening(Base):
     def __repr__(self):
         return f"<TeamOpening(opening_id={self.opening_id}, role_name={self.role_name})>"
 
+class TeamOpeningSkill(Base):
+    """모집 공고의 요구 기술 태그 (required_skills를 정규화, 동의어는 대표 태그로)"""
+    __tablename__ = "team_opening_skills"
+    __table_args__ = (
+        # 기술별 공고 검색 (인덱스만으로 opening_id까지 조회)
+        Index("ix_team_opening_skills_skill_opening", "skill", "opening_id"),
+    )
+    
+    opening_id = Column(Integer, ForeignKey("team_openings.opening_id", ondelete="CASCADE"), primary_key=True)
+    skill = Column(String(100), primary_key=True)
+    
+    def __repr__(self):
+        return f"<TeamOpeningSkill(opening_id={self.opening_id}, skill={self.skill})>"
+
 class TeamApplication(Base):
     __tablename__ = "team_applications"
+    __table_args__ = (
+        Index("ix_team_applications_applicant_status", "applicant_id", "status"),
+        Index("ix_team_applications_opening_id", "opening_id")
+    )
     
     application_id = Column(Integer, primary_key=True, index=True)
     opening_id = Column(Integer, ForeignKey("team_openings.opening_id"), nullable=False)
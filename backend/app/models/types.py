@@ -0,0 +1,88 @@
+# backend/app/models/types.py
+import json
+from typing import Any
+
+from sqlalchemy import Boolean, Text, func
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import TypeDecorator
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 모듈로 대체
+    orjson = None
+
+
+def dumps_json(value: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def loads_json(text: str) -> Any:
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+
+class json_array_like(FunctionElement):
+    """JSON 배열 원소 중 하나라도 패턴과 일치 (대소문자 무시)
+
+    SQLite에서는 JSON1 json_each로 원소 단위로 비교하고, 다른 DB에서는 저장된 텍스트 전체에 LIKE를 적용합니다.
+    """
+    type = Boolean()
+    name = "json_array_like"
+    inherit_cache = True
+
+
+@compiles(json_array_like)
+def _compile_json_array_like(element, compiler, **kw):
+    column, pattern = (compiler.process(clause, **kw) for clause in element.clauses)
+    return f"lower({column}) LIKE lower({pattern})"
+
+
+@compiles(json_array_like, "sqlite")
+def _compile_json_array_like_sqlite(element, compiler, **kw):
+    column, pattern = (compiler.process(clause, **kw) for clause in element.clauses)
+    # 예전 데이터 중 JSON이 아닌 값이 있으면 json_each가 오류를 내므로 빈 배열로 취급
+    return (
+        f"EXISTS (SELECT 1 FROM json_each(CASE WHEN json_valid({column}) THEN {column} ELSE '[]' END) "
+        f"WHERE json_each.value LIKE {pattern})"
+    )
+
+
+class JSONText(TypeDecorator):
+    """JSON을 TEXT 컬럼에 저장하는 타입 (SQLite 호환)
+
+    행을 읽을 때 한 번만 디코딩되어 인스턴스에 객체로 남으므로 라우터에서 다시 json.loads 하지 않습니다.
+    값을 바꿀 때는 객체를 새로 대입해야 변경이 감지됩니다 (내부 수정은 추적하지 않음).
+    JSON이 아닌 예전 값은 문자열 그대로 반환합니다.
+    """
+    impl = Text
+    cache_ok = True
+
+    class Comparator(TypeDecorator.Comparator):
+        def extract(self, path: str):
+            """JSON 경로 값 (SQLite JSON1 / MySQL json_extract), 예: ResearchLab.tech_stack.extract('$[0]')"""
+            return func.json_extract(self.expr, path)
+
+        def any_like(self, pattern: str):
+            """배열 원소 중 하나라도 LIKE 패턴과 일치하는 행"""
+            return json_array_like(self.expr, pattern)
+
+    comparator_factory = Comparator
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return dumps_json(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None or value == "":
+            return None
+        try:
+            return loads_json(value)
+        except ValueError:
+            return value
+
+    def coerce_compared_value(self, op, value):
+        # like/ilike 등 텍스트 비교는 저장된 JSON 텍스트에 그대로 적용
+        return self.impl_instance
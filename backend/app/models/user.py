@@ -14,6 +14,8 @@ class User(Base):
     user_type = Column(String(50))  # DREAMER, BUILDER, SPECIALIST
     profile_info = Column(String)
     sejong_student_id = Column(String(20))
+    # 올리면 이전에 발급한 토큰이 모두 무효화됨 (토큰 "ver" 클레임과 비교)
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     def __repr__(self):
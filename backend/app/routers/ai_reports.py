@@ -1,17 +1,18 @@
 # backend/app/routers/ai_reports.py (AI 서버 필드명에 맞춘 매핑)
 
 import requests
-import json
 import time
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Query
 from sqlalchemy.orm import Session
+from typing import Optional
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models.ai_report import AIReport
 from app.models.project import Project
 from app.schemas.ai_report import AIReportRequest, AIReportResponse, AIReportStatus, AIReportFeedback
-from app.schemas.common import SuccessResponse
+from app.schemas.common import CursorPaginatedResponse, SuccessResponse
 from app.auth import get_current_user
+from app.utils.pagination import MAX_PAGE_SIZE, Keyset
 
 # AI 서버 HTTP 설정
 AI_SERVICE_HOST = "172.16.50.121"
@@ -157,10 +158,10 @@ def generate_report_background(report_id: int, ai_request_data: dict, db: Sessio
             idea_info = ai_request_data
 
         # DB 업데이트
-        report.idea_info = json.dumps(idea_info, ensure_ascii=False)
-        report.existing_services = json.dumps(existing_services, ensure_ascii=False)
-        report.service_limitations = json.dumps(service_limitations, ensure_ascii=False)
-        report.lean_canvas_detailed = json.dumps(lean_canvas, ensure_ascii=False)
+        report.idea_info = idea_info
+        report.existing_services = existing_services
+        report.service_limitations = service_limitations
+        report.lean_canvas_detailed = lean_canvas
 
         # 메타데이터 업데이트
         end_time = time.time()
@@ -349,7 +350,7 @@ async def create_ai_report_direct_input(
 @router.get("/my-projects", response_model=SuccessResponse)
 async def get_my_projects_for_report(
     current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     AI 보고서 생성을 위한 내 프로젝트 목록 조회
@@ -486,7 +487,7 @@ async def test_project_mapping():
 
 # 1. 보고서 상태 확인
 @router.get("/{report_id}/status", response_model=AIReportStatus)
-async def get_report_status(report_id: int, db: Session = Depends(get_db)):
+async def get_report_status(report_id: int, db: Session = Depends(get_read_db)):
     """
     AI 보고서의 현재 생성 상태를 확인합니다.
     
@@ -518,7 +519,7 @@ async def get_report_status(report_id: int, db: Session = Depends(get_db)):
 
 # 2. 완성된 보고서 상세 조회
 @router.get("/{report_id}", response_model=SuccessResponse)
-async def get_ai_report(report_id: int, db: Session = Depends(get_db)):
+async def get_ai_report(report_id: int, db: Session = Depends(get_read_db)):
     """
     완성된 AI 분석 보고서의 상세 내용을 조회합니다.
     
@@ -548,14 +549,13 @@ async def get_ai_report(report_id: int, db: Session = Depends(get_db)):
     if report.status != "COMPLETED":
         raise HTTPException(status_code=400, detail=f"보고서가 아직 생성 중이거나 실패했습니다. (상태: {report.status})")
 
-    # DB에 저장된 JSON 문자열을 Python 딕셔너리로 변환
-    try:
-        idea_info_data = json.loads(report.idea_info) if report.idea_info else {}
-        existing_services_data = json.loads(report.existing_services) if report.existing_services else {}
-        service_limitations_data = json.loads(report.service_limitations) if report.service_limitations else {}
-        lean_canvas_detailed_data = json.loads(report.lean_canvas_detailed) if report.lean_canvas_detailed else {}
-    except json.JSONDecodeError:
+    # JSON 컬럼은 로드 시 이미 딕셔너리로 디코딩됨 (JSON이 아닌 예전 값은 문자열로 남음)
+    json_fields = (report.idea_info, report.existing_services, report.service_limitations, report.lean_canvas_detailed)
+    if any(value is not None and not isinstance(value, dict) for value in json_fields):
         raise HTTPException(status_code=500, detail="보고서 데이터 형식이 올바르지 않습니다.")
+    idea_info_data, existing_services_data, service_limitations_data, lean_canvas_detailed_data = (
+        value or {} for value in json_fields
+    )
 
     response_payload = AIReportResponse(
         report_id=report.report_id,
@@ -576,15 +576,24 @@ async def get_ai_report(report_id: int, db: Session = Depends(get_db)):
         user_feedback_comment=report.user_feedback_comment
     )
 
-    return SuccessResponse(message="보고서 조회가 완료되었습니다.", data=response_payload.model_dump())
+    # 이미 검증된 모델이므로 SuccessResponse 로 다시 검증하지 않고 바로 인코딩
+    return SuccessResponse(message="보고서 조회가 완료되었습니다.", data=response_payload).as_response()
 
 # 3. 프로젝트별 보고서 목록 조회
-@router.get("/project/{project_id}", response_model=SuccessResponse)
-async def get_reports_for_project(project_id: int, db: Session = Depends(get_db)):
+# 프로젝트 보고서 목록 커서 (최신순)
+REPORTS_KEYSET = Keyset((AIReport.created_at, True), (AIReport.report_id, True))
+
+@router.get("/project/{project_id}", response_model=CursorPaginatedResponse)
+async def get_reports_for_project(
+    project_id: int,
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    db: Session = Depends(get_read_db)
+):
     """
-    특정 프로젝트에 속한 모든 AI 보고서 목록을 조회합니다.
+    특정 프로젝트에 속한 AI 보고서 목록을 최신순으로 조회합니다.
     
-    사용법: GET /ai-reports/project/4
+    사용법: GET /ai-reports/project/4?limit=20 (다음 페이지는 &cursor=<next_cursor>)
     응답:
     {
         "success": true,
@@ -598,13 +607,17 @@ async def get_reports_for_project(project_id: int, db: Session = Depends(get_db)
                 "confidence_score": 0.85,
                 "user_feedback_rating": null
             }
-        ]
+        ],
+        "next_cursor": "...",
+        "has_more": true
     }
     """
-    reports = db.query(AIReport).filter(AIReport.project_id == project_id).order_by(AIReport.created_at.desc()).all()
+    query = db.query(AIReport).filter(AIReport.project_id == project_id)
+    rows, next_cursor = REPORTS_KEYSET.split(REPORTS_KEYSET.page(query, cursor, limit).all(), limit)
+    reports = [row.AIReport for row in rows]
     
     if not reports:
-        return SuccessResponse(message="해당 프로젝트에 대한 보고서가 없습니다.", data=[])
+        return CursorPaginatedResponse(message="해당 프로젝트에 대한 보고서가 없습니다.", data=[])
 
     reports_data = [
         {
@@ -617,4 +630,9 @@ async def get_reports_for_project(project_id: int, db: Session = Depends(get_db)
         } for r in reports
     ]
     
-    return SuccessResponse(message="프로젝트의 보고서 목록입니다.", data=reports_data)
\ No newline at end of file
+    return CursorPaginatedResponse(
+        message="프로젝트의 보고서 목록입니다.",
+        data=reports_data,
+        next_cursor=next_cursor,
+        has_more=next_cursor is not None
+    )
\ No newline at end of file
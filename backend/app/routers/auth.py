@@ -4,7 +4,8 @@ from app.database import get_db
 from app.models.user import User
 from app.schemas.user import UserRegister, UserLogin, TokenResponse, UserCreateResponse
 from app.schemas.common import SuccessResponse, ErrorResponse
-from app.auth import get_password_hash, verify_password, create_access_token, get_current_user
+from app.auth import hash_password, verify_and_update_password, create_access_token, get_current_user, user_principal
+from app.services.principal_cache import principal_cache
 
 router = APIRouter()
 
@@ -25,7 +26,7 @@ async def register(user_data: UserRegister, db: Session = Depends(get_db)):
         print("[DEBUG] 이메일 중복 확인 완료")
         
         # 비밀번호 해싱
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await hash_password(user_data.password)
         print("[DEBUG] 비밀번호 해싱 완료")
         
         # 새 사용자 생성
@@ -49,7 +50,7 @@ async def register(user_data: UserRegister, db: Session = Depends(get_db)):
         print(f"[DEBUG] 새 사용자 ID: {new_user.user_id}")
         
         # JWT 토큰 생성
-        access_token = create_access_token(data={"sub": str(new_user.user_id)})
+        access_token = create_access_token(data={"sub": str(new_user.user_id), "ver": new_user.token_version})
         print("[DEBUG] 토큰 생성 완료")
         
         return SuccessResponse(
@@ -87,27 +88,23 @@ async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
             )
         
         # 비밀번호 확인
-        if not verify_password(user_credentials.password, user.password_hash):
+        valid, new_hash = await verify_and_update_password(user_credentials.password, user.password_hash)
+        if not valid:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="이메일 또는 비밀번호가 올바르지 않습니다."
             )
         
+        # BCRYPT_ROUNDS 가 바뀌었으면 새 cost 로 다시 저장
+        if new_hash:
+            user.password_hash = new_hash
+            db.commit()
+        
         # JWT 토큰 생성
-        access_token = create_access_token(data={"sub": str(user.user_id)})
+        access_token = create_access_token(data={"sub": str(user.user_id), "ver": user.token_version})
         
         # 사용자 정보 응답 (비밀번호 제외)
-        user_response = {
-            "user_id": user.user_id,
-            "email": user.email,
-            "name": user.name,
-            "major": user.major,
-            "year": user.year,
-            "user_type": user.user_type,
-            "profile_info": user.profile_info,
-            "sejong_student_id": user.sejong_student_id,
-            "created_at": user.created_at
-        }
+        user_response = user_principal(user)
         
         return SuccessResponse(
             message="로그인에 성공했습니다.",
@@ -134,6 +131,37 @@ async def verify_token(current_user: dict = Depends(get_current_user)):
         data={"user_id": current_user["user_id"]}
     )
 
+@router.post("/logout-all", response_model=SuccessResponse)
+async def logout_all(current_user: dict = Depends(get_current_user), db: Session = Depends(get_db)):
+    """모든 기기에서 로그아웃 (token_version 을 올려 이전에 발급한 토큰을 모두 무효화)"""
+    try:
+        updated = db.query(User).filter(User.user_id == current_user["user_id"]).update(
+            {User.token_version: User.token_version + 1}, synchronize_session=False
+        )
+        
+        if not updated:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="사용자를 찾을 수 없습니다."
+            )
+        
+        db.commit()
+        principal_cache.invalidate_user(current_user["user_id"])
+        
+        return SuccessResponse(
+            message="모든 기기에서 로그아웃되었습니다.",
+            data={"user_id": current_user["user_id"]}
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="로그아웃 중 오류가 발생했습니다."
+        )
+
 @router.get("/test")
 async def test_auth():
     """인증 라우터 테스트"""
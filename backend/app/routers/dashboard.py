@@ -1,11 +1,12 @@
 # backend/app/routers/dashboard.py
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
+from sqlalchemy import func, and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from datetime import datetime, timedelta
 from typing import Dict, List
 
-from app.database import get_db
+from app.database import get_async_read_db
 from app.models.user import User
 from app.models.project import Project
 from app.models.team_matching import TeamOpening, TeamApplication
@@ -18,7 +19,7 @@ router = APIRouter(tags=["Dashboard"])
 
 @router.get("/personal", response_model=SuccessResponse)
 async def get_personal_dashboard(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: dict = Depends(get_current_user)
 ):
     """개인 대시보드 통계"""
@@ -26,61 +27,61 @@ async def get_personal_dashboard(
         user_id = current_user["user_id"]
         
         # 프로젝트 통계
-        total_projects = db.query(Project).filter(
+        total_projects = await db.scalar(select(func.count()).select_from(Project).where(
             Project.owner_id == user_id, 
             Project.is_active == True
-        ).count()
+        ))
         
-        active_projects = db.query(Project).filter(
+        active_projects = await db.scalar(select(func.count()).select_from(Project).where(
             Project.owner_id == user_id,
             Project.is_active == True
-        ).count()
+        ))
         
-        public_projects = db.query(Project).filter(
+        public_projects = await db.scalar(select(func.count()).select_from(Project).where(
             Project.owner_id == user_id,
             Project.is_active == True,
             Project.is_public == True
-        ).count()
+        ))
         
         private_projects = total_projects - public_projects
         
         # 프로젝트 단계별 분포
-        stage_counts = db.query(
+        stage_counts = (await db.execute(select(
             Project.stage, 
             func.count(Project.project_id)
-        ).filter(
+        ).where(
             Project.owner_id == user_id,
             Project.is_active == True
-        ).group_by(Project.stage).all()
+        ).group_by(Project.stage))).all()
         
         projects_by_stage = {stage: count for stage, count in stage_counts}
         
         # 팀 매칭 통계
-        team_openings_created = db.query(TeamOpening).join(Project).filter(
+        team_openings_created = await db.scalar(select(func.count()).select_from(TeamOpening).join(Project).where(
             Project.owner_id == user_id
-        ).count()
+        ))
         
-        applications_received = db.query(TeamApplication).join(
+        applications_received = await db.scalar(select(func.count()).select_from(TeamApplication).join(
             TeamOpening
-        ).join(Project).filter(
+        ).join(Project).where(
             Project.owner_id == user_id
-        ).count()
+        ))
         
-        applications_sent = db.query(TeamApplication).filter(
+        applications_sent = await db.scalar(select(func.count()).select_from(TeamApplication).where(
             TeamApplication.applicant_id == user_id
-        ).count()
+        ))
         
-        accepted_applications = db.query(TeamApplication).filter(
+        accepted_applications = await db.scalar(select(func.count()).select_from(TeamApplication).where(
             TeamApplication.applicant_id == user_id,
             TeamApplication.status == "ACCEPTED"
-        ).count()
+        ))
         
         # 최근 활동
         # 최근 프로젝트 (내가 만든 것)
-        recent_projects = db.query(Project).filter(
+        recent_projects = (await db.scalars(select(Project).where(
             Project.owner_id == user_id,
             Project.is_active == True
-        ).order_by(Project.created_at.desc()).limit(5).all()
+        ).order_by(Project.created_at.desc()).limit(5))).all()
         
         recent_projects_data = [
             {
@@ -93,9 +94,11 @@ async def get_personal_dashboard(
         ]
         
         # 최근 팀 모집 공고 (내 프로젝트의)
-        recent_openings = db.query(TeamOpening).join(Project).filter(
+        recent_openings = (await db.scalars(select(TeamOpening).join(Project).options(
+            selectinload(TeamOpening.project)
+        ).where(
             Project.owner_id == user_id
-        ).order_by(TeamOpening.created_at.desc()).limit(5).all()
+        ).order_by(TeamOpening.created_at.desc()).limit(5))).all()
         
         recent_openings_data = [
             {
@@ -108,9 +111,11 @@ async def get_personal_dashboard(
         ]
         
         # 최근 지원 현황 (내가 지원한 것)
-        recent_applications = db.query(TeamApplication).filter(
+        recent_applications = (await db.scalars(select(TeamApplication).options(
+            selectinload(TeamApplication.opening).selectinload(TeamOpening.project)
+        ).where(
             TeamApplication.applicant_id == user_id
-        ).order_by(TeamApplication.applied_at.desc()).limit(5).all()
+        ).order_by(TeamApplication.applied_at.desc()).limit(5))).all()
         
         recent_applications_data = [
             {
@@ -157,80 +162,80 @@ async def get_personal_dashboard(
         )
 
 @router.get("/platform", response_model=SuccessResponse)
-async def get_platform_statistics(db: Session = Depends(get_db)):
+async def get_platform_statistics(db: AsyncSession = Depends(get_async_read_db)):
     """전체 플랫폼 통계 (공개 정보)"""
     try:
         # 기본 통계
-        total_users = db.query(User).count()
-        total_projects = db.query(Project).filter(Project.is_active == True).count()
-        total_public_projects = db.query(Project).filter(
+        total_users = await db.scalar(select(func.count()).select_from(User))
+        total_projects = await db.scalar(select(func.count()).select_from(Project).where(Project.is_active == True))
+        total_public_projects = await db.scalar(select(func.count()).select_from(Project).where(
             Project.is_active == True,
             Project.is_public == True
-        ).count()
+        ))
         
         # 최근 30일 통계
         thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-        recent_users_count = db.query(User).filter(
+        recent_users_count = await db.scalar(select(func.count()).select_from(User).where(
             User.created_at >= thirty_days_ago
-        ).count()
+        ))
         
-        recent_projects_count = db.query(Project).filter(
+        recent_projects_count = await db.scalar(select(func.count()).select_from(Project).where(
             Project.created_at >= thirty_days_ago,
             Project.is_active == True
-        ).count()
+        ))
         
         # 프로젝트 서비스 타입별 분포
-        service_type_counts = db.query(
+        service_type_counts = (await db.execute(select(
             Project.service_type,
             func.count(Project.project_id)
-        ).filter(
+        ).where(
             Project.is_active == True,
             Project.is_public == True
-        ).group_by(Project.service_type).all()
+        ).group_by(Project.service_type))).all()
         
         projects_by_service_type = {service_type: count for service_type, count in service_type_counts}
         
         # 프로젝트 타겟 타입별 분포
-        target_type_counts = db.query(
+        target_type_counts = (await db.execute(select(
             Project.target_type,
             func.count(Project.project_id)
-        ).filter(
+        ).where(
             Project.is_active == True,
             Project.is_public == True
-        ).group_by(Project.target_type).all()
+        ).group_by(Project.target_type))).all()
         
         projects_by_target_type = {target_type: count for target_type, count in target_type_counts}
         
         # 프로젝트 단계별 분포
-        stage_counts = db.query(
+        stage_counts = (await db.execute(select(
             Project.stage,
             func.count(Project.project_id)
-        ).filter(
+        ).where(
             Project.is_active == True,
             Project.is_public == True
-        ).group_by(Project.stage).all()
+        ).group_by(Project.stage))).all()
         
         projects_by_stage = {stage: count for stage, count in stage_counts}
         
         # 사용자 타입별 분포
-        user_type_counts = db.query(
+        user_type_counts = (await db.execute(select(
             User.user_type,
             func.count(User.user_id)
-        ).filter(
+        ).where(
             User.user_type.isnot(None)
-        ).group_by(User.user_type).all()
+        ).group_by(User.user_type))).all()
         
         users_by_type = {user_type or "UNDEFINED": count for user_type, count in user_type_counts}
         
         # 전공별 분포 (상위 10개)
-        major_counts = db.query(
+        major_counts = (await db.execute(select(
             User.major,
             func.count(User.user_id)
-        ).filter(
+        ).where(
             User.major.isnot(None)
         ).group_by(User.major).order_by(
             func.count(User.user_id).desc()
-        ).limit(10).all()
+        ).limit(10))).all()
         
         users_by_major = {major or "기타": count for major, count in major_counts}
         
@@ -259,13 +264,13 @@ async def get_platform_statistics(db: Session = Depends(get_db)):
         )
 
 @router.get("/trending", response_model=SuccessResponse)
-async def get_trending_data(db: Session = Depends(get_db)):
+async def get_trending_data(db: AsyncSession = Depends(get_async_read_db)):
     """인기/트렌딩 데이터"""
     try:
         # 최근 7일간 가장 많이 조회된 프로젝트 (실제로는 지원이 많이 들어온 프로젝트로 대체)
         seven_days_ago = datetime.utcnow() - timedelta(days=7)
         
-        trending_projects = db.query(
+        trending_projects = (await db.execute(select(
             Project.project_id,
             Project.name,
             Project.service_type,
@@ -275,7 +280,7 @@ async def get_trending_data(db: Session = Depends(get_db)):
             TeamOpening, Project.project_id == TeamOpening.project_id
         ).join(
             TeamApplication, TeamOpening.opening_id == TeamApplication.opening_id
-        ).filter(
+        ).where(
             Project.is_active == True,
             Project.is_public == True,
             TeamApplication.applied_at >= seven_days_ago
@@ -283,7 +288,7 @@ async def get_trending_data(db: Session = Depends(get_db)):
             Project.project_id
         ).order_by(
             func.count(TeamApplication.application_id).desc()
-        ).limit(10).all()
+        ).limit(10))).all()
         
         trending_projects_data = [
             {
@@ -296,7 +301,7 @@ async def get_trending_data(db: Session = Depends(get_db)):
         ]
         
         # 최근 활발한 모집 공고
-        active_openings = db.query(
+        active_openings = (await db.execute(select(
             TeamOpening.opening_id,
             TeamOpening.role_name,
             Project.name.label('project_name'),
@@ -305,7 +310,7 @@ async def get_trending_data(db: Session = Depends(get_db)):
             Project, TeamOpening.project_id == Project.project_id
         ).outerjoin(
             TeamApplication, TeamOpening.opening_id == TeamApplication.opening_id
-        ).filter(
+        ).where(
             TeamOpening.status == "OPEN",
             Project.is_active == True,
             Project.is_public == True
@@ -313,7 +318,7 @@ async def get_trending_data(db: Session = Depends(get_db)):
             TeamOpening.opening_id
         ).order_by(
             func.count(TeamApplication.application_id).desc()
-        ).limit(10).all()
+        ).limit(10))).all()
         
         active_openings_data = [
             {
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models.lean_canvas import LeanCanvas
 from app.models.project import Project
 from app.schemas.lean_canvas import LeanCanvasUpdate, LeanCanvasResponse
@@ -14,7 +14,7 @@ router = APIRouter(tags=["lean-canvas"])
 @router.get("/project/{project_id}", response_model=SuccessResponse)
 async def get_lean_canvas(
     project_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: dict = Depends(get_current_user)
 ):
     """
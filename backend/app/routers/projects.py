@@ -1,12 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from typing import Optional
-from app.database import get_db
+from app.database import get_async_db, get_async_read_db
 from app.models.project import Project
 from app.models.user import User
 from app.schemas.project import ProjectCreate, ProjectResponse, ProjectUpdate, ProjectPrivacyUpdate  # ProjectPrivacyUpdate 추가
-from app.schemas.common import SuccessResponse
+from app.schemas.common import CursorPaginatedResponse, SuccessResponse
 from app.auth import get_current_user
+from app.utils.pagination import MAX_PAGE_SIZE, Keyset
 
 router = APIRouter()
 
@@ -14,7 +17,7 @@ router = APIRouter()
 async def create_project(
     project_data: ProjectCreate, 
     current_user: dict = Depends(get_current_user), 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """프로젝트 생성"""
     try:
@@ -30,8 +33,8 @@ async def create_project(
         )
         
         db.add(new_project)
-        db.commit()
-        db.refresh(new_project)
+        await db.commit()
+        await db.refresh(new_project)
         
         project_response = {
             "project_id": new_project.project_id,
@@ -53,7 +56,7 @@ async def create_project(
         )
         
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"프로젝트 생성 중 오류: {str(e)}"
@@ -62,14 +65,16 @@ async def create_project(
 @router.get("/", response_model=SuccessResponse)
 async def get_my_projects(
     current_user: dict = Depends(get_current_user), 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """내 프로젝트 목록"""
     try:
-        projects = db.query(Project).filter(
-            Project.owner_id == current_user["user_id"],
-            Project.is_active == True
-        ).order_by(Project.created_at.desc()).all()
+        projects = (await db.scalars(
+            select(Project).where(
+                Project.owner_id == current_user["user_id"],
+                Project.is_active == True
+            ).order_by(Project.created_at.desc())
+        )).all()
         
         projects_data = []
         for project in projects:
@@ -98,33 +103,40 @@ async def get_my_projects(
             detail=f"조회 중 오류: {str(e)}"
         )
 
-@router.get("/public", response_model=SuccessResponse)
+# 최신순 (created_at, project_id) 커서 페이지네이션
+PUBLIC_PROJECTS_KEYSET = Keyset((Project.created_at, True), (Project.project_id, True))
+
+@router.get("/public", response_model=CursorPaginatedResponse)
 async def get_public_projects(
     service_type: Optional[str] = Query(None),
     target_type: Optional[str] = Query(None),
     stage: Optional[str] = Query(None),
-    limit: int = Query(20),
-    db: Session = Depends(get_db)
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
-    """공개 프로젝트 목록 조회"""
+    """공개 프로젝트 목록 조회 (최신순, 커서 기반 페이지)"""
     try:
-        query = db.query(Project).filter(
+        # 소유자 정보는 selectinload로 한 번에 조회
+        query = select(Project).options(selectinload(Project.owner)).where(
             Project.is_active == True,
             Project.is_public == True  # 공개 프로젝트만 필터
         )
         
         if service_type:
-            query = query.filter(Project.service_type == service_type)
+            query = query.where(Project.service_type == service_type)
         if target_type:
-            query = query.filter(Project.target_type == target_type)
+            query = query.where(Project.target_type == target_type)
         if stage:
-            query = query.filter(Project.stage == stage)
+            query = query.where(Project.stage == stage)
         
-        projects = query.order_by(Project.created_at.desc()).limit(limit).all()
+        rows = (await db.execute(PUBLIC_PROJECTS_KEYSET.page(query, cursor, limit))).all()
+        rows, next_cursor = PUBLIC_PROJECTS_KEYSET.split(rows, limit)
         
         projects_data = []
-        for project in projects:
-            owner = db.query(User).filter(User.user_id == project.owner_id).first()
+        for row in rows:
+            project = row.Project
+            owner = project.owner
             
             project_dict = {
                 "project_id": project.project_id,
@@ -139,11 +151,15 @@ async def get_public_projects(
             }
             projects_data.append(project_dict)
         
-        return SuccessResponse(
+        return CursorPaginatedResponse(
             message="공개 프로젝트 목록을 성공적으로 조회했습니다.",
-            data=projects_data
+            data=projects_data,
+            next_cursor=next_cursor,
+            has_more=next_cursor is not None
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -151,13 +167,15 @@ async def get_public_projects(
         )
 
 @router.get("/{project_id}", response_model=SuccessResponse)
-async def get_project_detail(project_id: int, db: Session = Depends(get_db)):
+async def get_project_detail(project_id: int, db: AsyncSession = Depends(get_async_read_db)):
     """프로젝트 상세 조회"""
     try:
-        project = db.query(Project).filter(
-            Project.project_id == project_id,
-            Project.is_active == True
-        ).first()
+        project = await db.scalar(
+            select(Project).where(
+                Project.project_id == project_id,
+                Project.is_active == True
+            )
+        )
         
         if not project:
             raise HTTPException(
@@ -165,7 +183,7 @@ async def get_project_detail(project_id: int, db: Session = Depends(get_db)):
                 detail="프로젝트를 찾을 수 없습니다."
             )
         
-        owner = db.query(User).filter(User.user_id == project.owner_id).first()
+        owner = await db.get(User, project.owner_id)
         
         project_data = {
             "project_id": project.project_id,
@@ -203,14 +221,16 @@ async def update_project(
     project_id: int,
     project_update: ProjectUpdate,
     current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """프로젝트 정보 수정"""
     try:
-        project = db.query(Project).filter(
-            Project.project_id == project_id,
-            Project.is_active == True
-        ).first()
+        project = await db.scalar(
+            select(Project).where(
+                Project.project_id == project_id,
+                Project.is_active == True
+            )
+        )
         
         if not project:
             raise HTTPException(
@@ -238,8 +258,8 @@ async def update_project(
                 )
             project.stage = project_update.stage
         
-        db.commit()
-        db.refresh(project)
+        await db.commit()
+        await db.refresh(project)
         
         project_data = {
             "project_id": project.project_id,
@@ -262,7 +282,7 @@ async def update_project(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"프로젝트 수정 중 오류: {str(e)}"
@@ -272,14 +292,16 @@ async def update_project(
 async def delete_project(
     project_id: int,
     current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """프로젝트 삭제 (비활성화)"""
     try:
-        project = db.query(Project).filter(
-            Project.project_id == project_id,
-            Project.is_active == True
-        ).first()
+        project = await db.scalar(
+            select(Project).where(
+                Project.project_id == project_id,
+                Project.is_active == True
+            )
+        )
         
         if not project:
             raise HTTPException(
@@ -294,7 +316,7 @@ async def delete_project(
             )
         
         project.is_active = False
-        db.commit()
+        await db.commit()
         
         return SuccessResponse(
             message="프로젝트가 성공적으로 삭제되었습니다.",
@@ -304,7 +326,7 @@ async def delete_project(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"프로젝트 삭제 중 오류: {str(e)}"
@@ -319,14 +341,16 @@ async def update_project(
     project_id: int,
     project_update: ProjectUpdate,
     current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """프로젝트 정보 수정"""
     try:
-        project = db.query(Project).filter(
-            Project.project_id == project_id,
-            Project.is_active == True
-        ).first()
+        project = await db.scalar(
+            select(Project).where(
+                Project.project_id == project_id,
+                Project.is_active == True
+            )
+        )
         
         if not project:
             raise HTTPException(
@@ -356,8 +380,8 @@ async def update_project(
                 )
             project.stage = project_update.stage
         
-        db.commit()
-        db.refresh(project)
+        await db.commit()
+        await db.refresh(project)
         
         project_data = {
             "project_id": project.project_id,
@@ -381,7 +405,7 @@ async def update_project(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"프로젝트 수정 중 오류: {str(e)}"
@@ -392,14 +416,16 @@ async def update_project_privacy(
     project_id: int,
     privacy_update: ProjectPrivacyUpdate,
     current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """프로젝트 공개/비공개 설정 변경"""
     try:
-        project = db.query(Project).filter(
-            Project.project_id == project_id,
-            Project.is_active == True
-        ).first()
+        project = await db.scalar(
+            select(Project).where(
+                Project.project_id == project_id,
+                Project.is_active == True
+            )
+        )
         
         if not project:
             raise HTTPException(
@@ -414,7 +440,7 @@ async def update_project_privacy(
             )
         
         project.is_public = privacy_update.is_public
-        db.commit()
+        await db.commit()
         
         status_text = "공개" if privacy_update.is_public else "비공개"
         
@@ -426,7 +452,7 @@ async def update_project_privacy(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"프로젝트 설정 변경 중 오류: {str(e)}"
@@ -1,37 +1,48 @@
 # backend/app/routers/research_labs.py (수정된 버전 2)
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, text  # text 추가
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
+from sqlalchemy import and_, or_, func, select, text  # text 추가
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-import json
 
-from app.database import get_db
+from app.database import get_async_db, get_async_read_db, run_in_session
 from app.models.research_lab import ResearchLab, Professor, Department, ProjectLabMatching
 from app.models.project import Project
 from app.schemas.research_lab import (
     ResearchLabResponse, LabSearchRequest, ProjectMatchingRequest, 
-    ProjectMatchingResponse, LabMatchingStatusUpdate, ProjectLabMatchingResponse
+    ProjectMatchingResponse, LabMatchingStatusUpdate, ProjectLabMatchingResponse,
+    BatchMatchingRequest
 )
-from app.schemas.common import SuccessResponse
+from app.schemas.common import CursorPaginatedResponse, SuccessResponse
 from app.auth import get_current_user
+from app.services.batch_matching import run_batch_matching_job
+from app.services.lab_index import lab_feature_index, matching_fingerprint
 from app.services.lab_matching import LabMatchingService
+from app.services.lab_repository import LabRepository
+from app.services.recommendation_cache import project_fingerprint, recommendation_cache
+from app.utils.pagination import MAX_PAGE_SIZE, Keyset
+from app.utils.responses import RawJSON, dumps_bytes, encode_object
 
 router = APIRouter(tags=["Research Labs"])
 
 @router.get("/departments")
-async def get_departments(db: Session = Depends(get_db)):
+async def get_departments(db: AsyncSession = Depends(get_async_read_db)):
     """학과 목록 조회"""
     try:
-        departments = db.query(Department).all()
+        # 학과별 연구실 수를 한 번의 집계 쿼리로 계산
+        departments = (await db.execute(select(
+            Department,
+            func.count(ResearchLab.lab_id)
+        ).outerjoin(
+            Professor, Professor.department_id == Department.department_id
+        ).outerjoin(
+            ResearchLab, and_(
+                ResearchLab.director_id == Professor.professor_id,
+                ResearchLab.is_active == True  # None이 아닌 True로 명시적 비교
+            )
+        ).group_by(Department.department_id))).all()
         
         dept_data = []
-        for dept in departments:
-            # 각 학과의 연구실 수 계산 (수정된 쿼리)
-            lab_count = db.query(ResearchLab).join(Professor, ResearchLab.director_id == Professor.professor_id).filter(
-                Professor.department_id == dept.department_id,
-                ResearchLab.is_active == True  # None이 아닌 True로 명시적 비교
-            ).count()
-            
+        for dept, lab_count in departments:
             dept_dict = {
                 "department_id": dept.department_id,
                 "name": dept.name,
@@ -57,50 +68,50 @@ async def get_departments(db: Session = Depends(get_db)):
         )
 
 @router.get("/statistics")
-async def get_lab_statistics(db: Session = Depends(get_db)):
+async def get_lab_statistics(db: AsyncSession = Depends(get_async_read_db)):
     """연구실 관련 통계"""
     try:
         # 기본 통계
-        total_labs = db.query(ResearchLab).filter(ResearchLab.is_active == True).count()
-        total_departments = db.query(Department).count()
-        total_professors = db.query(Professor).filter(Professor.is_active == True).count()
+        total_labs = await db.scalar(select(func.count()).select_from(ResearchLab).where(ResearchLab.is_active == True))
+        total_departments = await db.scalar(select(func.count()).select_from(Department))
+        total_professors = await db.scalar(select(func.count()).select_from(Professor).where(Professor.is_active == True))
         
         # 학과별 연구실 수 (text() 사용)
-        dept_stats = db.execute(text("""
+        dept_stats = (await db.execute(text("""
             SELECT d.name, COUNT(rl.lab_id) as lab_count
             FROM departments d
             LEFT JOIN professors p ON d.department_id = p.department_id
             LEFT JOIN research_labs rl ON p.professor_id = rl.director_id AND rl.is_active = 1
             GROUP BY d.department_id, d.name
             ORDER BY lab_count DESC
-        """)).fetchall()
+        """))).fetchall()
         
         dept_distribution = {row[0]: row[1] for row in dept_stats}
         
         # 최근 매칭 활동 (더 간단한 방법)
         from datetime import datetime, timedelta
         thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-        recent_matchings = db.query(ProjectLabMatching).filter(
+        recent_matchings = await db.scalar(select(func.count()).select_from(ProjectLabMatching).where(
             ProjectLabMatching.created_at >= thirty_days_ago
-        ).count()
+        ))
         
         # 매칭 상태별 분포 (text() 사용)
-        status_stats = db.execute(text("""
+        status_stats = (await db.execute(text("""
             SELECT status, COUNT(*) as count
             FROM project_lab_matchings
             GROUP BY status
-        """)).fetchall()
+        """))).fetchall()
         
         status_distribution = {row[0]: row[1] for row in status_stats}
         
         # 연구 분야별 분포 (추가)
-        research_areas_stats = db.execute(text("""
+        research_areas_stats = (await db.execute(text("""
             SELECT keywords, COUNT(*) as count
             FROM research_labs
             WHERE is_active = 1 AND keywords IS NOT NULL
             GROUP BY keywords
             LIMIT 10
-        """)).fetchall()
+        """))).fetchall()
         
         # 키워드 추출 및 집계
         keyword_counts = {}
@@ -142,13 +153,13 @@ async def get_lab_statistics(db: Session = Depends(get_db)):
 @router.post("/match-project", response_model=SuccessResponse)
 async def find_matching_labs_for_project(
     request: ProjectMatchingRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user)
 ):
     """프로젝트에 적합한 연구실 매칭"""
     try:
         # 프로젝트 소유권 확인
-        project = db.query(Project).filter(Project.project_id == request.project_id).first()
+        project = await db.get(Project, request.project_id)
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -161,12 +172,8 @@ async def find_matching_labs_for_project(
                 detail="프로젝트 소유자만 연구실 매칭을 요청할 수 있습니다."
             )
         
-        # 매칭 서비스 실행
-        matching_service = LabMatchingService(db)
-        matches = matching_service.find_matching_labs(request)
-        
-        # 매칭 결과 저장
-        matching_service.save_matching_results(request.project_id, matches)
+        # 매칭 서비스 실행 + 결과 저장 (전체 카탈로그 점수 계산은 스레드풀에서)
+        matches = await run_in_session(lambda session: LabMatchingService(session).match_and_save(request))
         
         # 응답 구성
         response_data = {
@@ -190,17 +197,65 @@ async def find_matching_labs_for_project(
             detail=f"연구실 매칭 중 오류: {str(e)}"
         )
 
+@router.post("/batch-match", response_model=SuccessResponse)
+async def batch_match_projects(
+    request: BatchMatchingRequest,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """내 프로젝트 전체(또는 일부)의 연구실 매칭을 백그라운드에서 일괄 계산"""
+    try:
+        query = select(Project.project_id).where(
+            Project.owner_id == current_user["user_id"],
+            Project.is_active == True
+        )
+        if request.project_ids:
+            query = query.where(Project.project_id.in_(request.project_ids))
+        project_ids = list((await db.scalars(query)).all())
+        
+        if not project_ids:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="매칭할 프로젝트를 찾을 수 없습니다."
+            )
+        
+        background_tasks.add_task(
+            run_batch_matching_job,
+            project_ids=project_ids,
+            owner_id=current_user["user_id"],
+            max_results=request.max_results,
+            min_score=request.min_score
+        )
+        
+        return SuccessResponse(
+            message=f"{len(project_ids)}개 프로젝트의 연구실 매칭을 시작했습니다.",
+            data={
+                "project_ids": project_ids,
+                "max_results": request.max_results,
+                "min_score": request.min_score
+            }
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"일괄 매칭 요청 중 오류: {str(e)}"
+        )
+
 @router.get("/recommendations/{project_id}", response_model=SuccessResponse)
 async def get_recommended_labs(
     project_id: int,
     limit: int = Query(5, ge=1, le=10),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: dict = Depends(get_current_user)
 ):
     """프로젝트에 추천하는 연구실 (간단한 추천)"""
     try:
         # 프로젝트 조회 및 권한 확인
-        project = db.query(Project).filter(Project.project_id == project_id).first()
+        project = await db.get(Project, project_id)
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -213,39 +268,79 @@ async def get_recommended_labs(
                 detail="프로젝트 소유자만 추천을 받을 수 있습니다."
             )
         
-        # 기본 매칭 요청 생성
-        matching_request = ProjectMatchingRequest(
-            project_id=project_id,
-            max_results=limit,
-            min_score=0.2  # 낮은 임계값으로 더 많은 결과 포함
-        )
-        
-        # 매칭 서비스 실행
-        matching_service = LabMatchingService(db)
-        recommendations = matching_service.find_matching_labs(matching_request)
-        
-        # 추천 이유 간소화
-        simplified_recommendations = []
-        for rec in recommendations:
-            simplified = {
-                "lab_id": rec["lab_id"],
-                "lab_name": rec["lab_name"],
-                "director_name": rec["director_name"],
-                "department_name": rec["department_name"],
-                "similarity_score": rec["similarity_score"],
-                "research_areas": json.loads(rec["research_areas"]) if rec["research_areas"] else [],
-                "recommendation_reason": f"유사도 {rec['similarity_score']:.1%} - 연구분야 및 기술스택 매칭",
-                "contact_info": rec["contact_info"]
-            }
-            simplified_recommendations.append(simplified)
+        # 프로젝트 지문 + 카탈로그 버전이 같으면 캐시된 추천 사용
+        catalog = await run_in_session(lab_feature_index.refresh, read_only=True)
+        cache_key = recommendation_cache.make_key(project, catalog.version, 0.2, limit)
+        cached = recommendation_cache.get(cache_key)
+        
+        if cached is None:
+            # 현재 프로젝트/카탈로그로 미리 계산해 둔 매칭 결과가 있으면 그대로 사용
+            fingerprint = matching_fingerprint(project_fingerprint(project), catalog)
+            stored = await run_in_session(
+                lambda session: LabRepository(session).get_stored_recommendations(
+                    project_id, limit, min_score=0.2, fingerprint=fingerprint
+                ),
+                read_only=True
+            )
+            
+            simplified_recommendations = []
+            if stored is not None:
+                for rec in stored:
+                    has_director = rec.director_id is not None
+                    simplified = {
+                        "lab_id": rec.lab_id,
+                        "lab_name": rec.lab_name,
+                        "director_name": rec.director_name,
+                        "department_name": rec.department_name,
+                        "similarity_score": rec.similarity_score,
+                        "research_areas": rec.research_areas or [],
+                        "recommendation_reason": f"유사도 {rec.similarity_score:.1%} - 연구분야 및 기술스택 매칭",
+                        "contact_info": {
+                            "email": rec.director_email if has_director else rec.email,
+                            "phone": rec.director_phone if has_director else rec.phone
+                        }
+                    }
+                    simplified_recommendations.append(simplified)
+            else:
+                # 기본 매칭 요청 생성
+                matching_request = ProjectMatchingRequest(
+                    project_id=project_id,
+                    max_results=limit,
+                    min_score=0.2  # 낮은 임계값으로 더 많은 결과 포함
+                )
+                
+                # 매칭 서비스 실행 (점수 계산/색인 생성은 스레드풀에서)
+                recommendations = await run_in_session(
+                    lambda session: LabMatchingService(session).find_matching_labs(matching_request, catalog),
+                    read_only=True
+                )
+                
+                # 추천 이유 간소화
+                for rec in recommendations:
+                    simplified = {
+                        "lab_id": rec["lab_id"],
+                        "lab_name": rec["lab_name"],
+                        "director_name": rec["director_name"],
+                        "department_name": rec["department_name"],
+                        "similarity_score": rec["similarity_score"],
+                        "research_areas": rec["research_areas"] or [],
+                        "recommendation_reason": f"유사도 {rec['similarity_score']:.1%} - 연구분야 및 기술스택 매칭",
+                        "contact_info": rec["contact_info"]
+                    }
+                    simplified_recommendations.append(simplified)
+            
+            # 직렬화한 결과를 캐시해 적중 시에는 다시 인코딩하지 않음
+            cached = (len(simplified_recommendations), RawJSON(dumps_bytes(simplified_recommendations)))
+            recommendation_cache.put(cache_key, cached, size=len(cached[1]))
         
+        count, recommendations_json = cached
         return SuccessResponse(
-            message=f"{len(simplified_recommendations)}개의 추천 연구실을 찾았습니다.",
-            data={
+            message=f"{count}개의 추천 연구실을 찾았습니다.",
+            data=encode_object({
                 "project_name": project.name,
-                "recommendations": simplified_recommendations
-            }
-        )
+                "recommendations": recommendations_json
+            })
+        ).as_response()
         
     except HTTPException:
         raise
@@ -258,13 +353,13 @@ async def get_recommended_labs(
 @router.get("/project/{project_id}/matches", response_model=SuccessResponse)
 async def get_project_matching_history(
     project_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: dict = Depends(get_current_user)
 ):
     """프로젝트의 연구실 매칭 이력 조회"""
     try:
         # 프로젝트 소유권 확인
-        project = db.query(Project).filter(Project.project_id == project_id).first()
+        project = await db.get(Project, project_id)
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -278,8 +373,10 @@ async def get_project_matching_history(
             )
         
         # 매칭 이력 조회
-        matching_service = LabMatchingService(db)
-        history = matching_service.get_project_matching_history(project_id)
+        history = await run_in_session(
+            lambda session: LabMatchingService(session).get_project_matching_history(project_id),
+            read_only=True
+        )
         
         return SuccessResponse(
             message="매칭 이력을 성공적으로 조회했습니다.",
@@ -302,15 +399,13 @@ async def get_project_matching_history(
 async def update_matching_status(
     matching_id: int,
     status_update: LabMatchingStatusUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user)
 ):
     """매칭 상태 업데이트 (연락함, 관심있음, 거절됨 등)"""
     try:
         # 매칭 레코드 조회
-        matching = db.query(ProjectLabMatching).filter(
-            ProjectLabMatching.matching_id == matching_id
-        ).first()
+        matching = await db.get(ProjectLabMatching, matching_id)
         
         if not matching:
             raise HTTPException(
@@ -319,7 +414,7 @@ async def update_matching_status(
             )
         
         # 프로젝트 소유권 확인
-        project = db.query(Project).filter(Project.project_id == matching.project_id).first()
+        project = await db.get(Project, matching.project_id)
         if project.owner_id != current_user["user_id"]:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -346,7 +441,7 @@ async def update_matching_status(
             current_reason = matching.matching_reason or ""
             matching.matching_reason = f"{current_reason}\n\n사용자 메모: {status_update.notes}"
         
-        db.commit()
+        await db.commit()
         
         return SuccessResponse(
             message="매칭 상태가 성공적으로 업데이트되었습니다.",
@@ -360,61 +455,74 @@ async def update_matching_status(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"매칭 상태 업데이트 중 오류: {str(e)}"
         )
 
-@router.get("/", response_model=SuccessResponse)
+# 목록은 최신순, 검색은 관련도순 커서 페이지네이션 (마지막 키는 lab_id)
+LABS_KEYSET = Keyset((ResearchLab.created_at, True), (ResearchLab.lab_id, True))
+LAB_SEARCH_KEYSET = Keyset((LabRepository.FTS_RANK, False), (ResearchLab.lab_id, False))
+
+@router.get("/", response_model=CursorPaginatedResponse)
 async def get_research_labs(
     department: Optional[str] = Query(None, description="학과명으로 필터"),
     research_area: Optional[str] = Query(None, description="연구분야로 검색"),
     keyword: Optional[str] = Query(None, description="키워드로 검색"),
-    limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db)
+    tech: Optional[str] = Query(None, description="기술 스택으로 필터"),
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor")
 ):
-    """연구실 목록 조회 및 검색"""
+    """연구실 목록 조회 및 검색 (커서 기반 페이지)"""
     try:
-        query = db.query(ResearchLab).filter(ResearchLab.is_active == True)
-        
-        # 학과별 필터링
-        if department:
-            query = query.join(Professor, ResearchLab.director_id == Professor.professor_id).join(
-                Department, Professor.department_id == Department.department_id
-            ).filter(
-                Department.name.ilike(f"%{department}%")
-            )
-        
-        # 연구분야로 검색
-        if research_area:
-            query = query.filter(
-                or_(
-                    ResearchLab.research_areas.ilike(f"%{research_area}%"),
-                    ResearchLab.keywords.ilike(f"%{research_area}%")
-                )
-            )
-        
-        # 키워드로 검색
-        if keyword:
-            query = query.filter(
-                or_(
-                    ResearchLab.name.ilike(f"%{keyword}%"),
-                    ResearchLab.description.ilike(f"%{keyword}%"),
-                    ResearchLab.keywords.ilike(f"%{keyword}%")
-                )
-            )
+        # 연구실 + 교수 + 학과를 한 번에 조회 (Query 기반 저장소는 스레드풀의 동기 세션으로)
+        def search_labs(session):
+            repository = LabRepository(session)
+            
+            # 키워드/연구분야 검색은 FTS5 색인으로 (세 글자 이상 단어가 있으면 관련도순 정렬)
+            search = repository.full_text_match(keyword=keyword, research_area=research_area)
+            if search:
+                query = repository.search_labs_query(search)
+                keyset = LAB_SEARCH_KEYSET if search.match else LABS_KEYSET
+            else:
+                query = repository.active_labs_query()
+                keyset = LABS_KEYSET
+                
+                # 연구분야로 검색 (연구분야는 JSON 배열 원소 단위로 비교)
+                if research_area:
+                    query = query.filter(
+                        or_(
+                            ResearchLab.research_areas.any_like(f"%{research_area}%"),
+                            ResearchLab.keywords.ilike(f"%{research_area}%")
+                        )
+                    )
+                
+                # 키워드로 검색
+                if keyword:
+                    query = query.filter(
+                        or_(
+                            ResearchLab.name.ilike(f"%{keyword}%"),
+                            ResearchLab.description.ilike(f"%{keyword}%"),
+                            ResearchLab.keywords.ilike(f"%{keyword}%")
+                        )
+                    )
+            
+            # 학과별 필터링
+            if department:
+                query = query.filter(Department.name.ilike(f"%{department}%"))
+            
+            # 기술 스택으로 필터링
+            if tech:
+                query = query.filter(ResearchLab.tech_stack.any_like(f"%{tech}%"))
+            
+            return keyset.split(keyset.page(query, cursor, limit).all(), limit)
         
-        labs = query.limit(limit).all()
+        labs, next_cursor = await run_in_session(search_labs, read_only=True)
         
         # 응답 데이터 구성
         labs_data = []
         for lab in labs:
-            professor = db.query(Professor).filter(Professor.professor_id == lab.director_id).first()
-            department_info = None
-            if professor:
-                department_info = db.query(Department).filter(Department.department_id == professor.department_id).first()
-            
             lab_dict = {
                 "lab_id": lab.lab_id,
                 "name": lab.name,
@@ -423,22 +531,27 @@ async def get_research_labs(
                 "phone": lab.phone,
                 "email": lab.email,
                 "website": lab.website,
-                "research_areas": json.loads(lab.research_areas) if lab.research_areas else [],
+                "research_areas": lab.research_areas or [],
                 "keywords": lab.keywords,
                 "description": lab.description,
-                "tech_stack": json.loads(lab.tech_stack) if lab.tech_stack else [],
-                "director_name": professor.name if professor else None,
-                "department_name": department_info.name if department_info else None,
+                "tech_stack": lab.tech_stack or [],
+                "snippet": getattr(lab, "snippet", None),  # 검색어 일치 부분 (<mark> 강조)
+                "director_name": lab.director_name,
+                "department_name": lab.department_name,
                 "created_at": lab.created_at.isoformat() if lab.created_at else None,
                 "updated_at": lab.updated_at.isoformat() if lab.updated_at else None
             }
             labs_data.append(lab_dict)
         
-        return SuccessResponse(
+        return CursorPaginatedResponse(
             message=f"{len(labs_data)}개의 연구실을 찾았습니다.",
-            data=labs_data
-        )
+            data=labs_data,
+            next_cursor=next_cursor,
+            has_more=next_cursor is not None
+        ).as_response()
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -446,13 +559,11 @@ async def get_research_labs(
         )
 
 @router.get("/{lab_id}", response_model=SuccessResponse)
-async def get_research_lab_detail(lab_id: int, db: Session = Depends(get_db)):
+async def get_research_lab_detail(lab_id: int):
     """연구실 상세 정보 조회"""
     try:
-        lab = db.query(ResearchLab).filter(
-            ResearchLab.lab_id == lab_id,
-            ResearchLab.is_active == True
-        ).first()
+        # 연구실 + 교수 + 학과를 한 번에 조회
+        lab = await run_in_session(lambda session: LabRepository(session).get_lab_detail(lab_id), read_only=True)
         
         if not lab:
             raise HTTPException(
@@ -460,12 +571,6 @@ async def get_research_lab_detail(lab_id: int, db: Session = Depends(get_db)):
                 detail="연구실을 찾을 수 없습니다."
             )
         
-        # 교수 및 학과 정보 조회
-        professor = db.query(Professor).filter(Professor.professor_id == lab.director_id).first()
-        department = None
-        if professor:
-            department = db.query(Department).filter(Department.department_id == professor.department_id).first()
-        
         # 상세 정보 구성
         lab_detail = {
             "lab_id": lab.lab_id,
@@ -475,25 +580,25 @@ async def get_research_lab_detail(lab_id: int, db: Session = Depends(get_db)):
             "phone": lab.phone,
             "email": lab.email,
             "website": lab.website,
-            "research_areas": json.loads(lab.research_areas) if lab.research_areas else [],
+            "research_areas": lab.research_areas or [],
             "keywords": lab.keywords,
             "description": lab.description,
-            "tech_stack": json.loads(lab.tech_stack) if lab.tech_stack else [],
-            "collaboration_history": json.loads(lab.collaboration_history) if lab.collaboration_history else [],
-            "recent_projects": json.loads(lab.recent_projects) if lab.recent_projects else [],
+            "tech_stack": lab.tech_stack or [],
+            "collaboration_history": lab.collaboration_history or [],
+            "recent_projects": lab.recent_projects or [],
             "director": {
-                "name": professor.name if professor else None,
-                "position": professor.position if professor else None,
-                "email": professor.email if professor else None,
-                "office_location": professor.office_location if professor else None,
-                "research_fields": professor.research_fields if professor else None
-            } if professor else None,
+                "name": lab.director_name,
+                "position": lab.director_position,
+                "email": lab.director_email,
+                "office_location": lab.director_office_location,
+                "research_fields": lab.director_research_fields
+            } if lab.director_id is not None else None,
             "department": {
-                "name": department.name if department else None,
-                "name_en": department.name_en if department else None,
-                "college": department.college if department else None,
-                "building": department.building if department else None
-            } if department else None,
+                "name": lab.department_name,
+                "name_en": lab.department_name_en,
+                "college": lab.department_college,
+                "building": lab.department_building
+            } if lab.department_id is not None else None,
             "created_at": lab.created_at,
             "updated_at": lab.updated_at
         }
@@ -1,10 +1,9 @@
 # backend/app/routers/resumes.py
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-import json
 from typing import List
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models.resume import Resume
 from app.models.user import User
 from app.schemas.resume import ResumeCreateUpdate, ResumeResponse, ResumePublicResponse
@@ -24,28 +23,28 @@ async def create_or_update_resume(
         # 기존 이력서 조회
         resume = db.query(Resume).filter(Resume.user_id == current_user["user_id"]).first()
         
-        # JSON 직렬화
-        tech_stack_json = json.dumps([item.model_dump() for item in resume_data.tech_stack], ensure_ascii=False)
-        work_experience_json = json.dumps([item.model_dump() for item in resume_data.work_experience], ensure_ascii=False)
-        awards_json = json.dumps([item.model_dump() for item in resume_data.awards], ensure_ascii=False)
-        external_links_json = json.dumps([item.model_dump() for item in resume_data.external_links], ensure_ascii=False)
+        # JSON 컬럼에는 객체를 그대로 대입 (저장 시 직렬화)
+        tech_stack = [item.model_dump() for item in resume_data.tech_stack]
+        work_experience = [item.model_dump() for item in resume_data.work_experience]
+        awards = [item.model_dump() for item in resume_data.awards]
+        external_links = [item.model_dump() for item in resume_data.external_links]
         
         if resume:
             # 업데이트
             resume.introduction = resume_data.introduction
-            resume.tech_stack = tech_stack_json
-            resume.work_experience = work_experience_json
-            resume.awards = awards_json
-            resume.external_links = external_links_json
+            resume.tech_stack = tech_stack
+            resume.work_experience = work_experience
+            resume.awards = awards
+            resume.external_links = external_links
         else:
             # 생성
             resume = Resume(
                 user_id=current_user["user_id"],
                 introduction=resume_data.introduction,
-                tech_stack=tech_stack_json,
-                work_experience=work_experience_json,
-                awards=awards_json,
-                external_links=external_links_json
+                tech_stack=tech_stack,
+                work_experience=work_experience,
+                awards=awards,
+                external_links=external_links
             )
             db.add(resume)
         
@@ -66,13 +65,12 @@ async def create_or_update_resume(
 
 @router.get("/me", response_model=SuccessResponse)
 async def get_my_resume(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: dict = Depends(get_current_user)
 ):
     """내 이력서 조회"""
     try:
         resume = db.query(Resume).filter(Resume.user_id == current_user["user_id"]).first()
-        user = db.query(User).filter(User.user_id == current_user["user_id"]).first()
         
         if not resume:
             raise HTTPException(
@@ -80,20 +78,20 @@ async def get_my_resume(
                 detail="이력서를 찾을 수 없습니다."
             )
         
-        # JSON 파싱
-        tech_stack = json.loads(resume.tech_stack) if resume.tech_stack else []
-        work_experience = json.loads(resume.work_experience) if resume.work_experience else []
-        awards = json.loads(resume.awards) if resume.awards else []
-        external_links = json.loads(resume.external_links) if resume.external_links else []
+        # JSON 컬럼은 로드 시 이미 디코딩됨
+        tech_stack = resume.tech_stack or []
+        work_experience = resume.work_experience or []
+        awards = resume.awards or []
+        external_links = resume.external_links or []
         
         response_data = ResumeResponse(
             resume_id=resume.resume_id,
             user_id=resume.user_id,
-            name=user.name,
-            email=user.email,
-            major=user.major,
-            year=user.year,
-            sejong_student_id=user.sejong_student_id,
+            name=current_user["name"],
+            email=current_user["email"],
+            major=current_user["major"],
+            year=current_user["year"],
+            sejong_student_id=current_user["sejong_student_id"],
             introduction=resume.introduction,
             tech_stack=tech_stack,
             work_experience=work_experience,
@@ -117,7 +115,7 @@ async def get_my_resume(
         )
 
 @router.get("/{user_id}", response_model=SuccessResponse)
-async def get_user_resume(user_id: int, db: Session = Depends(get_db)):
+async def get_user_resume(user_id: int, db: Session = Depends(get_read_db)):
     """다른 사용자 이력서 조회 (공개 정보만)"""
     try:
         resume = db.query(Resume).filter(Resume.user_id == user_id).first()
@@ -129,11 +127,11 @@ async def get_user_resume(user_id: int, db: Session = Depends(get_db)):
                 detail="이력서를 찾을 수 없습니다."
             )
         
-        # JSON 파싱
-        tech_stack = json.loads(resume.tech_stack) if resume.tech_stack else []
-        work_experience = json.loads(resume.work_experience) if resume.work_experience else []
-        awards = json.loads(resume.awards) if resume.awards else []
-        external_links = json.loads(resume.external_links) if resume.external_links else []
+        # JSON 컬럼은 로드 시 이미 디코딩됨
+        tech_stack = resume.tech_stack or []
+        work_experience = resume.work_experience or []
+        awards = resume.awards or []
+        external_links = resume.external_links or []
         
         response_data = ResumePublicResponse(
             resume_id=resume.resume_id,
@@ -1,11 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query  # Query 추가
-from sqlalchemy.orm import Session
-from sqlalchemy import func  # func도 추가 (통계에서 사용)
+from sqlalchemy import delete, func, select  # func도 추가 (통계에서 사용)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from typing import List, Optional  # Optional 추가
 from datetime import datetime, timedelta  # datetime, timedelta 추가
 
-from app.database import get_db
-from app.models.team_matching import TeamOpening, TeamApplication
+from app.database import get_async_db, get_async_read_db
+from app.models.team_matching import TeamOpening, TeamApplication, TeamOpeningSkill
 from app.models.project import Project
 from app.models.user import User
 from app.schemas.team_matching import (
@@ -13,22 +14,33 @@ from app.schemas.team_matching import (
     TeamApplicationCreate, TeamApplicationResponse, TeamApplicationDetail,
     ApplicationStatusUpdate
 )
-from app.schemas.common import SuccessResponse
+from app.schemas.common import CursorPaginatedResponse, SuccessResponse
 from app.auth import get_current_user
+from app.services.skill_tags import skill_tags
+from app.utils.pagination import MAX_PAGE_SIZE, Keyset
 
 # prefix는 main.py에서 설정하므로 여기서는 제외합니다.
 router = APIRouter(tags=["Team Matching"])
 
+
+async def _replace_skill_tags(db: AsyncSession, opening: TeamOpening) -> None:
+    """공고의 기술 태그를 required_skills 기준으로 다시 저장 (커밋은 호출하는 쪽에서)"""
+    await db.execute(delete(TeamOpeningSkill).where(TeamOpeningSkill.opening_id == opening.opening_id))
+    db.add_all(
+        TeamOpeningSkill(opening_id=opening.opening_id, skill=tag)
+        for tag in skill_tags(opening.required_skills)
+    )
+
 # --- A. For Project Owners (빌더/드리머) ---
 
 @router.post("/openings/", response_model=SuccessResponse)
 async def create_team_opening(
     opening_data: TeamOpeningCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user)
 ):
     """(빌더/드리머) 팀원 모집 공고 등록"""
-    project = db.query(Project).filter(Project.project_id == opening_data.project_id).first()
+    project = await db.get(Project, opening_data.project_id)
     if not project:
         raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
     if project.owner_id != current_user["user_id"]:
@@ -36,8 +48,10 @@ async def create_team_opening(
 
     new_opening = TeamOpening(**opening_data.model_dump())
     db.add(new_opening)
-    db.commit()
-    db.refresh(new_opening)
+    await db.flush()
+    await _replace_skill_tags(db, new_opening)
+    await db.commit()
+    await db.refresh(new_opening)
     
     return SuccessResponse(
         message="모집 공고가 성공적으로 등록되었습니다.",
@@ -47,17 +61,17 @@ async def create_team_opening(
 @router.get("/openings/project/{project_id}", response_model=SuccessResponse)
 async def get_openings_for_project(
     project_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: dict = Depends(get_current_user)
 ):
     """(빌더/드리머) 내 프로젝트의 모든 공고 조회"""
-    project = db.query(Project).filter(Project.project_id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
     if project.owner_id != current_user["user_id"]:
         raise HTTPException(status_code=403, detail="프로젝트 소유자만 조회할 수 있습니다.")
 
-    openings = db.query(TeamOpening).filter(TeamOpening.project_id == project_id).all()
+    openings = (await db.scalars(select(TeamOpening).where(TeamOpening.project_id == project_id))).all()
     return SuccessResponse(
         message="프로젝트의 모집 공고 목록입니다.",
         data=[TeamOpeningResponse.from_orm(o) for o in openings]
@@ -66,23 +80,28 @@ async def get_openings_for_project(
 @router.get("/openings/{opening_id}/applications", response_model=SuccessResponse)
 async def get_applications_for_opening(
     opening_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: dict = Depends(get_current_user)
 ):
     """(빌더/드리머) 특정 공고에 지원한 지원자 목록 조회"""
-    opening = db.query(TeamOpening).filter(TeamOpening.opening_id == opening_id).first()
+    opening = await db.get(TeamOpening, opening_id)
     if not opening:
         raise HTTPException(status_code=404, detail="모집 공고를 찾을 수 없습니다.")
     
-    project = db.query(Project).filter(Project.project_id == opening.project_id).first()
+    project = await db.get(Project, opening.project_id)
     if project.owner_id != current_user["user_id"]:
         raise HTTPException(status_code=403, detail="프로젝트 소유자만 지원자를 조회할 수 있습니다.")
 
-    applications = db.query(TeamApplication).filter(TeamApplication.opening_id == opening_id).all()
+    # 지원자 정보는 selectinload로 한 번에 조회
+    applications = (await db.scalars(
+        select(TeamApplication).options(selectinload(TeamApplication.applicant)).where(
+            TeamApplication.opening_id == opening_id
+        )
+    )).all()
     
     application_details = []
     for app in applications:
-        applicant_info = db.query(User).filter(User.user_id == app.applicant_id).first()
+        applicant_info = app.applicant
         if applicant_info:
             detail = TeamApplicationDetail(
                 application_id=app.application_id,
@@ -109,16 +128,16 @@ async def get_applications_for_opening(
 async def update_application_status(
     application_id: int,
     status_update: ApplicationStatusUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user)
 ):
     """(빌더/드리머) 지원서 상태 변경 (수락/거절)"""
-    application = db.query(TeamApplication).filter(TeamApplication.application_id == application_id).first()
+    application = await db.get(TeamApplication, application_id)
     if not application:
         raise HTTPException(status_code=404, detail="지원서를 찾을 수 없습니다.")
 
-    opening = db.query(TeamOpening).filter(TeamOpening.opening_id == application.opening_id).first()
-    project = db.query(Project).filter(Project.project_id == opening.project_id).first()
+    opening = await db.get(TeamOpening, application.opening_id)
+    project = await db.get(Project, opening.project_id)
     if project.owner_id != current_user["user_id"]:
         raise HTTPException(status_code=403, detail="프로젝트 소유자만 상태를 변경할 수 있습니다.")
 
@@ -126,11 +145,11 @@ async def update_application_status(
         raise HTTPException(status_code=400, detail="유효하지 않은 상태 값입니다. 'ACCEPTED' 또는 'REJECTED'를 사용하세요.")
 
     application.status = status_update.status
-    db.commit()
-    db.refresh(application)
+    await db.commit()
+    await db.refresh(application)
 
     # 응답을 위해 지원자 상세 정보 다시 조회
-    applicant_info = db.query(User).filter(User.user_id == application.applicant_id).first()
+    applicant_info = await db.get(User, application.applicant_id)
     updated_detail = TeamApplicationDetail(
         application_id=application.application_id,
         opening_id=application.opening_id,
@@ -151,19 +170,109 @@ async def update_application_status(
 
 # --- B. For Applicants (스페셜리스트) ---
 
-@router.get("/openings/", response_model=SuccessResponse)
-async def get_all_openings(db: Session = Depends(get_db)):
-    """(스페셜리스트) 전체 모집 공고 목록 조회"""
-    openings = db.query(TeamOpening).filter(TeamOpening.status == "OPEN").order_by(TeamOpening.created_at.desc()).all()
-    return SuccessResponse(
+# 최신순 (created_at, opening_id) 커서 페이지네이션
+OPENINGS_KEYSET = Keyset((TeamOpening.created_at, True), (TeamOpening.opening_id, True))
+
+@router.get("/openings/", response_model=CursorPaginatedResponse)
+async def get_all_openings(
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """(스페셜리스트) 전체 모집 공고 목록 조회 (최신순, 커서 기반 페이지)"""
+    query = select(TeamOpening).where(TeamOpening.status == "OPEN")
+    rows = (await db.execute(OPENINGS_KEYSET.page(query, cursor, limit))).all()
+    rows, next_cursor = OPENINGS_KEYSET.split(rows, limit)
+    return CursorPaginatedResponse(
         message="전체 모집 공고 목록입니다.",
-        data=[TeamOpeningResponse.from_orm(o) for o in openings]
+        data=[TeamOpeningResponse.from_orm(row.TeamOpening) for row in rows],
+        next_cursor=next_cursor,
+        has_more=next_cursor is not None
+    )
+
+# /openings/{opening_id} 보다 먼저 등록해야 "search"가 공고 ID로 해석되지 않음
+@router.get("/openings/search", response_model=CursorPaginatedResponse)
+async def search_team_openings(
+    role: Optional[str] = Query(None, description="역할명으로 검색"),
+    skills: Optional[str] = Query(None, description="기술스택으로 검색 (쉼표로 여러 개)"),
+    skills_mode: str = Query("any", pattern="^(any|all)$", description="any: 하나라도 일치, all: 모두 일치"),
+    commitment: Optional[str] = Query(None, description="커밋먼트 타입 필터"),
+    service_type: Optional[str] = Query(None, description="서비스 타입 필터"),
+    stage: Optional[str] = Query(None, description="프로젝트 단계 필터"),
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """(스페셜리스트) 팀원 모집 공고 검색/필터링 (커서 기반 페이지)
+
+    기술스택은 태그로 정규화해 검색하며(같은 기술의 다른 표기는 같은 태그), 일치하는 기술이 많은 공고부터 보여줍니다.
+    """
+    # 프로젝트와 소유자 정보는 selectinload로 한 번에 조회
+    query = select(TeamOpening).join(Project).options(
+        selectinload(TeamOpening.project).selectinload(Project.owner)
+    ).where(
+        TeamOpening.status == "OPEN",
+        Project.is_active == True,
+        Project.is_public == True
+    )
+    
+    if role:
+        query = query.where(TeamOpening.role_name.ilike(f"%{role}%"))
+    
+    # 기술 태그 인덱스에서 공고별로 일치한 기술 수를 세고, 많이 일치한 순으로 정렬
+    keyset = OPENINGS_KEYSET
+    tags = skill_tags(skills)
+    if tags:
+        skill_hits = select(
+            TeamOpeningSkill.opening_id, func.count().label("overlap")
+        ).where(TeamOpeningSkill.skill.in_(tags)).group_by(TeamOpeningSkill.opening_id)
+        if skills_mode == "all":
+            skill_hits = skill_hits.having(func.count() == len(tags))
+        skill_hits = skill_hits.subquery()
+        query = query.join(skill_hits, skill_hits.c.opening_id == TeamOpening.opening_id).add_columns(
+            skill_hits.c.overlap
+        )
+        # 일치한 기술 수가 많은 순 → 최신순
+        keyset = Keyset((skill_hits.c.overlap, True), *OPENINGS_KEYSET.keys)
+    
+    if commitment:
+        query = query.where(TeamOpening.commitment_type == commitment)
+    
+    if service_type:
+        query = query.where(Project.service_type == service_type)
+    
+    if stage:
+        query = query.where(Project.stage == stage)
+    
+    rows = (await db.execute(keyset.page(query, cursor, limit))).all()
+    rows, next_cursor = keyset.split(rows, limit)
+    
+    # 프로젝트 정보도 함께 반환
+    openings_with_project = []
+    for row in rows:
+        opening = row[0]
+        opening_dict = TeamOpeningResponse.from_orm(opening).model_dump()
+        opening_dict["project_info"] = {
+            "name": opening.project.name,
+            "service_type": opening.project.service_type,
+            "stage": opening.project.stage,
+            "owner_name": opening.project.owner.name
+        }
+        if tags:
+            opening_dict["matched_skills"] = row.overlap
+        openings_with_project.append(opening_dict)
+    
+    return CursorPaginatedResponse(
+        message=f"검색 결과 {len(openings_with_project)}개의 모집 공고를 찾았습니다.",
+        data=openings_with_project,
+        next_cursor=next_cursor,
+        has_more=next_cursor is not None
     )
 
 @router.get("/openings/{opening_id}", response_model=SuccessResponse)
-async def get_opening_detail(opening_id: int, db: Session = Depends(get_db)):
+async def get_opening_detail(opening_id: int, db: AsyncSession = Depends(get_async_read_db)):
     """(스페셜리스트) 모집 공고 상세 조회"""
-    opening = db.query(TeamOpening).filter(TeamOpening.opening_id == opening_id).first()
+    opening = await db.get(TeamOpening, opening_id)
     if not opening:
         raise HTTPException(status_code=404, detail="모집 공고를 찾을 수 없습니다.")
     return SuccessResponse(
@@ -174,19 +283,21 @@ async def get_opening_detail(opening_id: int, db: Session = Depends(get_db)):
 @router.post("/applications/", response_model=SuccessResponse)
 async def apply_to_opening(
     application_data: TeamApplicationCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user)
 ):
     """(스페셜리스트) 팀 지원하기"""
-    opening = db.query(TeamOpening).filter(TeamOpening.opening_id == application_data.opening_id).first()
+    opening = await db.get(TeamOpening, application_data.opening_id)
     if not opening or opening.status != "OPEN":
         raise HTTPException(status_code=404, detail="모집 중인 공고가 아닙니다.")
 
     # 중복 지원 방지
-    existing_application = db.query(TeamApplication).filter(
-        TeamApplication.opening_id == application_data.opening_id,
-        TeamApplication.applicant_id == current_user["user_id"]
-    ).first()
+    existing_application = await db.scalar(
+        select(TeamApplication).where(
+            TeamApplication.opening_id == application_data.opening_id,
+            TeamApplication.applicant_id == current_user["user_id"]
+        )
+    )
     if existing_application:
         raise HTTPException(status_code=400, detail="이미 이 공고에 지원했습니다.")
 
@@ -195,8 +306,8 @@ async def apply_to_opening(
     
     new_application = TeamApplication(**new_application_data)
     db.add(new_application)
-    db.commit()
-    db.refresh(new_application)
+    await db.commit()
+    await db.refresh(new_application)
 
     return SuccessResponse(
         message="성공적으로 지원했습니다.",
@@ -205,11 +316,13 @@ async def apply_to_opening(
 
 @router.get("/applications/my", response_model=SuccessResponse)
 async def get_my_applications(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: dict = Depends(get_current_user)
 ):
     """(스페셜리스트) 내 지원 현황 조회"""
-    my_applications = db.query(TeamApplication).filter(TeamApplication.applicant_id == current_user["user_id"]).all()
+    my_applications = (await db.scalars(
+        select(TeamApplication).where(TeamApplication.applicant_id == current_user["user_id"])
+    )).all()
     return SuccessResponse(
         message="나의 지원 현황 목록입니다.",
         data=[TeamApplicationResponse.from_orm(app) for app in my_applications]
@@ -219,15 +332,15 @@ async def get_my_applications(
 async def update_team_opening(
     opening_id: int,
     opening_update: TeamOpeningCreate,  # 같은 스키마 재사용
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user)
 ):
     """(빌더/드리머) 팀원 모집 공고 수정"""
-    opening = db.query(TeamOpening).filter(TeamOpening.opening_id == opening_id).first()
+    opening = await db.get(TeamOpening, opening_id)
     if not opening:
         raise HTTPException(status_code=404, detail="모집 공고를 찾을 수 없습니다.")
     
-    project = db.query(Project).filter(Project.project_id == opening.project_id).first()
+    project = await db.get(Project, opening.project_id)
     if project.owner_id != current_user["user_id"]:
         raise HTTPException(status_code=403, detail="프로젝트 소유자만 공고를 수정할 수 있습니다.")
 
@@ -236,9 +349,10 @@ async def update_team_opening(
     opening.description = opening_update.description
     opening.required_skills = opening_update.required_skills
     opening.commitment_type = opening_update.commitment_type
+    await _replace_skill_tags(db, opening)
     
-    db.commit()
-    db.refresh(opening)
+    await db.commit()
+    await db.refresh(opening)
     
     return SuccessResponse(
         message="모집 공고가 성공적으로 수정되었습니다.",
@@ -248,21 +362,21 @@ async def update_team_opening(
 @router.delete("/openings/{opening_id}", response_model=SuccessResponse)
 async def delete_team_opening(
     opening_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user)
 ):
     """(빌더/드리머) 팀원 모집 공고 삭제"""
-    opening = db.query(TeamOpening).filter(TeamOpening.opening_id == opening_id).first()
+    opening = await db.get(TeamOpening, opening_id)
     if not opening:
         raise HTTPException(status_code=404, detail="모집 공고를 찾을 수 없습니다.")
     
-    project = db.query(Project).filter(Project.project_id == opening.project_id).first()
+    project = await db.get(Project, opening.project_id)
     if project.owner_id != current_user["user_id"]:
         raise HTTPException(status_code=403, detail="프로젝트 소유자만 공고를 삭제할 수 있습니다.")
 
     # 상태를 CLOSED로 변경 (완전 삭제하지 않음)
     opening.status = "CLOSED"
-    db.commit()
+    await db.commit()
     
     return SuccessResponse(
         message="모집 공고가 성공적으로 삭제되었습니다.",
@@ -272,11 +386,11 @@ async def delete_team_opening(
 @router.delete("/applications/{application_id}", response_model=SuccessResponse)
 async def cancel_application(
     application_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user)
 ):
     """(스페셜리스트) 지원 취소"""
-    application = db.query(TeamApplication).filter(TeamApplication.application_id == application_id).first()
+    application = await db.get(TeamApplication, application_id)
     if not application:
         raise HTTPException(status_code=404, detail="지원서를 찾을 수 없습니다.")
     
@@ -286,104 +400,61 @@ async def cancel_application(
     if application.status != "PENDING":
         raise HTTPException(status_code=400, detail="대기 중인 지원서만 취소할 수 있습니다.")
 
-    db.delete(application)
-    db.commit()
+    await db.delete(application)
+    await db.commit()
     
     return SuccessResponse(
         message="지원이 성공적으로 취소되었습니다.",
         data={"application_id": application_id}
     )
 
-@router.get("/openings/search", response_model=SuccessResponse)
-async def search_team_openings(
-    role: Optional[str] = Query(None, description="역할명으로 검색"),
-    skills: Optional[str] = Query(None, description="기술스택으로 검색"),
-    commitment: Optional[str] = Query(None, description="커밋먼트 타입 필터"),
-    service_type: Optional[str] = Query(None, description="서비스 타입 필터"),
-    stage: Optional[str] = Query(None, description="프로젝트 단계 필터"),
-    limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db)
-):
-    """(스페셜리스트) 팀원 모집 공고 검색/필터링"""
-    query = db.query(TeamOpening).join(Project).filter(
-        TeamOpening.status == "OPEN",
-        Project.is_active == True,
-        Project.is_public == True
-    )
-    
-    if role:
-        query = query.filter(TeamOpening.role_name.ilike(f"%{role}%"))
-    
-    if skills:
-        query = query.filter(TeamOpening.required_skills.ilike(f"%{skills}%"))
-    
-    if commitment:
-        query = query.filter(TeamOpening.commitment_type == commitment)
-    
-    if service_type:
-        query = query.filter(Project.service_type == service_type)
-    
-    if stage:
-        query = query.filter(Project.stage == stage)
-    
-    openings = query.order_by(TeamOpening.created_at.desc()).limit(limit).all()
-    
-    # 프로젝트 정보도 함께 반환
-    openings_with_project = []
-    for opening in openings:
-        opening_dict = TeamOpeningResponse.from_orm(opening).model_dump()
-        opening_dict["project_info"] = {
-            "name": opening.project.name,
-            "service_type": opening.project.service_type,
-            "stage": opening.project.stage,
-            "owner_name": opening.project.owner.name
-        }
-        openings_with_project.append(opening_dict)
-    
-    return SuccessResponse(
-        message=f"검색 결과 {len(openings_with_project)}개의 모집 공고를 찾았습니다.",
-        data=openings_with_project
-    )
-
 @router.get("/statistics", response_model=SuccessResponse)
-async def get_team_matching_statistics(db: Session = Depends(get_db)):
+async def get_team_matching_statistics(db: AsyncSession = Depends(get_async_read_db)):
     """팀 매칭 관련 통계"""
     try:
         # 전체 통계
-        total_openings = db.query(TeamOpening).count()
-        active_openings = db.query(TeamOpening).filter(TeamOpening.status == "OPEN").count()
-        total_applications = db.query(TeamApplication).count()
-        accepted_applications = db.query(TeamApplication).filter(TeamApplication.status == "ACCEPTED").count()
+        total_openings = await db.scalar(select(func.count(TeamOpening.opening_id)))
+        active_openings = await db.scalar(
+            select(func.count(TeamOpening.opening_id)).where(TeamOpening.status == "OPEN")
+        )
+        total_applications = await db.scalar(select(func.count(TeamApplication.application_id)))
+        accepted_applications = await db.scalar(
+            select(func.count(TeamApplication.application_id)).where(TeamApplication.status == "ACCEPTED")
+        )
         
         # 역할별 통계
-        role_counts = db.query(
-            TeamOpening.role_name,
-            func.count(TeamOpening.opening_id)
-        ).filter(
-            TeamOpening.status == "OPEN"
-        ).group_by(TeamOpening.role_name).all()
+        role_counts = (await db.execute(
+            select(
+                TeamOpening.role_name,
+                func.count(TeamOpening.opening_id)
+            ).where(
+                TeamOpening.status == "OPEN"
+            ).group_by(TeamOpening.role_name)
+        )).all()
         
         popular_roles = {role: count for role, count in role_counts}
         
         # 커밋먼트 타입별 통계
-        commitment_counts = db.query(
-            TeamOpening.commitment_type,
-            func.count(TeamOpening.opening_id)
-        ).filter(
-            TeamOpening.status == "OPEN"
-        ).group_by(TeamOpening.commitment_type).all()
+        commitment_counts = (await db.execute(
+            select(
+                TeamOpening.commitment_type,
+                func.count(TeamOpening.opening_id)
+            ).where(
+                TeamOpening.status == "OPEN"
+            ).group_by(TeamOpening.commitment_type)
+        )).all()
         
         commitment_stats = {commitment or "미지정": count for commitment, count in commitment_counts}
         
         # 최근 7일간 활동
         seven_days_ago = datetime.utcnow() - timedelta(days=7)
-        recent_openings = db.query(TeamOpening).filter(
-            TeamOpening.created_at >= seven_days_ago
-        ).count()
+        recent_openings = await db.scalar(
+            select(func.count(TeamOpening.opening_id)).where(TeamOpening.created_at >= seven_days_ago)
+        )
         
-        recent_applications = db.query(TeamApplication).filter(
-            TeamApplication.applied_at >= seven_days_ago
-        ).count()
+        recent_applications = await db.scalar(
+            select(func.count(TeamApplication.application_id)).where(TeamApplication.applied_at >= seven_days_ago)
+        )
         
         statistics = {
             "overview": {
@@ -416,17 +487,19 @@ async def get_team_matching_statistics(db: Session = Depends(get_db)):
 async def get_recommended_openings(
     user_id: int,
     limit: int = Query(10, ge=1, le=20),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """사용자에게 추천하는 팀 모집 공고 (기본적인 추천 로직)"""
     try:
         # 사용자 정보 조회
-        user = db.query(User).filter(User.user_id == user_id).first()
+        user = await db.get(User, user_id)
         if not user:
             raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
         
         # 기본 추천 로직: 사용자의 전공과 관련된 프로젝트의 모집 공고
-        query = db.query(TeamOpening).join(Project).join(User).filter(
+        query = select(TeamOpening).join(Project).join(User).options(
+            selectinload(TeamOpening.project).selectinload(Project.owner)
+        ).where(
             TeamOpening.status == "OPEN",
             Project.is_active == True,
             Project.is_public == True
@@ -434,11 +507,13 @@ async def get_recommended_openings(
         
         # 같은 전공의 프로젝트를 우선 추천
         if user.major:
-            same_major_openings = query.filter(User.major == user.major).limit(limit//2).all()
-            other_openings = query.filter(User.major != user.major).limit(limit - len(same_major_openings)).all()
-            recommended_openings = same_major_openings + other_openings
+            same_major_openings = (await db.scalars(query.where(User.major == user.major).limit(limit//2))).all()
+            other_openings = (await db.scalars(
+                query.where(User.major != user.major).limit(limit - len(same_major_openings))
+            )).all()
+            recommended_openings = list(same_major_openings) + list(other_openings)
         else:
-            recommended_openings = query.limit(limit).all()
+            recommended_openings = (await db.scalars(query.limit(limit))).all()
         
         # 추천 이유와 함께 반환
         recommendations = []
@@ -1,49 +1,21 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models.user import User
 from app.schemas.user import UserResponse, UserTypeUpdate, UserProfileUpdate
 from app.schemas.common import SuccessResponse
-from app.auth import get_current_user
+from app.auth import get_current_user, user_principal
+from app.services.principal_cache import principal_cache
 
 router = APIRouter()
 
 @router.get("/me", response_model=SuccessResponse)
-async def get_my_profile(current_user: dict = Depends(get_current_user), db: Session = Depends(get_db)):
-    """내 프로필 조회"""
-    try:
-        user = db.query(User).filter(User.user_id == current_user["user_id"]).first()
-        
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="사용자를 찾을 수 없습니다."
-            )
-        
-        user_data = {
-            "user_id": user.user_id,
-            "email": user.email,
-            "name": user.name,
-            "major": user.major,
-            "year": user.year,
-            "user_type": user.user_type,
-            "profile_info": user.profile_info,
-            "sejong_student_id": user.sejong_student_id,
-            "created_at": user.created_at
-        }
-        
-        return SuccessResponse(
-            message="프로필 조회에 성공했습니다.",
-            data=user_data
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="프로필 조회 중 오류가 발생했습니다."
-        )
+async def get_my_profile(current_user: dict = Depends(get_current_user)):
+    """내 프로필 조회 (인증 시 읽은 사용자 정보를 그대로 사용)"""
+    return SuccessResponse(
+        message="프로필 조회에 성공했습니다.",
+        data=current_user
+    )
     
 @router.put("/me/profile", response_model=SuccessResponse)
 async def update_my_profile(
@@ -70,19 +42,10 @@ async def update_my_profile(
         
         db.commit()
         db.refresh(user)
+        principal_cache.invalidate_user(user.user_id)
         
         # 업데이트된 사용자 정보 반환
-        user_data = {
-            "user_id": user.user_id,
-            "email": user.email,
-            "name": user.name,
-            "major": user.major,
-            "year": user.year,
-            "user_type": user.user_type,
-            "profile_info": user.profile_info,
-            "sejong_student_id": user.sejong_student_id,
-            "created_at": user.created_at
-        }
+        user_data = user_principal(user)
         
         return SuccessResponse(
             message="프로필이 성공적으로 업데이트되었습니다.",
@@ -114,23 +77,23 @@ async def update_user_type(
                 detail=f"유효하지 않은 사용자 타입입니다. 가능한 값: {', '.join(valid_types)}"
             )
         
-        # 사용자 조회 및 업데이트
-        user = db.query(User).filter(User.user_id == current_user["user_id"]).first()
+        # 사용자 타입 업데이트 (조회 없이 바로 UPDATE)
+        updated = db.query(User).filter(User.user_id == current_user["user_id"]).update(
+            {User.user_type: user_type_data.user_type}, synchronize_session=False
+        )
         
-        if not user:
+        if not updated:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="사용자를 찾을 수 없습니다."
             )
         
-        # 사용자 타입 업데이트
-        user.user_type = user_type_data.user_type
         db.commit()
-        db.refresh(user)
+        principal_cache.invalidate_user(current_user["user_id"])
         
         return SuccessResponse(
             message=f"사용자 타입이 {user_type_data.user_type}로 설정되었습니다.",
-            data={"user_type": user.user_type}
+            data={"user_type": user_type_data.user_type}
         )
         
     except HTTPException:
@@ -143,7 +106,7 @@ async def update_user_type(
         )
 
 @router.get("/profile/{user_id}", response_model=SuccessResponse)
-async def get_user_profile(user_id: int, db: Session = Depends(get_db)):
+async def get_user_profile(user_id: int, db: Session = Depends(get_read_db)):
     """다른 사용자 프로필 조회 (공개 정보만)"""
     try:
         user = db.query(User).filter(User.user_id == user_id).first()
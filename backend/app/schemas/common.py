@@ -1,8 +1,20 @@
+from fastapi.responses import Response
 from pydantic import BaseModel
 from typing import Any, Optional
 
+from app.utils.responses import json_response
+
+# 큰 응답을 FastAPI 재검증 없이 바로 보내는 공통 메서드
+class FastResponseMixin:
+    def as_response(self, status_code: int = 200) -> Response:
+        """FastAPI 의 응답 재검증 + 직렬화를 건너뛰고 바로 JSON bytes 로 (큰 응답용)
+
+        data 가 pydantic 모델이면 다시 검증하지 않고 필드 값만, RawJSON 이면 바이트 그대로 넣습니다.
+        """
+        return json_response({name: getattr(self, name) for name in type(self).model_fields}, status_code)
+
 # 표준 성공 응답
-class SuccessResponse(BaseModel):
+class SuccessResponse(FastResponseMixin, BaseModel):
     success: bool = True
     message: str
     data: Optional[Any] = None
@@ -24,6 +36,14 @@ class PaginatedResponse(BaseModel):
     per_page: int
     total_pages: int
 
+# 커서 기반 페이지네이션 응답 (next_cursor를 다음 요청의 cursor로 전달, 마지막 페이지면 None)
+class CursorPaginatedResponse(FastResponseMixin, BaseModel):
+    success: bool = True
+    message: str
+    data: list
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
 # 헬스체크 응답
 class HealthResponse(BaseModel):
     status: str
@@ -129,4 +129,9 @@ class ProjectMatchingResponse(BaseModel):
     
 class LabMatchingStatusUpdate(BaseModel):
     status: str  # CONTACTED, INTERESTED, DECLINED
-    notes: Optional[str] = None
\ No newline at end of file
+    notes: Optional[str] = None
+
+class BatchMatchingRequest(BaseModel):
+    project_ids: Optional[List[int]] = None  # 비우면 활성 프로젝트 전체
+    max_results: int = 10
+    min_score: float = 0.3
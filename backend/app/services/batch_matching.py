@@ -0,0 +1,122 @@
+# backend/app/services/batch_matching.py
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.project import Project
+from app.services.lab_index import CatalogSnapshot, ProjectFeatures, lab_feature_index
+from app.services.lab_matching import LabMatchingService, MatchingRun
+
+# 워커 한 번에 넘길 프로젝트 수
+_SHARD_SIZE = 50
+# 이보다 프로젝트가 적으면 프로세스를 띄우는 비용이 더 커서 현재 프로세스에서 계산
+_INLINE_THRESHOLD = 100
+
+# 워커 프로세스마다 한 번 받아 두는 연구실 카탈로그
+_worker_catalog: Optional[CatalogSnapshot] = None
+
+
+def _init_worker(catalog: CatalogSnapshot) -> None:
+    """워커 초기화: 연구실 특징을 한 번만 전달받아 재사용"""
+    global _worker_catalog
+    _worker_catalog = catalog
+
+
+def _match_shard(
+    projects: List[ProjectFeatures], catalog: CatalogSnapshot, max_results: int, min_score: float
+) -> List[Tuple[int, List[Dict]]]:
+    """프로젝트 묶음을 연구실 카탈로그와 매칭 (DB 접근 없음)"""
+    # 점수 계산만 하므로 세션 없이 서비스 사용
+    service = LabMatchingService(None)
+    results = []
+    for project in projects:
+        winners = service.top_matches(project, catalog, max_results, min_score)
+        results.append((project.project_id, [
+            {
+                'lab_id': lab.lab_id,
+                'similarity_score': score,
+                'matching_details': details
+            }
+            for lab, score, details in winners
+        ]))
+    return results
+
+
+def _match_shard_in_worker(projects: List[ProjectFeatures], max_results: int, min_score: float):
+    return _match_shard(projects, _worker_catalog, max_results, min_score)
+
+
+def run_batch_matching(
+    db: Session,
+    project_ids: Optional[List[int]] = None,
+    owner_id: Optional[int] = None,
+    max_results: int = 10,
+    min_score: float = 0.3,
+    workers: Optional[int] = None
+) -> Dict:
+    """활성 프로젝트 전체(또는 일부)를 연구실 카탈로그와 매칭해 결과 저장
+
+    프로젝트를 묶음 단위로 나눠 프로세스 풀에서 점수를 계산하고,
+    묶음마다 결과를 한 트랜잭션으로 일괄 저장합니다.
+    """
+    started = time.perf_counter()
+
+    query = db.query(Project).filter(Project.is_active == True)
+    if project_ids:
+        query = query.filter(Project.project_id.in_(project_ids))
+    if owner_id is not None:
+        query = query.filter(Project.owner_id == owner_id)
+    projects = [ProjectFeatures(project) for project in query.order_by(Project.project_id).all()]
+
+    catalog = lab_feature_index.refresh(db)
+    run = MatchingRun.of(projects, catalog, max_results, min_score)
+    shards = [projects[i:i + _SHARD_SIZE] for i in range(0, len(projects), _SHARD_SIZE)]
+    service = LabMatchingService(db)
+    total_matches = 0
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or len(projects) < _INLINE_THRESHOLD:
+        for shard in shards:
+            results = dict(_match_shard(shard, catalog, max_results, min_score))
+            service.save_batch_results(results, run)
+            total_matches += sum(len(matches) for matches in results.values())
+    else:
+        # fork 대신 spawn: 웹 서버 프로세스의 스레드/락 상태를 물려받지 않도록
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(shards)),
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(catalog,)
+        ) as executor:
+            futures = [
+                executor.submit(_match_shard_in_worker, shard, max_results, min_score)
+                for shard in shards
+            ]
+            for future in futures:
+                results = dict(future.result())
+                service.save_batch_results(results, run)
+                total_matches += sum(len(matches) for matches in results.values())
+
+    return {
+        'project_count': len(projects),
+        'lab_count': len(catalog.labs),
+        'total_matches': total_matches,
+        'elapsed_seconds': round(time.perf_counter() - started, 3)
+    }
+
+
+def run_batch_matching_job(**options) -> Dict:
+    """백그라운드 작업용: 자체 세션을 열어 일괄 매칭 실행"""
+    db = SessionLocal()
+    try:
+        return run_batch_matching(db, **options)
+    finally:
+        db.close()
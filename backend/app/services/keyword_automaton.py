@@ -0,0 +1,65 @@
+# backend/app/services/keyword_automaton.py
+from collections import deque
+from typing import Dict, FrozenSet, Hashable, Iterable, List
+
+
+class KeywordAutomaton:
+    """Aho-Corasick 다중 패턴 매칭기
+
+    여러 키워드(패턴)를 한 번에 컴파일해 두고, 텍스트를 한 번만 훑으면서
+    등장한 모든 패턴에 연결된 개념(concept)을 찾아냅니다.
+    패턴은 부분 문자열로 매칭되며 대소문자를 구분하지 않습니다.
+    """
+
+    def __init__(self, patterns: Dict[str, Iterable[Hashable]]):
+        # 노드별 전이 테이블, 실패 링크, 출력(개념) 집합
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[FrozenSet[Hashable]] = [frozenset()]
+
+        outputs: List[set] = [set()]
+        for pattern, concepts in patterns.items():
+            pattern = pattern.lower()
+            if not pattern:
+                continue
+            node = 0
+            for char in pattern:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append(set())
+                node = next_node
+            outputs[node].update(concepts)
+
+        # BFS로 실패 링크를 연결하고, 실패 노드의 출력을 합쳐 둠
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                outputs[child] |= outputs[self._fail[child]]
+
+        self._output = [frozenset(concepts) for concepts in outputs]
+
+    def find(self, text: str) -> FrozenSet[Hashable]:
+        """텍스트에 등장한 모든 개념 반환 (텍스트 1회 순회)"""
+        if not text:
+            return frozenset()
+
+        found = set()
+        node = 0
+        goto, fail, output = self._goto, self._fail, self._output
+        for char in text.lower():
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if output[node]:
+                found.update(output[node])
+        return frozenset(found)
@@ -0,0 +1,256 @@
+# backend/app/services/lab_index.py
+import hashlib
+import threading
+from typing import Dict, FrozenSet, List, NamedTuple, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.research_lab import ResearchLab
+from app.models.project import Project
+from app.services.keyword_automaton import KeywordAutomaton
+from app.services.recommendation_cache import project_fingerprint
+from app.services.text_index import term_frequencies
+
+# 한 번에 조회할 연구실 수 (SQLite IN 절 변수 제한 고려)
+_FETCH_CHUNK_SIZE = 500
+
+# 서비스 타입별 연구실 키워드 (keywords / research_areas 에서 검색)
+SERVICE_KEYWORDS = {
+    'APP': ['모바일', 'Mobile', 'Android', 'iOS', 'App'],
+    'WEB': ['웹', 'Web', 'Frontend', 'Backend', '웹개발'],
+    'AI': ['AI', '인공지능', 'Machine Learning', '머신러닝', '딥러닝']
+}
+
+# 서비스 타입별 기술 스택 키워드 (tech_stack 에서 검색)
+SERVICE_TECHS = {
+    'APP': ['mobile', 'android', 'ios', 'react native', 'flutter'],
+    'WEB': ['web', 'javascript', 'react', 'vue', 'python', 'node.js'],
+    'AI': ['python', 'tensorflow', 'pytorch', 'ai', 'ml']
+}
+
+# 프로젝트 설명과 연구실 키워드에 공통으로 등장하는지 확인할 단어
+COMMON_WORDS = [
+    'ai', '인공지능', 'ml', '머신러닝', 'data', '데이터', 'web', '웹',
+    'mobile', '모바일', 'app', '앱', 'iot', '사물인터넷', 'security', '보안',
+    'robot', '로봇', 'vision', '비전', 'nlp', '자연어'
+]
+
+# 기술 스택 매핑 (프로젝트에서 사용하는 용어 -> 연구실 기술스택)
+TECH_SYNONYMS = {
+    'ai': ['AI', 'Machine Learning', 'Deep Learning', '인공지능', '머신러닝', '딥러닝'],
+    'ml': ['Machine Learning', 'AI', 'Deep Learning', '머신러닝', '인공지능'],
+    'web': ['Web', 'Frontend', 'Backend', '웹개발', 'JavaScript', 'React', 'Node.js'],
+    'app': ['Mobile', 'Android', 'iOS', 'React Native', 'Flutter', '모바일'],
+    'data': ['Data Science', 'Big Data', 'Analytics', '데이터사이언스', '빅데이터'],
+    'iot': ['IoT', 'Internet of Things', 'Sensor', '사물인터넷', '센서'],
+    'blockchain': ['Blockchain', 'Cryptocurrency', '블록체인'],
+    'ar': ['AR', 'Augmented Reality', '증강현실'],
+    'vr': ['VR', 'Virtual Reality', '가상현실'],
+    'cv': ['Computer Vision', 'Image Processing', '컴퓨터비전', '영상처리'],
+    'nlp': ['NLP', 'Natural Language Processing', '자연어처리'],
+    'robotics': ['Robotics', 'Robot', '로봇', '로보틱스'],
+    'security': ['Security', 'Cybersecurity', '보안', '사이버보안']
+}
+
+# 산업별 연구 분야 매핑
+INDUSTRY_SYNONYMS = {
+    'healthcare': ['의료', '헬스케어', 'Medical', 'Biomedical', '바이오메디컬'],
+    'automotive': ['자동차', '자율주행', 'Automotive', 'Autonomous Vehicle'],
+    'fintech': ['금융', 'FinTech', '블록체인', 'Blockchain'],
+    'education': ['교육', 'Education', 'EdTech', '학습'],
+    'entertainment': ['엔터테인먼트', 'Entertainment', '게임', 'Game'],
+    'environment': ['환경', 'Environment', '기후', 'Climate'],
+    'manufacturing': ['제조', 'Manufacturing', '산업', 'Industrial']
+}
+
+# 키워드 점수에 쓰이는 개념 (공통 단어 + 산업 분야)
+KEYWORD_CONCEPTS = COMMON_WORDS + ['industry:' + name for name in INDUSTRY_SYNONYMS]
+
+
+def _build_concept_automaton() -> KeywordAutomaton:
+    """모든 매칭 어휘를 (종류, 개념) 단위로 하나의 오토마톤에 컴파일"""
+    patterns: Dict[str, set] = {}
+
+    def add(concept, terms):
+        for term in terms:
+            patterns.setdefault(term.lower(), set()).add(concept)
+
+    # 서비스 타입 키워드는 동의어 없이 그대로 매칭
+    for keywords in SERVICE_KEYWORDS.values():
+        for keyword in keywords:
+            add(('service', keyword.lower()), [keyword])
+
+    # 기술 스택 / 공통 단어는 기술 스택 매핑의 동의어까지 같은 개념으로 취급
+    for techs in SERVICE_TECHS.values():
+        for tech in techs:
+            add(('tech', tech), [tech] + TECH_SYNONYMS.get(tech, []))
+    for word in COMMON_WORDS:
+        add(('keyword', word), [word] + TECH_SYNONYMS.get(word, []))
+
+    # 산업 분야는 이름과 동의어 중 하나만 등장해도 같은 개념
+    for industry, terms in INDUSTRY_SYNONYMS.items():
+        add(('keyword', 'industry:' + industry), [industry] + terms)
+
+    return KeywordAutomaton(patterns)
+
+
+# 프로세스당 한 번만 컴파일
+CONCEPT_AUTOMATON = _build_concept_automaton()
+
+
+def _concepts_of_kind(concepts, kind: str) -> FrozenSet[str]:
+    return frozenset(name for concept_kind, name in concepts if concept_kind == kind)
+
+
+class LabFeatures:
+    """연구실 매칭용 특징 (연구실이 변경될 때만 다시 계산)"""
+
+    __slots__ = (
+        'lab_id', 'director_id', 'updated_at',
+        'name', 'name_en', 'location', 'email', 'phone',
+        'research_areas', 'description',
+        'service_terms', 'tech_terms', 'keyword_terms', 'description_terms'
+    )
+
+    def __init__(self, lab: ResearchLab):
+        self.lab_id = lab.lab_id
+        self.director_id = lab.director_id
+        self.updated_at = lab.updated_at
+
+        # 응답 구성에 필요한 원본 필드
+        self.name = lab.name
+        self.name_en = lab.name_en
+        self.location = lab.location
+        self.email = lab.email
+        self.phone = lab.phone
+        self.research_areas = lab.research_areas
+        self.description = lab.description
+
+        # 매칭 개념 (각 텍스트를 오토마톤으로 한 번씩만 훑음)
+        keyword_concepts = CONCEPT_AUTOMATON.find(lab.keywords or "")
+        research_concepts = CONCEPT_AUTOMATON.find(self._join_terms(lab.research_areas))
+        tech_concepts = CONCEPT_AUTOMATON.find(self._join_terms(lab.tech_stack).lower())
+        self.service_terms = _concepts_of_kind(keyword_concepts | research_concepts, 'service')
+        self.tech_terms = _concepts_of_kind(tech_concepts, 'tech')
+        self.keyword_terms = _concepts_of_kind(keyword_concepts, 'keyword')
+
+        # 설명 + 키워드의 n-gram 빈도 (TF-IDF 색인 입력)
+        self.description_terms = term_frequencies((lab.description or "") + " " + (lab.keywords or ""))
+
+    @staticmethod
+    def _join_terms(value) -> str:
+        # JSON 배열은 로드 시 리스트로 디코딩됨 (JSON이 아닌 예전 값은 문자열 그대로)
+        if not value:
+            return ""
+        if isinstance(value, list):
+            return " ".join(str(term) for term in value)
+        return str(value)
+
+
+class ProjectFeatures:
+    """프로젝트 매칭용 특징 (매칭 요청당 한 번 계산)"""
+
+    __slots__ = ('project_id', 'service_type', 'fingerprint', 'text', 'keyword_terms', 'terms', 'query_cache')
+
+    def __init__(self, project: Project):
+        self.project_id = project.project_id
+        self.service_type = project.service_type
+        self.fingerprint = project_fingerprint(project)
+        self.text = ((project.description or "") + " " + (project.idea_name or "")).lower()
+        self.keyword_terms = _concepts_of_kind(CONCEPT_AUTOMATON.find(self.text), 'keyword')
+        self.terms = term_frequencies(self.text)
+        # (설명 색인, 질의 벡터) - 같은 색인에 대해서는 한 번만 계산
+        self.query_cache = None
+
+    def description_query(self, index) -> Dict[str, float]:
+        """설명 색인 기준 질의 벡터"""
+        if self.query_cache is None or self.query_cache[0] is not index:
+            self.query_cache = (index, index.query_vector(self.terms))
+        return self.query_cache[1]
+
+
+class CatalogSnapshot(NamedTuple):
+    """refresh 시점의 카탈로그 (버전과 연구실 목록을 같은 잠금 안에서 함께 읽음)
+
+    카탈로그가 바뀌지 않으면 같은 객체가 반환되므로, 점수 계산기/설명 색인 캐시는
+    이 객체 자체를 키로 삼아 다른 연구실 목록으로 만든 결과를 섞어 쓰지 않습니다.
+    version 은 프로세스마다 다르고, fingerprint 는 (lab_id, updated_at) 목록의
+    해시라 같은 DB 를 보는 모든 프로세스에서 같습니다.
+    """
+    version: int
+    labs: List[LabFeatures]
+    fingerprint: str
+
+
+def _catalog_fingerprint(stamps: Dict[int, object]) -> str:
+    digest = hashlib.sha1()
+    for lab_id in sorted(stamps):
+        digest.update(f"{lab_id}:{stamps[lab_id]}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def matching_fingerprint(project_fingerprint: str, catalog: CatalogSnapshot) -> str:
+    """프로젝트 지문 + 카탈로그 지문 (같으면 매칭 점수도 같음, 저장된 매칭 결과 태그)"""
+    return hashlib.sha1(f"{project_fingerprint}:{catalog.fingerprint}".encode("utf-8")).hexdigest()
+
+
+class LabFeatureIndex:
+    """프로세스 내 연구실 특징 인덱스
+
+    활성 연구실의 (lab_id, updated_at)만 조회한 뒤, 새로 추가되었거나
+    updated_at이 바뀐 연구실만 다시 읽어 특징을 재계산합니다.
+    """
+
+    def __init__(self):
+        self._features: Dict[int, LabFeatures] = {}
+        self._lock = threading.Lock()
+        self._snapshot: Optional[CatalogSnapshot] = None
+        # 카탈로그가 바뀔 때마다 증가
+        self.version = 0
+
+    def refresh(self, db: Session) -> CatalogSnapshot:
+        """변경된 연구실만 재계산하고 (버전, 활성 연구실 특징 목록) 반환"""
+        stamps = dict(
+            db.query(ResearchLab.lab_id, ResearchLab.updated_at)
+            .filter(ResearchLab.is_active == True)
+            .all()
+        )
+
+        with self._lock:
+            stale_ids = [
+                lab_id for lab_id, updated_at in stamps.items()
+                if lab_id not in self._features or self._features[lab_id].updated_at != updated_at
+            ]
+            removed_ids = [lab_id for lab_id in self._features if lab_id not in stamps]
+
+            for start in range(0, len(stale_ids), _FETCH_CHUNK_SIZE):
+                chunk = stale_ids[start:start + _FETCH_CHUNK_SIZE]
+                for lab in db.query(ResearchLab).filter(ResearchLab.lab_id.in_(chunk)).all():
+                    self._features[lab.lab_id] = LabFeatures(lab)
+
+            for lab_id in removed_ids:
+                del self._features[lab_id]
+
+            if stale_ids or removed_ids:
+                self.version += 1
+
+            if self._snapshot is None or self._snapshot.version != self.version:
+                self._snapshot = CatalogSnapshot(
+                    self.version,
+                    [self._features[lab_id] for lab_id in sorted(stamps) if lab_id in self._features],
+                    _catalog_fingerprint(stamps)
+                )
+            return self._snapshot
+
+    def invalidate(self, lab_id: Optional[int] = None) -> None:
+        """특정 연구실(또는 전체)의 캐시된 특징 제거"""
+        with self._lock:
+            if lab_id is None:
+                self._features.clear()
+            else:
+                self._features.pop(lab_id, None)
+            self.version += 1
+
+
+# 애플리케이션 전역 인덱스
+lab_feature_index = LabFeatureIndex()
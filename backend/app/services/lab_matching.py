@@ -1,50 +1,61 @@
 # backend/app/services/lab_matching.py
-import json
-import re
-from typing import List, Dict, Tuple
+import heapq
+from typing import List, Dict, NamedTuple, Optional, Tuple, Union
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
 
-from app.models.research_lab import ResearchLab, Professor, Department, ProjectLabMatching
+from app.models.research_lab import ResearchLab, ProjectLabMatching, ProjectMatchingRun
 from app.models.project import Project
 from app.schemas.research_lab import ProjectMatchingRequest, ProjectLabMatchingCreate
+from app.services.lab_index import (
+    CatalogSnapshot, LabFeatures, ProjectFeatures, lab_feature_index, matching_fingerprint,
+    SERVICE_KEYWORDS, SERVICE_TECHS, KEYWORD_CONCEPTS,
+    TECH_SYNONYMS, INDUSTRY_SYNONYMS
+)
+from app.services.lab_repository import LabRepository
+from app.services.lab_scoring import get_batch_scorer
+from app.services.recommendation_cache import recommendation_cache
+from app.services.text_index import DescriptionIndex, get_description_index
+
+# 매칭 결과 저장 시 한 번에 조회/삭제할 ID 수 (SQLite IN 절 변수 제한 고려)
+_WRITE_CHUNK_SIZE = 500
+
+
+class MatchingRun(NamedTuple):
+    """저장할 매칭 결과를 계산한 조건 (전체 카탈로그에서 상위 max_results개, min_score 이상)
+
+    fingerprints 는 project_id -> matching_fingerprint 이며, 추천 API 는 지문과 조건이
+    맞을 때만 저장된 결과를 다시 계산하지 않고 사용합니다.
+    """
+    fingerprints: Dict[int, str]
+    max_results: int
+    min_score: float
+
+    @classmethod
+    def of(cls, projects: List[ProjectFeatures], catalog: CatalogSnapshot, max_results: int, min_score: float) -> "MatchingRun":
+        return cls(
+            {project.project_id: matching_fingerprint(project.fingerprint, catalog) for project in projects},
+            max_results, min_score
+        )
 
 class LabMatchingService:
     """연구실-프로젝트 매칭 서비스"""
     
+    # 동의어 사전 (매칭 오토마톤에 컴파일되어 점수 계산에 사용됨)
+    tech_mapping = TECH_SYNONYMS
+    industry_mapping = INDUSTRY_SYNONYMS
+    
     def __init__(self, db: Session):
         self.db = db
-        
-        # 기술 스택 매핑 (프로젝트에서 사용하는 용어 -> 연구실 기술스택)
-        self.tech_mapping = {
-            'ai': ['AI', 'Machine Learning', 'Deep Learning', '인공지능', '머신러닝', '딥러닝'],
-            'ml': ['Machine Learning', 'AI', 'Deep Learning', '머신러닝', '인공지능'],
-            'web': ['Web', 'Frontend', 'Backend', '웹개발', 'JavaScript', 'React', 'Node.js'],
-            'app': ['Mobile', 'Android', 'iOS', 'React Native', 'Flutter', '모바일'],
-            'data': ['Data Science', 'Big Data', 'Analytics', '데이터사이언스', '빅데이터'],
-            'iot': ['IoT', 'Internet of Things', 'Sensor', '사물인터넷', '센서'],
-            'blockchain': ['Blockchain', 'Cryptocurrency', '블록체인'],
-            'ar': ['AR', 'Augmented Reality', '증강현실'],
-            'vr': ['VR', 'Virtual Reality', '가상현실'],
-            'cv': ['Computer Vision', 'Image Processing', '컴퓨터비전', '영상처리'],
-            'nlp': ['NLP', 'Natural Language Processing', '자연어처리'],
-            'robotics': ['Robotics', 'Robot', '로봇', '로보틱스'],
-            'security': ['Security', 'Cybersecurity', '보안', '사이버보안']
-        }
-        
-        # 산업별 연구 분야 매핑
-        self.industry_mapping = {
-            'healthcare': ['의료', '헬스케어', 'Medical', 'Biomedical', '바이오메디컬'],
-            'automotive': ['자동차', '자율주행', 'Automotive', 'Autonomous Vehicle'],
-            'fintech': ['금융', 'FinTech', '블록체인', 'Blockchain'],
-            'education': ['교육', 'Education', 'EdTech', '학습'],
-            'entertainment': ['엔터테인먼트', 'Entertainment', '게임', 'Game'],
-            'environment': ['환경', 'Environment', '기후', 'Climate'],
-            'manufacturing': ['제조', 'Manufacturing', '산업', 'Industrial']
-        }
+        self._description_index = None
 
-    def calculate_similarity_score(self, project: Project, lab: ResearchLab) -> Tuple[float, Dict]:
+    def calculate_similarity_score(self, project: Union[Project, ProjectFeatures], lab: Union[ResearchLab, LabFeatures]) -> Tuple[float, Dict]:
         """프로젝트와 연구실 간의 유사도 점수 계산"""
+        if isinstance(project, Project):
+            project = ProjectFeatures(project)
+        if isinstance(lab, ResearchLab):
+            lab = LabFeatures(lab)
+        
         scores = {}
         factors = {}
         
@@ -82,180 +93,303 @@ class LabMatchingService:
             'total_score': total_score
         }
 
-    def _calculate_service_type_score(self, project: Project, lab: ResearchLab) -> float:
+    def _calculate_service_type_score(self, project: ProjectFeatures, lab: LabFeatures) -> float:
         """서비스 타입 기반 점수 계산"""
-        service_keywords = {
-            'APP': ['모바일', 'Mobile', 'Android', 'iOS', 'App'],
-            'WEB': ['웹', 'Web', 'Frontend', 'Backend', '웹개발'],
-            'AI': ['AI', '인공지능', 'Machine Learning', '머신러닝', '딥러닝']
-        }
-        
-        project_keywords = service_keywords.get(project.service_type, [])
-        lab_keywords = lab.keywords.lower() if lab.keywords else ""
-        lab_research = lab.research_areas.lower() if lab.research_areas else ""
+        project_keywords = SERVICE_KEYWORDS.get(project.service_type, [])
         
-        matches = 0
-        for keyword in project_keywords:
-            if keyword.lower() in lab_keywords or keyword.lower() in lab_research:
-                matches += 1
+        matches = sum(1 for keyword in project_keywords if keyword.lower() in lab.service_terms)
         
-        return min(matches / len(project_keywords) if project_keywords else 0, 1.0)
+        return min(matches / len(project_keywords) if project_keywords else 0.0, 1.0)
 
-    def _calculate_tech_stack_score(self, project: Project, lab: ResearchLab) -> float:
+    def _calculate_tech_stack_score(self, project: ProjectFeatures, lab: LabFeatures) -> float:
         """기술 스택 기반 점수 계산"""
-        if not lab.tech_stack:
+        if not lab.tech_terms:
             return 0.0
         
-        try:
-            lab_tech = json.loads(lab.tech_stack)
-            lab_tech_str = " ".join(lab_tech).lower()
-        except:
-            lab_tech_str = lab.tech_stack.lower()
+        # 프로젝트 타입에 따른 기술 매칭 (동의어 포함)
+        project_techs = SERVICE_TECHS.get(project.service_type, [])
         
-        # 프로젝트 타입에 따른 기술 매칭
-        project_techs = []
-        if project.service_type == 'APP':
-            project_techs = ['mobile', 'android', 'ios', 'react native', 'flutter']
-        elif project.service_type == 'WEB':
-            project_techs = ['web', 'javascript', 'react', 'vue', 'python', 'node.js']
-        elif project.service_type == 'AI':
-            project_techs = ['python', 'tensorflow', 'pytorch', 'ai', 'ml']
-        
-        matches = sum(1 for tech in project_techs if tech in lab_tech_str)
-        return min(matches / len(project_techs) if project_techs else 0, 1.0)
+        matches = sum(1 for tech in project_techs if tech in lab.tech_terms)
+        return min(matches / len(project_techs) if project_techs else 0.0, 1.0)
 
-    def _calculate_keyword_score(self, project: Project, lab: ResearchLab) -> float:
+    def _calculate_keyword_score(self, project: ProjectFeatures, lab: LabFeatures) -> float:
         """키워드 기반 점수 계산"""
-        project_desc = (project.description + " " + (project.idea_name or "")).lower()
-        lab_keywords = (lab.keywords or "").lower()
-        
-        # 공통 키워드 추출
-        common_words = [
-            'ai', '인공지능', 'ml', '머신러닝', 'data', '데이터', 'web', '웹',
-            'mobile', '모바일', 'app', '앱', 'iot', '사물인터넷', 'security', '보안',
-            'robot', '로봇', 'vision', '비전', 'nlp', '자연어'
-        ]
-        
         matches = 0
         total_keywords = 0
         
-        for word in common_words:
-            if word in project_desc:
+        # 공통 키워드 및 산업 분야 개념 (동의어 포함)
+        for concept in KEYWORD_CONCEPTS:
+            if concept in project.keyword_terms:
                 total_keywords += 1
-                if word in lab_keywords:
+                if concept in lab.keyword_terms:
                     matches += 1
         
         return matches / total_keywords if total_keywords > 0 else 0.0
 
-    def _calculate_description_score(self, project: Project, lab: ResearchLab) -> float:
-        """설명 유사도 기반 점수 계산"""
-        project_text = (project.description + " " + (project.idea_name or "")).lower()
-        lab_text = ((lab.description or "") + " " + (lab.keywords or "")).lower()
+    def _calculate_description_score(self, project: ProjectFeatures, lab: LabFeatures) -> float:
+        """설명 유사도 기반 점수 계산 (한글 n-gram TF-IDF 코사인 유사도)"""
+        index = self._get_description_index()
+        query = project.description_query(index)
+        if not query:
+            return 0.0
         
-        # 간단한 단어 기반 유사도 계산
-        project_words = set(re.findall(r'\w+', project_text))
-        lab_words = set(re.findall(r'\w+', lab_text))
+        document = index.document_vector(lab.lab_id, lab.description_terms)
+        return index.similarity(query, document)
+
+    def _get_description_index(self) -> DescriptionIndex:
+        """현재 연구실 카탈로그의 설명 색인"""
+        if self._description_index is None:
+            self._description_index = get_description_index(lab_feature_index.refresh(self.db))
+        return self._description_index
+
+    @staticmethod
+    def _total_score(scores: Dict[str, float]) -> float:
+        """항목별 점수의 가중합 (서비스 타입 30%, 기술 스택 25%, 키워드 25%, 설명 20%)"""
+        return (
+            scores['service_type'] * 0.3 +
+            scores['tech_stack'] * 0.25 +
+            scores['keywords'] * 0.25 +
+            scores['description'] * 0.2
+        )
+
+    def _build_details(self, project: ProjectFeatures, scores: Dict[str, float]) -> Tuple[float, Dict]:
+        """항목별 점수로 calculate_similarity_score와 같은 형태의 상세 정보 구성"""
+        total_score = self._total_score(scores)
+        factors = {
+            'service_type': f"서비스 타입: {project.service_type}",
+            'tech_stack': "기술 스택 관련성",
+            'keywords': "연구 분야 키워드 매칭",
+            'description': "프로젝트-연구실 설명 유사도"
+        }
+        return total_score, {
+            'scores': scores,
+            'factors': factors,
+            'total_score': total_score
+        }
+
+    def top_matches(self, project: ProjectFeatures, catalog: CatalogSnapshot, k: int, min_score: float) -> List[Tuple[LabFeatures, float, Dict]]:
+        """min_score 이상인 상위 k개 연구실 (점수 내림차순, 동점이면 카탈로그 순서)
+
+        모든 연구실의 네 항목 점수를 한 번에 계산한 뒤 상위 k개만 골라 상세 정보를 구성합니다.
+        numpy가 있으면 카탈로그 행렬 연산으로, 없으면 연구실별 키워드 점수와
+        TF-IDF 포스팅 리스트 한 번 순회로 설명 점수를 구하고 힙으로 고릅니다.
+        """
+        labs = catalog.labs
+        if k <= 0 or not labs:
+            return []
         
-        if not project_words or not lab_words:
-            return 0.0
+        index = get_description_index(catalog)
+        self._description_index = index
+        query = project.description_query(index)
         
-        intersection = project_words.intersection(lab_words)
-        union = project_words.union(lab_words)
+        scorer = get_batch_scorer(catalog)
+        if scorer is not None:
+            total, components = scorer.score(project, query)
+            rows = scorer.top_rows(total, k, min_score)
+            columns = {name: values[rows].tolist() for name, values in components.items()}
+            winners = []
+            for position, row in enumerate(rows):
+                score, details = self._build_details(project, {name: values[position] for name, values in columns.items()})
+                winners.append((labs[row], score, details))
+            return winners
         
-        return len(intersection) / len(union) if union else 0.0
+        description_scores = index.score_all(query)
+        partial_scores = [
+            {
+                'service_type': self._calculate_service_type_score(project, lab),
+                'tech_stack': self._calculate_tech_stack_score(project, lab),
+                'keywords': self._calculate_keyword_score(project, lab),
+                'description': description_scores.get(lab.lab_id, 0.0)
+            }
+            for lab in labs
+        ]
+        totals = [self._total_score(scores) for scores in partial_scores]
+        rows = heapq.nsmallest(
+            k, (row for row, total in enumerate(totals) if total >= min_score),
+            key=lambda row: (-totals[row], row)
+        )
+        
+        winners = []
+        for row in rows:
+            score, details = self._build_details(project, partial_scores[row])
+            winners.append((labs[row], score, details))
+        return winners
 
-    def find_matching_labs(self, request: ProjectMatchingRequest) -> List[Dict]:
+    def match_and_save(self, request: ProjectMatchingRequest) -> List[Dict]:
+        """매칭 후 결과를 계산 조건(지문, 상위 개수, 최소 점수)과 함께 저장"""
+        catalog = lab_feature_index.refresh(self.db)
+        matches = self.find_matching_labs(request, catalog)
+        
+        project = self.db.get(Project, request.project_id)
+        if project is not None:
+            run = MatchingRun.of([ProjectFeatures(project)], catalog, request.max_results, request.min_score)
+            self.save_matching_results(request.project_id, matches, run)
+        return matches
+
+    def find_matching_labs(self, request: ProjectMatchingRequest, catalog: Optional[CatalogSnapshot] = None) -> List[Dict]:
         """프로젝트에 매칭되는 연구실 찾기"""
         # 프로젝트 조회
         project = self.db.query(Project).filter(Project.project_id == request.project_id).first()
         if not project:
             return []
         
-        # 활성 연구실 조회
-        labs = self.db.query(ResearchLab).filter(ResearchLab.is_active == True).all()
+        # 활성 연구실 특징 (변경된 연구실만 재계산)
+        if catalog is None:
+            catalog = lab_feature_index.refresh(self.db)
+        project_features = ProjectFeatures(project)
+        
+        # 상위 max_results개만 계산 (점수 내림차순)
+        winners = self.top_matches(project_features, catalog, request.max_results, request.min_score)
+        
+        # 선정된 연구실의 교수 및 학과 정보를 한 번에 조회
+        contacts = LabRepository(self.db).get_contacts(lab.lab_id for lab, _, _ in winners)
         
         matches = []
-        for lab in labs:
-            score, details = self.calculate_similarity_score(project, lab)
+        for lab, score, details in winners:
+            contact = contacts.get(lab.lab_id)
+            has_director = contact is not None and contact.director_id is not None
             
-            if score >= request.min_score:
-                # 교수 및 학과 정보 조회
-                professor = self.db.query(Professor).filter(Professor.professor_id == lab.director_id).first()
-                department = None
-                if professor:
-                    department = self.db.query(Department).filter(Department.department_id == professor.department_id).first()
-                
-                match_data = {
-                    'lab_id': lab.lab_id,
-                    'lab_name': lab.name,
-                    'lab_name_en': lab.name_en,
-                    'location': lab.location,
-                    'director_name': professor.name if professor else None,
-                    'department_name': department.name if department else None,
-                    'research_areas': lab.research_areas,
-                    'description': lab.description,
-                    'similarity_score': score,
-                    'matching_details': details,
-                    'contact_info': {
-                        'email': professor.email if professor else lab.email,
-                        'phone': professor.phone if professor else lab.phone
-                    }
+            match_data = {
+                'lab_id': lab.lab_id,
+                'lab_name': lab.name,
+                'lab_name_en': lab.name_en,
+                'location': lab.location,
+                'director_name': contact.director_name if has_director else None,
+                'department_name': contact.department_name if has_director else None,
+                'research_areas': lab.research_areas,
+                'description': lab.description,
+                'similarity_score': score,
+                'matching_details': details,
+                'contact_info': {
+                    'email': contact.director_email if has_director else lab.email,
+                    'phone': contact.director_phone if has_director else lab.phone
                 }
-                matches.append(match_data)
+            }
+            matches.append(match_data)
         
-        # 점수 순으로 정렬
-        matches.sort(key=lambda x: x['similarity_score'], reverse=True)
-        
-        # 최대 결과 수 제한
-        return matches[:request.max_results]
+        return matches
+
+    def save_matching_results(self, project_id: int, matches: List[Dict], run: Optional[MatchingRun] = None) -> None:
+        """매칭 결과를 데이터베이스에 저장 (기존 결과와 비교해 변경분만 반영)"""
+        self.save_batch_results({project_id: matches}, run)
 
-    def save_matching_results(self, project_id: int, matches: List[Dict]) -> None:
-        """매칭 결과를 데이터베이스에 저장"""
-        # 기존 매칭 결과 삭제
-        self.db.query(ProjectLabMatching).filter(
-            ProjectLabMatching.project_id == project_id
-        ).delete()
+    def save_batch_results(self, results: Dict[int, List[Dict]], run: Optional[MatchingRun] = None) -> None:
+        """여러 프로젝트의 매칭 결과를 한 트랜잭션으로 저장
+
+        - 이미 있는 연구실: 점수/매칭 요소만 갱신 (사용자가 바꾼 status와 메모는 유지)
+        - 새 연구실: SUGGESTED 상태로 일괄 삽입
+        - 더 이상 매칭되지 않는 연구실: SUGGESTED 상태인 것만 삭제
+        
+        run 이 있으면 (전체 카탈로그에서 다시 계산한 결과) 행마다 지문을 남기고
+        프로젝트별 실행 조건을 기록합니다. 일부 연구실만 다시 계산한 결과는 run 없이 저장합니다.
+        """
+        existing: Dict[int, Dict[int, object]] = {}
+        project_ids = list(results)
+        for start in range(0, len(project_ids), _WRITE_CHUNK_SIZE):
+            rows = self.db.query(
+                ProjectLabMatching.matching_id, ProjectLabMatching.project_id,
+                ProjectLabMatching.lab_id, ProjectLabMatching.status,
+                ProjectLabMatching.similarity_score, ProjectLabMatching.matching_factors,
+                ProjectLabMatching.match_fingerprint
+            ).filter(
+                ProjectLabMatching.project_id.in_(project_ids[start:start + _WRITE_CHUNK_SIZE])
+            ).all()
+            for row in rows:
+                existing.setdefault(row.project_id, {})[row.lab_id] = row
         
-        # 새로운 매칭 결과 저장
-        for match in matches:
-            matching_record = ProjectLabMatching(
-                project_id=project_id,
-                lab_id=match['lab_id'],
-                similarity_score=match['similarity_score'],
-                matching_reason=f"유사도 점수: {match['similarity_score']:.2f}",
-                matching_factors=json.dumps(match['matching_details'], ensure_ascii=False),
-                status="SUGGESTED"
+        new_rows = []
+        updated_rows = []
+        stale_ids = []
+        for project_id, matches in results.items():
+            stored = existing.get(project_id, {})
+            fingerprint = run.fingerprints.get(project_id) if run else None
+            for match in matches:
+                matching_factors = match['matching_details']
+                current = stored.get(match['lab_id'])
+                
+                if current is None:
+                    new_rows.append({
+                        'project_id': project_id,
+                        'lab_id': match['lab_id'],
+                        'similarity_score': match['similarity_score'],
+                        'matching_reason': f"유사도 점수: {match['similarity_score']:.2f}",
+                        'matching_factors': matching_factors,
+                        'match_fingerprint': fingerprint,
+                        'status': "SUGGESTED"
+                    })
+                elif (
+                    current.similarity_score != match['similarity_score']
+                    or current.matching_factors != matching_factors
+                    or (fingerprint is not None and current.match_fingerprint != fingerprint)
+                ):
+                    updated = {
+                        'matching_id': current.matching_id,
+                        'similarity_score': match['similarity_score'],
+                        'matching_factors': matching_factors
+                    }
+                    if fingerprint is not None:
+                        updated['match_fingerprint'] = fingerprint
+                    # 사용자가 상태를 바꾼 매칭은 메모가 붙어 있을 수 있으므로 근거 문구를 덮어쓰지 않음
+                    if current.status == "SUGGESTED":
+                        updated['matching_reason'] = f"유사도 점수: {match['similarity_score']:.2f}"
+                    updated_rows.append(updated)
+            
+            matched_lab_ids = {match['lab_id'] for match in matches}
+            stale_ids.extend(
+                row.matching_id for lab_id, row in stored.items()
+                if lab_id not in matched_lab_ids and row.status == "SUGGESTED"
             )
-            self.db.add(matching_record)
+        
+        for start in range(0, len(stale_ids), _WRITE_CHUNK_SIZE):
+            self.db.query(ProjectLabMatching).filter(
+                ProjectLabMatching.matching_id.in_(stale_ids[start:start + _WRITE_CHUNK_SIZE])
+            ).delete(synchronize_session=False)
+        if updated_rows:
+            self.db.bulk_update_mappings(ProjectLabMatching, updated_rows)
+        if new_rows:
+            self.db.bulk_insert_mappings(ProjectLabMatching, new_rows)
+        if run is not None:
+            self._record_runs(project_ids, run)
         
         self.db.commit()
+        
+        # 저장된 매칭으로 만든 추천은 더 이상 유효하지 않음
+        for project_id in results:
+            recommendation_cache.invalidate_project(project_id)
+
+    def _record_runs(self, project_ids: List[int], run: MatchingRun) -> None:
+        """프로젝트별 마지막 전체 매칭 조건 교체"""
+        for start in range(0, len(project_ids), _WRITE_CHUNK_SIZE):
+            self.db.query(ProjectMatchingRun).filter(
+                ProjectMatchingRun.project_id.in_(project_ids[start:start + _WRITE_CHUNK_SIZE])
+            ).delete(synchronize_session=False)
+        self.db.bulk_insert_mappings(ProjectMatchingRun, [
+            {
+                'project_id': project_id,
+                'match_fingerprint': run.fingerprints[project_id],
+                'max_results': run.max_results,
+                'min_score': run.min_score
+            }
+            for project_id in project_ids if project_id in run.fingerprints
+        ])
 
     def get_project_matching_history(self, project_id: int) -> List[Dict]:
         """프로젝트의 매칭 이력 조회"""
-        matchings = self.db.query(ProjectLabMatching).filter(
-            ProjectLabMatching.project_id == project_id
-        ).order_by(ProjectLabMatching.similarity_score.desc()).all()
+        matchings = LabRepository(self.db).get_matching_history(project_id)
         
         results = []
         for matching in matchings:
-            lab = self.db.query(ResearchLab).filter(ResearchLab.lab_id == matching.lab_id).first()
-            if lab:
-                professor = self.db.query(Professor).filter(Professor.professor_id == lab.director_id).first()
-                department = None
-                if professor:
-                    department = self.db.query(Department).filter(Department.department_id == professor.department_id).first()
-                
-                result = {
-                    'matching_id': matching.matching_id,
-                    'lab_id': lab.lab_id,
-                    'lab_name': lab.name,
-                    'director_name': professor.name if professor else None,
-                    'department_name': department.name if department else None,
-                    'similarity_score': matching.similarity_score,
-                    'status': matching.status,
-                    'created_at': matching.created_at,
-                    'matching_factors': json.loads(matching.matching_factors) if matching.matching_factors else {}
-                }
-                results.append(result)
+            result = {
+                'matching_id': matching.matching_id,
+                'lab_id': matching.lab_id,
+                'lab_name': matching.lab_name,
+                'director_name': matching.director_name,
+                'department_name': matching.department_name,
+                'similarity_score': matching.similarity_score,
+                'status': matching.status,
+                'created_at': matching.created_at,
+                'matching_factors': matching.matching_factors or {}
+            }
+            results.append(result)
         
-        return results
\ No newline at end of file
+        return results
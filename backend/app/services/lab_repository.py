@@ -0,0 +1,223 @@
+# backend/app/services/lab_repository.py
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+from sqlalchemy import column, func, literal_column, null, or_, table
+from sqlalchemy.orm import Query, Session
+
+from app.models.research_lab import ResearchLab, Professor, Department, ProjectLabMatching, ProjectMatchingRun
+
+# 연구실 전문 검색 색인 (SQLite FTS5, trigram 토크나이저)
+research_labs_fts = table("research_labs_fts", column("rowid"))
+_FTS = literal_column("research_labs_fts")
+_FTS_TOKEN = re.compile(r"\w+")
+# trigram 색인으로 MATCH 할 수 있는 최소 글자 수 (더 짧은 단어는 LIKE)
+_TRIGRAM = 3
+
+
+class FullTextSearch(NamedTuple):
+    """FTS5 색인 검색 조건
+
+    match: 세 글자 이상 단어의 MATCH 식 (없으면 None, 이때는 관련도 정렬/snippet 불가)
+    likes: 세 글자 미만 단어의 LIKE 조건 (같은 trigram 색인 테이블의 컬럼에 적용)
+    """
+    match: Optional[str]
+    likes: List[object]
+
+
+def _fts_like(token: str, columns: Sequence[str]):
+    # 단어 문자만 오므로 LIKE 특수 문자는 "_" 뿐 (ESCAPE 가 없어야 trigram 색인이 LIKE 를 처리)
+    escape = "\\" if "_" in token else None
+    pattern = "%" + token.replace("_", "\\_") + "%"
+    return or_(*(literal_column(f"research_labs_fts.{name}").like(pattern, escape=escape) for name in columns))
+
+
+def fts_match(search: str, columns: Sequence[str]) -> Optional[FullTextSearch]:
+    """검색어를 FTS5 검색 조건으로 변환 (단어마다 부분 문자열 검색, 모든 단어가 포함되어야 일치)"""
+    tokens = _FTS_TOKEN.findall(search or "")
+    if not tokens:
+        return None
+    phrases = " AND ".join(f'"{token}"' for token in tokens if len(token) >= _TRIGRAM)
+    return FullTextSearch(
+        f"{{{' '.join(columns)}}} : ({phrases})" if phrases else None,
+        [_fts_like(token, columns) for token in tokens if len(token) < _TRIGRAM]
+    )
+
+
+class LabRepository:
+    """연구실 + 지도교수 + 학과를 한 번의 조인 쿼리로 읽어오는 저장소
+
+    라우터와 매칭 서비스가 연구실마다 Professor / Department를 따로 조회하던
+    N+1 쿼리를 없애기 위해, 각 화면에 필요한 컬럼만 골라 조인 결과로 반환합니다.
+    """
+
+    # 연구실 목록 화면에 필요한 컬럼
+    LIST_COLUMNS = (
+        ResearchLab.lab_id, ResearchLab.name, ResearchLab.name_en,
+        ResearchLab.location, ResearchLab.phone, ResearchLab.email, ResearchLab.website,
+        ResearchLab.research_areas, ResearchLab.keywords, ResearchLab.description,
+        ResearchLab.tech_stack, ResearchLab.created_at, ResearchLab.updated_at,
+        Professor.name.label('director_name'),
+        Department.name.label('department_name')
+    )
+
+    # 연구실 상세 화면에 필요한 컬럼
+    DETAIL_COLUMNS = LIST_COLUMNS + (
+        ResearchLab.collaboration_history, ResearchLab.recent_projects,
+        Professor.professor_id.label('director_id'),
+        Professor.position.label('director_position'),
+        Professor.email.label('director_email'),
+        Professor.office_location.label('director_office_location'),
+        Professor.research_fields.label('director_research_fields'),
+        Department.department_id.label('department_id'),
+        Department.name_en.label('department_name_en'),
+        Department.college.label('department_college'),
+        Department.building.label('department_building')
+    )
+
+    # 매칭 결과에 붙일 연락처 컬럼
+    CONTACT_COLUMNS = (
+        ResearchLab.lab_id,
+        Professor.professor_id.label('director_id'),
+        Professor.name.label('director_name'),
+        Professor.email.label('director_email'),
+        Professor.phone.label('director_phone'),
+        Department.name.label('department_name')
+    )
+
+    # 매칭 이력 화면에 필요한 컬럼
+    HISTORY_COLUMNS = (
+        ProjectLabMatching.matching_id, ProjectLabMatching.similarity_score,
+        ProjectLabMatching.status, ProjectLabMatching.created_at,
+        ProjectLabMatching.matching_factors,
+        ResearchLab.lab_id, ResearchLab.name.label('lab_name'),
+        Professor.name.label('director_name'),
+        Department.name.label('department_name')
+    )
+
+    # 저장된 매칭으로 추천 목록을 구성할 때 필요한 컬럼
+    RECOMMENDATION_COLUMNS = (
+        ProjectLabMatching.similarity_score,
+        ResearchLab.lab_id, ResearchLab.name.label('lab_name'),
+        ResearchLab.research_areas, ResearchLab.email, ResearchLab.phone,
+        Professor.professor_id.label('director_id'),
+        Professor.name.label('director_name'),
+        Professor.email.label('director_email'),
+        Professor.phone.label('director_phone'),
+        Department.name.label('department_name')
+    )
+
+    # 검색어별 FTS 대상 컬럼 (기존 ilike 검색과 같은 범위)
+    KEYWORD_FTS_COLUMNS = ("name", "description", "keywords")
+    AREA_FTS_COLUMNS = ("research_areas", "keywords")
+    # bm25 컬럼 가중치 (색인 컬럼 순서: name, name_en, description, keywords, research_areas, tech_stack)
+    FTS_WEIGHTS = (10.0, 5.0, 1.0, 4.0, 4.0, 2.0)
+    # 검색 관련도 (작을수록 관련도 높음)
+    FTS_RANK = func.bm25(_FTS, *FTS_WEIGHTS)
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @staticmethod
+    def _with_director(query: Query) -> Query:
+        """연구실에 지도교수와 학과를 외부 조인 (교수 정보가 없어도 연구실은 유지)"""
+        return query.outerjoin(
+            Professor, ResearchLab.director_id == Professor.professor_id
+        ).outerjoin(
+            Department, Professor.department_id == Department.department_id
+        )
+
+    def active_labs_query(self) -> Query:
+        """활성 연구실 목록 조회 쿼리 (필터/정렬은 호출하는 쪽에서 추가)"""
+        query = self.db.query(*self.LIST_COLUMNS).select_from(ResearchLab)
+        return self._with_director(query).filter(ResearchLab.is_active == True)
+
+    def full_text_match(self, keyword: Optional[str] = None, research_area: Optional[str] = None) -> Optional[FullTextSearch]:
+        """키워드/연구분야 검색을 하나의 FTS5 검색 조건으로 (SQLite가 아니거나 검색어가 없으면 None)"""
+        if self.db.get_bind().dialect.name != "sqlite":
+            return None
+        clauses = [
+            fts_match(keyword, self.KEYWORD_FTS_COLUMNS) if keyword else None,
+            fts_match(research_area, self.AREA_FTS_COLUMNS) if research_area else None
+        ]
+        if (keyword and clauses[0] is None) or (research_area and clauses[1] is None):
+            # 단어가 없는 검색어(기호만 입력 등)는 ilike 검색으로 처리
+            return None
+        clauses = [clause for clause in clauses if clause]
+        if not clauses:
+            return None
+        matches = [clause.match for clause in clauses if clause.match]
+        return FullTextSearch(
+            " AND ".join(matches) if matches else None,
+            [like for clause in clauses for like in clause.likes]
+        )
+
+    def search_labs_query(self, search: FullTextSearch) -> Query:
+        """FTS5 색인으로 찾은 활성 연구실
+
+        MATCH 식이 있으면 bm25 관련도순이고 일치 부분을 강조한 snippet 을 포함합니다.
+        두 글자 이하 단어만 있으면 LIKE 조건만으로 찾으므로 정렬은 호출하는 쪽에서 정합니다.
+        """
+        snippet = func.snippet(_FTS, -1, "<mark>", "</mark>", "…", 16) if search.match else null()
+        query = self.db.query(
+            *self.LIST_COLUMNS, snippet.label('snippet')
+        ).select_from(research_labs_fts).join(
+            ResearchLab, ResearchLab.lab_id == research_labs_fts.c.rowid
+        )
+        query = self._with_director(query).filter(ResearchLab.is_active == True, *search.likes)
+        if search.match:
+            query = query.filter(_FTS.op("MATCH")(search.match)).order_by(self.FTS_RANK)
+        return query
+
+    def get_lab_detail(self, lab_id: int):
+        """활성 연구실 상세 정보 (없으면 None)"""
+        query = self.db.query(*self.DETAIL_COLUMNS).select_from(ResearchLab)
+        return self._with_director(query).filter(
+            ResearchLab.lab_id == lab_id,
+            ResearchLab.is_active == True
+        ).first()
+
+    def get_contacts(self, lab_ids: Iterable[int]) -> Dict[int, object]:
+        """연구실별 지도교수/학과 연락처 (lab_id -> row)"""
+        lab_ids = list(lab_ids)
+        if not lab_ids:
+            return {}
+        query = self.db.query(*self.CONTACT_COLUMNS).select_from(ResearchLab)
+        rows = self._with_director(query).filter(ResearchLab.lab_id.in_(lab_ids)).all()
+        return {row.lab_id: row for row in rows}
+
+    def get_matching_history(self, project_id: int) -> List[object]:
+        """프로젝트의 매칭 이력 (유사도 내림차순)"""
+        query = self.db.query(*self.HISTORY_COLUMNS).select_from(ProjectLabMatching).join(
+            ResearchLab, ProjectLabMatching.lab_id == ResearchLab.lab_id
+        )
+        return self._with_director(query).filter(
+            ProjectLabMatching.project_id == project_id
+        ).order_by(ProjectLabMatching.similarity_score.desc()).all()
+
+    def get_stored_recommendations(self, project_id: int, limit: int, min_score: float, fingerprint: str) -> Optional[List[object]]:
+        """미리 계산해 둔 매칭 결과 중 활성 연구실 상위 limit개 (유사도 내림차순)
+
+        마지막 전체 매칭이 같은 지문(프로젝트 + 카탈로그)으로 계산되었고, 다시 계산한
+        결과와 같은 목록이 보장될 때만 반환합니다. 그렇지 않으면 None (다시 계산 필요).
+        """
+        run = self.db.get(ProjectMatchingRun, project_id)
+        if run is None or run.match_fingerprint != fingerprint or run.max_results < limit:
+            return None
+        
+        query = self.db.query(*self.RECOMMENDATION_COLUMNS).select_from(ProjectLabMatching).join(
+            ResearchLab, ProjectLabMatching.lab_id == ResearchLab.lab_id
+        )
+        rows = self._with_director(query).filter(
+            ProjectLabMatching.project_id == project_id,
+            ProjectLabMatching.match_fingerprint == fingerprint,
+            ProjectLabMatching.similarity_score >= min_score,
+            ResearchLab.is_active == True
+        ).order_by(
+            ProjectLabMatching.similarity_score.desc(), ResearchLab.lab_id
+        ).limit(limit).all()
+        
+        # 저장할 때보다 낮은 점수까지 요청했는데 limit개를 못 채우면 저장되지 않은 연구실이 있을 수 있음
+        if len(rows) < limit and run.min_score > min_score:
+            return None
+        return rows
@@ -0,0 +1,151 @@
+# backend/app/services/lab_scoring.py
+import threading
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 연구실별 점수 계산으로 대체
+    np = None
+
+from app.services.lab_index import (
+    CatalogSnapshot, LabFeatures, ProjectFeatures,
+    SERVICE_KEYWORDS, SERVICE_TECHS, KEYWORD_CONCEPTS
+)
+from app.services.text_index import DescriptionIndex, get_description_index
+
+
+def _unique(terms: List[str]) -> List[str]:
+    return list(dict.fromkeys(terms))
+
+
+class BatchLabScorer:
+    """연구실 카탈로그 전체를 행렬로 인코딩한 일괄 점수 계산기
+
+    각 연구실은 한 행이 되고, 프로젝트는 질의 벡터로 변환되어
+    네 항목 점수와 가중합을 몇 번의 배열 연산으로 한꺼번에 계산합니다.
+    키워드 기반 세 점수는 정수 개수로 나눗셈을 하므로 연구실별 계산과 같은 값을 내고,
+    설명 점수는 연구실×단어 TF-IDF 희소 행렬과 질의 벡터의 곱 한 번으로 구합니다.
+    """
+
+    def __init__(self, labs: List[LabFeatures], description_index: DescriptionIndex):
+        self.labs = labs
+        n_labs = len(labs)
+
+        # 1. 서비스 타입 키워드 적중 행렬
+        self.service_terms = _unique([kw.lower() for kws in SERVICE_KEYWORDS.values() for kw in kws])
+        self.service_hits = np.array([
+            [term in lab.service_terms for term in self.service_terms]
+            for lab in labs
+        ], dtype=np.int32).reshape(n_labs, len(self.service_terms))
+
+        # 2. 기술 스택 적중 행렬
+        self.tech_terms = _unique([tech for techs in SERVICE_TECHS.values() for tech in techs])
+        self.tech_hits = np.array([
+            [term in lab.tech_terms for term in self.tech_terms]
+            for lab in labs
+        ], dtype=np.int32).reshape(n_labs, len(self.tech_terms))
+
+        # 3. 공통 키워드 / 산업 분야 개념 적중 행렬
+        self.keyword_hits = np.array([
+            [concept in lab.keyword_terms for concept in KEYWORD_CONCEPTS]
+            for lab in labs
+        ], dtype=np.int32).reshape(n_labs, len(KEYWORD_CONCEPTS))
+
+        # 4. 설명 TF-IDF 희소 행렬 (연구실×단어, 단어 열 단위 CSC: 열마다 연속된 행 번호/가중치 구간)
+        term_entries: Dict[str, List[Tuple[int, float]]] = {}
+        for row, lab in enumerate(labs):
+            vector = description_index.document_vector(lab.lab_id, lab.description_terms)
+            for term, weight in vector.items():
+                term_entries.setdefault(term, []).append((row, weight))
+        self.description_columns = {term: column for column, term in enumerate(term_entries)}
+        self.description_indptr = np.cumsum(
+            [0] + [len(entries) for entries in term_entries.values()]
+        ).astype(np.int64)
+        self.description_rows = np.array(
+            [row for entries in term_entries.values() for row, _ in entries], dtype=np.int64
+        )
+        self.description_weights = np.array(
+            [weight for entries in term_entries.values() for _, weight in entries], dtype=np.float64
+        )
+
+    def _ratio(self, hits, cols: List[int]):
+        """선택된 열의 적중 개수 / 열 개수"""
+        if not cols:
+            return np.zeros(len(self.labs))
+        return hits[:, cols].sum(axis=1) / len(cols)
+
+    def keyword_components(self, project: ProjectFeatures) -> Dict[str, object]:
+        """설명을 제외한 세 항목의 점수 배열 (가벼운 연산만 사용)"""
+        service_cols = [self.service_terms.index(kw.lower()) for kw in SERVICE_KEYWORDS.get(project.service_type, [])]
+        service = np.minimum(self._ratio(self.service_hits, service_cols), 1.0)
+
+        tech_cols = [self.tech_terms.index(tech) for tech in SERVICE_TECHS.get(project.service_type, [])]
+        tech = np.minimum(self._ratio(self.tech_hits, tech_cols), 1.0)
+
+        keyword_cols = [i for i, concept in enumerate(KEYWORD_CONCEPTS) if concept in project.keyword_terms]
+        keywords = self._ratio(self.keyword_hits, keyword_cols)
+
+        return {
+            'service_type': service,
+            'tech_stack': tech,
+            'keywords': keywords
+        }
+
+    def description_scores(self, query: Dict[str, float]):
+        """모든 연구실의 설명 유사도 (희소 행렬 × 질의 벡터)
+
+        질의에 있는 단어 열만 모아 한 번의 bincount 로 행별 합을 구합니다.
+        질의 단어 순서대로 더해지므로 DescriptionIndex.similarity 와 같은 값을 냅니다.
+        """
+        terms = [(self.description_columns[term], weight) for term, weight in query.items() if term in self.description_columns]
+        if not terms:
+            return np.zeros(len(self.labs))
+        columns = np.array([column for column, _ in terms], dtype=np.int64)
+        starts = self.description_indptr[columns]
+        lengths = self.description_indptr[columns + 1] - starts
+        # 선택한 열 구간들을 이어 붙인 위치 (열 순서 유지)
+        positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        products = self.description_weights[positions] * np.repeat([weight for _, weight in terms], lengths)
+        scores = np.bincount(self.description_rows[positions], weights=products, minlength=len(self.labs))
+        return np.minimum(scores, 1.0)
+
+    def score(self, project: ProjectFeatures, query: Dict[str, float]) -> Tuple[object, Dict[str, object]]:
+        """모든 연구실에 대한 총점 배열과 항목별 점수 배열 반환 (query 는 설명 질의 벡터)"""
+        components = self.keyword_components(project)
+        components['description'] = self.description_scores(query)
+        total = (
+            components['service_type'] * 0.3 +
+            components['tech_stack'] * 0.25 +
+            components['keywords'] * 0.25 +
+            components['description'] * 0.2
+        )
+        return total, components
+
+    @staticmethod
+    def top_rows(total, k: int, min_score: float) -> List[int]:
+        """min_score 이상인 상위 k개 행 번호 (점수 내림차순, 동점이면 카탈로그 순서)"""
+        rows = np.flatnonzero(total >= min_score)
+        if len(rows) > k:
+            # k번째 점수 이상만 남긴 뒤 정렬 (전체 정렬 없이)
+            kth = np.partition(total[rows], len(rows) - k)[len(rows) - k]
+            rows = rows[total[rows] >= kth]
+        order = np.lexsort((rows, -total[rows]))[:k]
+        return rows[order].tolist()
+
+
+_scorer_lock = threading.Lock()
+_scorer_cache: Tuple[Optional[CatalogSnapshot], Optional[BatchLabScorer]] = (None, None)
+
+
+def get_batch_scorer(catalog: CatalogSnapshot) -> Optional[BatchLabScorer]:
+    """카탈로그 스냅숏별로 캐시된 일괄 점수 계산기 반환 (numpy가 없으면 None)"""
+    global _scorer_cache
+    if np is None:
+        return None
+
+    with _scorer_lock:
+        cached_catalog, scorer = _scorer_cache
+        if cached_catalog is not catalog:
+            scorer = BatchLabScorer(catalog.labs, get_description_index(catalog))
+            _scorer_cache = (catalog, scorer)
+        return scorer
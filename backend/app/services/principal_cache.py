@@ -0,0 +1,75 @@
+# backend/app/services/principal_cache.py
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import settings
+
+# (user_id, token_version)
+PrincipalKey = Tuple[int, int]
+
+
+class PrincipalCache:
+    """get_current_user 가 만든 사용자 정보(principal) TTL + LRU 캐시
+
+    키에 토큰 버전이 들어가므로 token_version 을 올리면 이전 토큰으로는 캐시가 맞지 않습니다.
+    프로필 변경은 invalidate_user 로 바로 지우고, 다른 워커 프로세스에는 TTL 안에 반영됩니다.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[PrincipalKey, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int, token_version: int) -> Optional[Dict[str, Any]]:
+        key = (user_id, token_version)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            # 호출한 쪽에서 수정해도 캐시가 바뀌지 않도록 복사본 반환
+            return dict(entry[0])
+
+    def put(self, user_id: int, token_version: int, principal: Dict[str, Any]) -> None:
+        if self.max_entries <= 0 or self.ttl_seconds <= 0:
+            return
+        key = (user_id, token_version)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (dict(principal), time.monotonic() + self.ttl_seconds)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """사용자의 모든 토큰 버전 항목 제거 (프로필/타입 변경 후 호출)"""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == user_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+
+# 애플리케이션 전역 캐시
+principal_cache = PrincipalCache(
+    max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
@@ -0,0 +1,104 @@
+# backend/app/services/recommendation_cache.py
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import settings
+from app.models.project import Project
+
+# (project_id, 프로젝트 지문, 카탈로그 버전, min_score, limit)
+CacheKey = Tuple[int, str, int, float, int]
+
+
+def project_fingerprint(project: Project) -> str:
+    """매칭 점수에 영향을 주는 프로젝트 필드의 지문"""
+    payload = "\x1f".join([
+        project.description or "",
+        project.service_type or "",
+        project.idea_name or ""
+    ])
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class RecommendationCache:
+    """연구실 추천 결과 LRU 캐시
+
+    키에 프로젝트 지문과 연구실 카탈로그 버전이 들어가므로, 프로젝트나
+    연구실이 바뀌면 새 키로 조회되어 오래된 결과가 반환되지 않습니다.
+    항목 수와 (직렬화 기준) 총 바이트 수 두 가지 한도로 제거합니다.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[CacheKey, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(project: Project, catalog_version: int, min_score: float, limit: int) -> CacheKey:
+        return (project.project_id, project_fingerprint(project), catalog_version, min_score, limit)
+
+    @staticmethod
+    def _sizeof(value: Any) -> int:
+        return len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: CacheKey, value: Any, size: Optional[int] = None) -> None:
+        """size: 미리 직렬화해 둔 값이면 그 바이트 수 (없으면 JSON 으로 직렬화해 계산)"""
+        if size is None:
+            size = self._sizeof(value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def invalidate_project(self, project_id: int) -> None:
+        """프로젝트의 모든 캐시 항목 제거 (저장된 매칭 결과가 바뀐 경우)"""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == project_id]:
+                _, size = self._entries.pop(key)
+                self._bytes -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+
+# 애플리케이션 전역 캐시
+recommendation_cache = RecommendationCache(
+    max_entries=settings.RECOMMENDATION_CACHE_MAX_ENTRIES,
+    max_bytes=settings.RECOMMENDATION_CACHE_MAX_BYTES
+)
@@ -0,0 +1,231 @@
+# backend/app/services/rematch_queue.py
+import logging
+import queue
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.project import Project
+from app.models.research_lab import ResearchLab, ProjectLabMatching
+from app.services.lab_index import ProjectFeatures, lab_feature_index
+from app.services.lab_matching import _WRITE_CHUNK_SIZE, LabMatchingService, MatchingRun
+
+logger = logging.getLogger(__name__)
+
+# 점수에 영향을 주는 프로젝트 필드 (stage / 공개 여부 등은 점수와 무관하므로 제외)
+PROJECT_SCORE_FIELDS = ('description', 'idea_name', 'service_type')
+
+# 재매칭 범위 (추천 API와 같은 임계값, 저장된 개수보다 줄이지 않음)
+REMATCH_MAX_RESULTS = 10
+REMATCH_MIN_SCORE = 0.2
+
+# 세션별로 커밋 전까지 모아 두는 변경 목록 키
+_PENDING_KEY = 'rematch_pending'
+
+# 작업 단위: ('project', project_id) 또는 ('lab', lab_id)
+Job = Tuple[str, int]
+
+
+class RematchQueue:
+    """프로젝트/연구실 변경 시 저장된 매칭 결과를 다시 계산하는 작업 큐
+
+    요청 처리 경로에서는 작업만 넣고, 실제 계산은 별도 스레드가 자체 세션으로 수행합니다.
+    같은 대상이 처리 전에 여러 번 바뀌면 한 번만 계산합니다.
+    """
+
+    def __init__(self):
+        self._queue: "queue.Queue[Optional[Job]]" = queue.Queue()
+        self._pending: Set[Job] = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="rematch-worker", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def enqueue(self, kind: str, target_id: int) -> None:
+        job = (kind, target_id)
+        with self._lock:
+            if job in self._pending:
+                return
+            self._pending.add(job)
+        self._queue.put(job)
+
+    def join(self) -> None:
+        """대기 중인 작업이 모두 끝날 때까지 대기 (스크립트/점검용)"""
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                with self._lock:
+                    self._pending.discard(job)
+                self.process(job)
+            except Exception:
+                logger.exception("재매칭 작업 실패: %s", job)
+            finally:
+                self._queue.task_done()
+
+    def process(self, job: Job) -> None:
+        kind, target_id = job
+        db = SessionLocal()
+        try:
+            if kind == 'project':
+                rematch_project(db, target_id)
+            elif kind == 'lab':
+                rematch_lab(db, target_id)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+def _stored_matches(db: Session, project_ids: List[int]) -> Dict[int, List]:
+    """프로젝트별 저장된 매칭 (lab_id, 점수, 매칭 요소)"""
+    stored: Dict[int, List] = {}
+    for start in range(0, len(project_ids), _WRITE_CHUNK_SIZE):
+        rows = db.query(
+            ProjectLabMatching.project_id, ProjectLabMatching.lab_id,
+            ProjectLabMatching.similarity_score, ProjectLabMatching.matching_factors
+        ).filter(ProjectLabMatching.project_id.in_(project_ids[start:start + _WRITE_CHUNK_SIZE])).all()
+        for row in rows:
+            stored.setdefault(row.project_id, []).append(row)
+    return stored
+
+
+def rematch_project(db: Session, project_id: int) -> None:
+    """변경된 프로젝트 하나만 전체 연구실과 다시 매칭 (저장된 매칭이 있는 경우만)"""
+    stored = _stored_matches(db, [project_id]).get(project_id)
+    if not stored:
+        return
+
+    project = db.query(Project).filter(
+        Project.project_id == project_id,
+        Project.is_active == True
+    ).first()
+    if not project:
+        return
+
+    service = LabMatchingService(db)
+    catalog = lab_feature_index.refresh(db)
+    features = ProjectFeatures(project)
+    max_results = max(len(stored), REMATCH_MAX_RESULTS)
+    winners = service.top_matches(features, catalog, max_results, REMATCH_MIN_SCORE)
+    service.save_batch_results({
+        project_id: [
+            {'lab_id': lab.lab_id, 'similarity_score': score, 'matching_details': details}
+            for lab, score, details in winners
+        ]
+    }, MatchingRun.of([features], catalog, max_results, REMATCH_MIN_SCORE))
+
+
+def rematch_lab(db: Session, lab_id: int) -> None:
+    """변경된 연구실 하나만, 저장된 매칭이 있는 프로젝트들에 대해 다시 점수 계산
+
+    다른 연구실의 점수는 그대로 두고 이 연구실의 점수만 바꾼 뒤,
+    프로젝트별 상위 목록을 다시 정해 변경분만 저장합니다.
+    프로젝트는 _WRITE_CHUNK_SIZE 개씩 나눠 조회/저장합니다 (SQLite IN 절 변수 제한).
+    """
+    project_ids = [
+        row.project_id for row in db.query(ProjectLabMatching.project_id).join(
+            Project, ProjectLabMatching.project_id == Project.project_id
+        ).filter(Project.is_active == True).distinct().all()
+    ]
+    if not project_ids:
+        return
+
+    # updated_at은 초 단위라 같은 초 안의 연속 변경을 놓치지 않도록 강제로 다시 읽음
+    lab_feature_index.invalidate(lab_id)
+    catalog = lab_feature_index.refresh(db)
+    lab = next((features for features in catalog.labs if features.lab_id == lab_id), None)
+    service = LabMatchingService(db)
+
+    for start in range(0, len(project_ids), _WRITE_CHUNK_SIZE):
+        chunk = project_ids[start:start + _WRITE_CHUNK_SIZE]
+        stored = _stored_matches(db, chunk)
+        projects = db.query(Project).filter(Project.project_id.in_(chunk)).all()
+
+        results = {}
+        for project in projects:
+            rows = stored.get(project.project_id, [])
+            max_results = max(len(rows), REMATCH_MAX_RESULTS)
+            matches = [
+                {
+                    'lab_id': row.lab_id,
+                    'similarity_score': row.similarity_score,
+                    'matching_details': row.matching_factors or {}
+                }
+                for row in rows if row.lab_id != lab_id
+            ]
+
+            # 비활성화/삭제된 연구실은 목록에서 빠짐
+            if lab is not None:
+                score, details = service.calculate_similarity_score(ProjectFeatures(project), lab)
+                if score >= REMATCH_MIN_SCORE:
+                    matches.append({'lab_id': lab_id, 'similarity_score': score, 'matching_details': details})
+
+            matches.sort(key=lambda match: match['similarity_score'], reverse=True)
+            matches = matches[:max_results]
+
+            # 이 연구실이 원래 없었고 새로 들어오지도 않으면 저장할 변경이 없음
+            was_stored = any(row.lab_id == lab_id for row in rows)
+            if was_stored or any(match['lab_id'] == lab_id for match in matches):
+                results[project.project_id] = matches
+
+        if results:
+            service.save_batch_results(results)
+
+
+def _collect_changes(session: Session, flush_context) -> None:
+    """flush 직후: 점수에 영향을 주는 변경을 세션에 모아 둠 (커밋 후 작업 등록)"""
+    pending = session.info.setdefault(_PENDING_KEY, set())
+
+    for obj in session.dirty:
+        if isinstance(obj, Project):
+            state = inspect(obj)
+            if any(state.attrs[field].history.has_changes() for field in PROJECT_SCORE_FIELDS):
+                pending.add(('project', obj.project_id))
+        elif isinstance(obj, ResearchLab) and session.is_modified(obj):
+            pending.add(('lab', obj.lab_id))
+
+    for obj in list(session.new) + list(session.deleted):
+        if isinstance(obj, ResearchLab):
+            pending.add(('lab', obj.lab_id))
+
+
+def _enqueue_after_commit(session: Session) -> None:
+    for kind, target_id in session.info.pop(_PENDING_KEY, ()):
+        if target_id is not None:
+            rematch_queue.enqueue(kind, target_id)
+
+
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def register_listeners() -> None:
+    """모든 세션에 변경 감지 이벤트 등록 (한 번만)"""
+    if not event.contains(Session, 'after_flush', _collect_changes):
+        event.listen(Session, 'after_flush', _collect_changes)
+        event.listen(Session, 'after_commit', _enqueue_after_commit)
+        event.listen(Session, 'after_rollback', _discard_after_rollback)
+
+
+# 애플리케이션 전역 큐
+rematch_queue = RematchQueue()
@@ -0,0 +1,62 @@
+# backend/app/services/skill_tags.py
+"""
+모집 공고 요구 기술 → 검색용 태그
+
+태그는 기술 이름 그대로(소문자, 공백 정리)이며, 같은 기술의 다른 표기만 하나로 합칩니다.
+React 와 Vue.js 처럼 다른 기술은 같은 분야라도 다른 태그입니다.
+표기 사전(SKILL_ALIASES)을 바꾸면 기존 태그를 다시 채우는 마이그레이션을 추가해야 합니다
+(0006_team_opening_skills 는 당시 사전을 파일 안에 고정해 사용).
+"""
+import re
+from typing import Iterable, List, Optional
+
+# 모집 공고 required_skills 구분자 (쉼표, 슬래시, 세미콜론, 줄바꿈 등)
+_SEPARATORS = re.compile(r"[,/;|·\n]+")
+_SPACES = re.compile(r"\s+")
+
+# 태그 컬럼 길이
+MAX_TAG_LENGTH = 100
+
+# 같은 기술의 다른 표기(소문자) → 대표 표기
+SKILL_ALIASES = {
+    "파이썬": "python",
+    "py": "python",
+    "js": "javascript",
+    "자바스크립트": "javascript",
+    "ts": "typescript",
+    "타입스크립트": "typescript",
+    "reactjs": "react",
+    "react.js": "react",
+    "리액트": "react",
+    "vue": "vue.js",
+    "vuejs": "vue.js",
+    "node": "node.js",
+    "nodejs": "node.js",
+    "golang": "go",
+    "k8s": "kubernetes",
+    "ml": "머신러닝",
+    "machine learning": "머신러닝",
+    "deep learning": "딥러닝",
+}
+
+
+def normalize_skill(skill: str) -> Optional[str]:
+    """기술 하나를 검색용 태그로 (소문자, 공백 정리, 다른 표기는 대표 표기로)"""
+    tag = _SPACES.sub(" ", skill).strip().lower()
+    if not tag:
+        return None
+    return SKILL_ALIASES.get(tag, tag)[:MAX_TAG_LENGTH]
+
+
+def skill_tags(skills: Optional[str]) -> List[str]:
+    """자유 입력 기술 목록을 중복 없는 태그 목록으로 ("Python, ReactJS / Vue" → python, react, vue.js)"""
+    return normalize_skills(_SEPARATORS.split(skills or ""))
+
+
+def normalize_skills(skills: Iterable[str]) -> List[str]:
+    tags = []
+    for skill in skills:
+        tag = normalize_skill(skill)
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags
@@ -0,0 +1,124 @@
+# backend/app/services/text_index.py
+import math
+import re
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 한글 음절 구간과 그 외 단어 문자 구간을 나눠서 추출
+_TOKEN_PATTERN = re.compile(r'[가-힣]+|[^\W가-힣]+')
+_HANGUL_PATTERN = re.compile(r'[가-힣]')
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """설명 유사도용 토큰화
+
+    한글은 조사/어미가 붙어도 겹치도록 음절 2-gram으로, 영문/숫자는 단어 단위로 자릅니다.
+    예) "인공지능을 활용한 AI" -> ['인공', '공지', '지능', '능을', '활용', '용한', 'ai']
+    """
+    if not text:
+        return []
+
+    terms = []
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        if _HANGUL_PATTERN.match(token):
+            if len(token) == 1:
+                terms.append(token)
+            else:
+                terms.extend(token[i:i + 2] for i in range(len(token) - 1))
+        else:
+            terms.append(token)
+    return terms
+
+
+def term_frequencies(text: Optional[str]) -> Dict[str, int]:
+    """토큰별 등장 횟수 (등장 순서 유지)"""
+    return dict(Counter(tokenize(text)))
+
+
+class DescriptionIndex:
+    """연구실 설명/키워드 TF-IDF 역색인
+
+    문서 벡터는 (1 + log tf) * idf 가중치를 L2 정규화해 미리 저장하고,
+    질의 벡터와의 코사인 유사도(0.0 ~ 1.0)를 설명 점수로 사용합니다.
+    """
+
+    def __init__(self, documents: Iterable[Tuple[int, Dict[str, int]]]):
+        documents = list(documents)
+        self.document_count = len(documents)
+
+        document_frequency: Counter = Counter()
+        for _, frequencies in documents:
+            document_frequency.update(frequencies.keys())
+        self.idf = {term: self._idf(df) for term, df in document_frequency.items()}
+
+        self.doc_vectors: Dict[int, Dict[str, float]] = {}
+        self.postings: Dict[str, List[Tuple[int, float]]] = {}
+        for doc_id, frequencies in documents:
+            vector = self._normalize({
+                term: (1.0 + math.log(tf)) * self.idf[term]
+                for term, tf in frequencies.items()
+            })
+            self.doc_vectors[doc_id] = vector
+            for term, weight in vector.items():
+                self.postings.setdefault(term, []).append((doc_id, weight))
+
+    def _idf(self, document_frequency: int) -> float:
+        # 평활화된 idf: 색인에 없는 단어(df=0)도 질의 벡터 길이에 반영
+        return math.log((1 + self.document_count) / (1 + document_frequency)) + 1.0
+
+    @staticmethod
+    def _normalize(vector: Dict[str, float]) -> Dict[str, float]:
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        if not norm:
+            return {}
+        return {term: weight / norm for term, weight in vector.items()}
+
+    def query_vector(self, frequencies: Dict[str, int]) -> Dict[str, float]:
+        """질의 단어 빈도를 정규화된 TF-IDF 벡터로 변환"""
+        return self._normalize({
+            term: (1.0 + math.log(tf)) * self.idf.get(term, self._idf(0))
+            for term, tf in frequencies.items()
+        })
+
+    def document_vector(self, doc_id: int, frequencies: Dict[str, int]) -> Dict[str, float]:
+        """색인된 문서 벡터 (색인에 없는 문서는 현재 idf로 계산)"""
+        vector = self.doc_vectors.get(doc_id)
+        if vector is None:
+            vector = self.query_vector(frequencies)
+        return vector
+
+    def similarity(self, query: Dict[str, float], document: Dict[str, float]) -> float:
+        """질의 벡터와 문서 벡터 하나의 코사인 유사도"""
+        score = 0.0
+        for term, query_weight in query.items():
+            doc_weight = document.get(term)
+            if doc_weight:
+                score += query_weight * doc_weight
+        return min(score, 1.0)
+
+    def score_all(self, query: Dict[str, float]) -> Dict[int, float]:
+        """포스팅 리스트를 한 번 순회해 모든 문서의 유사도 계산 (0점 문서는 제외)
+
+        질의 단어 순서대로 더하므로 similarity 와 같은 값을 냅니다.
+        """
+        scores: Dict[int, float] = {}
+        for term, query_weight in query.items():
+            for doc_id, doc_weight in self.postings.get(term, ()):
+                scores[doc_id] = scores.get(doc_id, 0.0) + query_weight * doc_weight
+        return {doc_id: min(score, 1.0) for doc_id, score in scores.items()}
+
+
+_index_lock = threading.Lock()
+_index_cache: Tuple[Optional[object], Optional[DescriptionIndex]] = (None, None)
+
+
+def get_description_index(catalog) -> DescriptionIndex:
+    """카탈로그 스냅숏(lab_index.CatalogSnapshot)별로 캐시된 연구실 설명 색인 반환"""
+    global _index_cache
+    with _index_lock:
+        cached_catalog, index = _index_cache
+        if cached_catalog is not catalog:
+            index = DescriptionIndex((lab.lab_id, lab.description_terms) for lab in catalog.labs)
+            _index_cache = (catalog, index)
+        return index
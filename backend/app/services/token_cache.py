@@ -0,0 +1,69 @@
+# backend/app/services/token_cache.py
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import settings
+
+
+def token_digest(token: str) -> bytes:
+    """캐시 키 (원본 토큰은 메모리에 보관하지 않음)"""
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+class TokenCache:
+    """서명/만료 검증을 통과한 JWT 의 클레임 LRU 캐시
+
+    같은 bearer 토큰이 세션 내내 반복되므로, 한 번 검증한 토큰은 해시로 찾아
+    jwt.decode(서명 재계산)를 건너뜁니다. 항목은 토큰의 exp 까지만 유효하고,
+    exp 가 없는 토큰은 저장하지 않습니다. SECRET_KEY 를 바꾸면 clear() 해야 합니다.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        key = token_digest(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry[0])
+
+    def put(self, token: str, claims: Dict[str, Any]) -> None:
+        expires_at = claims.get("exp")
+        if self.max_entries <= 0 or not isinstance(expires_at, (int, float)):
+            return
+        key = token_digest(token)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (dict(claims), float(expires_at))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+
+# 애플리케이션 전역 캐시
+token_cache = TokenCache(max_entries=settings.TOKEN_CACHE_MAX_ENTRIES)
@@ -0,0 +1,204 @@
+# backend/app/utils/loop_monitor.py
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from types import CodeType
+from typing import Any, Deque, Dict, List, Optional
+
+from fastapi.routing import APIRoute
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 지연 히스토그램 버킷 (초)
+LAG_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# 스택에서 라우트를 찾지 못했을 때의 이름
+UNKNOWN_ROUTE = "unknown"
+
+# 등록된 엔드포인트를 못 찾으면 이 디렉터리의 첫 프레임(라우터 함수)으로 식별
+ROUTERS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "routers")
+
+
+class EventLoopMonitor:
+    """이벤트 루프 지연 측정 + 블로킹 호출 탐지
+
+    루프 안의 ticker 태스크가 interval마다 깨어나며 예정보다 늦어진 만큼을 지연으로 기록합니다.
+    별도 watchdog 스레드는 ticker가 threshold 이상 깨어나지 못하면 루프 스레드의 스택을
+    떠서, 스택에 있는 엔드포인트 함수로 어떤 라우트가 루프를 막고 있는지 기록합니다.
+    """
+
+    def __init__(self, interval: float, threshold: float, max_stalls: int = 100):
+        self.interval = interval
+        self.threshold = threshold
+        self._routes: Dict[CodeType, str] = {}
+        self._stalls: Deque[Dict[str, Any]] = deque(maxlen=max_stalls)
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._loop_thread_id: Optional[int] = None
+        self._last_tick = time.monotonic()
+        # watchdog가 잡아 둔, 아직 끝나지 않은 정체
+        self._current_stall: Optional[Dict[str, Any]] = None
+
+        self.lag_count = 0
+        self.lag_sum = 0.0
+        self.lag_max = 0.0
+        self.bucket_counts = [0] * len(LAG_BUCKETS)
+        self.stall_counts: Dict[str, int] = {}
+
+    def register_routes(self, routes: List[Any]) -> None:
+        """엔드포인트 함수의 코드 객체 → "METHOD 경로" 매핑 (스택 프레임으로 라우트 식별)"""
+        for route in routes:
+            # 마운트된 하위 앱/라우터는 안쪽 라우트까지 등록
+            if not isinstance(route, APIRoute):
+                self.register_routes(getattr(route, "routes", None) or [])
+                continue
+            code = getattr(route.endpoint, "__code__", None)
+            if code is not None:
+                methods = ",".join(sorted(route.methods or ()))
+                self._routes[code] = f"{methods} {route.path}"
+
+    def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.get_running_loop().create_task(self._tick())
+        self._watchdog = threading.Thread(target=self._watch, name="event-loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join(self.interval * 2)
+            self._watchdog = None
+
+    async def _tick(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self._record_lag(max(0.0, now - expected), now)
+
+    def _record_lag(self, lag: float, now: float) -> None:
+        with self._lock:
+            self._last_tick = now
+            self.lag_count += 1
+            self.lag_sum += lag
+            self.lag_max = max(self.lag_max, lag)
+            for index, bound in enumerate(LAG_BUCKETS):
+                if lag <= bound:
+                    self.bucket_counts[index] += 1
+
+            # watchdog가 잡은 정체가 끝났으면 실제 지연 시간으로 마무리
+            stall = self._current_stall
+            if stall is not None:
+                stall["lag_ms"] = round(lag * 1000, 1)
+                self._current_stall = None
+            elif lag >= self.threshold:
+                # watchdog 주기 사이에 끝난 짧은 정체는 스택 없이 기록
+                self._add_stall(UNKNOWN_ROUTE, lag, [])
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.interval / 2):
+            with self._lock:
+                blocked_for = time.monotonic() - self._last_tick - self.interval
+                if blocked_for < self.threshold or self._current_stall is not None:
+                    continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            route = self._find_route(frame)
+            stack = traceback.format_stack(frame)
+            del frame
+            with self._lock:
+                # 스택을 뜨는 사이에 ticker가 깨어났으면 버림
+                if time.monotonic() - self._last_tick - self.interval < self.threshold:
+                    continue
+                self._current_stall = self._add_stall(route, blocked_for, stack)
+            logger.warning("이벤트 루프가 %.0fms 이상 막힘: %s", blocked_for * 1000, route)
+
+    def _find_route(self, frame) -> str:
+        router_frame = None
+        while frame is not None:
+            code = frame.f_code
+            route = self._routes.get(code)
+            if route is not None:
+                return route
+            if code.co_filename.startswith(ROUTERS_DIR):
+                # 가장 바깥쪽(엔드포인트에 가까운) 라우터 프레임을 남김
+                router_frame = code
+            frame = frame.f_back
+        if router_frame is not None:
+            module = os.path.splitext(os.path.basename(router_frame.co_filename))[0]
+            return f"{module}.{router_frame.co_name}"
+        return UNKNOWN_ROUTE
+
+    def _add_stall(self, route: str, lag: float, stack: List[str]) -> Dict[str, Any]:
+        stall = {
+            "route": route,
+            "detected_at": time.time(),
+            "lag_ms": round(lag * 1000, 1),
+            "stack": [line.rstrip() for line in stack]
+        }
+        self._stalls.append(stall)
+        self.stall_counts[route] = self.stall_counts.get(route, 0) + 1
+        return stall
+
+    def snapshot(self) -> Dict[str, Any]:
+        """디버그 엔드포인트용 현재 상태"""
+        with self._lock:
+            return {
+                "interval_ms": self.interval * 1000,
+                "threshold_ms": self.threshold * 1000,
+                "ticks": self.lag_count,
+                "mean_lag_ms": round(self.lag_sum / self.lag_count * 1000, 3) if self.lag_count else 0.0,
+                "max_lag_ms": round(self.lag_max * 1000, 3),
+                "stalls_by_route": dict(self.stall_counts),
+                "recent_stalls": [dict(stall) for stall in reversed(self._stalls)]
+            }
+
+    def render_metrics(self) -> str:
+        """Prometheus 텍스트 형식 지표"""
+        with self._lock:
+            lines = [
+                "# HELP event_loop_lag_seconds Delay of the event loop ticker behind schedule.",
+                "# TYPE event_loop_lag_seconds histogram"
+            ]
+            for bound, count in zip(LAG_BUCKETS, self.bucket_counts):
+                lines.append(f'event_loop_lag_seconds_bucket{{le="{bound}"}} {count}')
+            lines.append(f'event_loop_lag_seconds_bucket{{le="+Inf"}} {self.lag_count}')
+            lines.append(f"event_loop_lag_seconds_sum {self.lag_sum:.6f}")
+            lines.append(f"event_loop_lag_seconds_count {self.lag_count}")
+            lines.append("# HELP event_loop_lag_max_seconds Largest observed event loop delay.")
+            lines.append("# TYPE event_loop_lag_max_seconds gauge")
+            lines.append(f"event_loop_lag_max_seconds {self.lag_max:.6f}")
+            lines.append("# HELP event_loop_stalls_total Event loop stalls over the threshold, by route.")
+            lines.append("# TYPE event_loop_stalls_total counter")
+            for route, count in sorted(self.stall_counts.items()):
+                label = route.replace("\\", "\\\\").replace('"', '\\"')
+                lines.append(f'event_loop_stalls_total{{route="{label}"}} {count}')
+            return "\n".join(lines) + "\n"
+
+
+# 애플리케이션 전역 모니터
+loop_monitor = EventLoopMonitor(
+    interval=settings.EVENT_LOOP_MONITOR_INTERVAL_MS / 1000,
+    threshold=settings.EVENT_LOOP_STALL_THRESHOLD_MS / 1000
+)
@@ -0,0 +1,81 @@
+# backend/app/utils/pagination.py
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import String, and_, literal, or_, type_coerce
+from sqlalchemy.sql.elements import ColumnElement
+
+# 한 페이지 최대 크기 (limit 쿼리 파라미터 상한)
+MAX_PAGE_SIZE = 100
+
+# 커서 키 컬럼이 붙는 라벨 접두어 (응답 구성 시 무시)
+_KEY_LABEL = "_cursor_key_"
+
+
+class Keyset:
+    """정렬 키 목록으로 커서 기반(keyset) 페이지를 만드는 도우미
+
+    keys는 (컬럼, 내림차순 여부) 목록이며 마지막 키는 유일해야 합니다 (예: created_at, id).
+    OFFSET 없이 "마지막으로 본 행보다 뒤" 조건으로 조회하므로 몇 번째 페이지든 첫 페이지와 비용이 같습니다.
+
+        keyset = Keyset((Project.created_at, True), (Project.project_id, True))
+        rows = (await db.execute(keyset.page(query, cursor, limit))).all()
+        rows, next_cursor = keyset.split(rows, limit)
+    """
+
+    def __init__(self, *keys: Tuple[ColumnElement, bool]):
+        self.keys = keys
+
+    def page(self, query, cursor: Optional[str], limit: int):
+        """select()/Query 에 커서 조건, 정렬, limit + 1 을 적용 (기존 정렬은 대체)"""
+        # 키 값은 DB에 저장된 그대로 읽음 (SQLite 날짜 문자열을 다시 변환하면 비교가 어긋남)
+        query = query.add_columns(*(
+            type_coerce(column, String).label(f"{_KEY_LABEL}{index}")
+            for index, (column, _) in enumerate(self.keys)
+        ))
+        if cursor:
+            query = query.where(self._after(decode_cursor(cursor, len(self.keys))))
+        return query.order_by(None).order_by(*(
+            column.desc() if descending else column.asc() for column, descending in self.keys
+        )).limit(limit + 1)
+
+    def split(self, rows: Sequence, limit: int) -> Tuple[List, Optional[str]]:
+        """limit + 1 개로 조회한 행을 (이번 페이지, 다음 커서)로 나눔 (마지막 페이지면 커서는 None)"""
+        rows = list(rows)
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        last = rows[-1]
+        return rows, encode_cursor([getattr(last, f"{_KEY_LABEL}{index}") for index in range(len(self.keys))])
+
+    def _after(self, values: List[Any]):
+        """(k1, k2, ...) 가 커서 값보다 뒤인 행: k1 뒤 OR (k1 같고 k2 뒤) OR ..."""
+        clauses = []
+        for index, (column, descending) in enumerate(self.keys):
+            value = literal(values[index])
+            ties = [self.keys[i][0] == literal(values[i]) for i in range(index)]
+            clauses.append(and_(*ties, column < value if descending else column > value))
+        return or_(*clauses)
+
+
+def encode_cursor(values: List[Any]) -> str:
+    payload = [{"dt": value.isoformat()} if isinstance(value, (datetime, date)) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """커서를 키 값 목록으로 (형식이 맞지 않으면 400)"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(payload, list) or len(payload) != size:
+            raise ValueError(cursor)
+        return [
+            datetime.fromisoformat(value["dt"]) if isinstance(value, dict) else value
+            for value in payload
+        ]
+    except (ValueError, TypeError, KeyError, binascii.Error):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 페이지 커서입니다.")
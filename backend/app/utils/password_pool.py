@@ -0,0 +1,118 @@
+# backend/app/utils/password_pool.py
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException, status
+
+from app.config import settings
+
+# 대기열 대기 시간 히스토그램 버킷 (초)
+WAIT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class PasswordHashingPool:
+    """bcrypt 해싱/검증 전용 스레드 풀 + 입장 제한
+
+    bcrypt 는 의도적으로 느린 CPU 작업이라 async 핸들러에서 바로 부르면 그동안 이벤트 루프가 멈춥니다.
+    전용 스레드에서 돌리되(bcrypt 는 GIL 을 놓음), 실행 중 + 대기 중 작업이 max_pending 에
+    이르면 더 받지 않고 503 을 돌려줘 로그인 폭주가 다른 요청까지 밀어내지 않게 합니다.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = max(1, workers)
+        self.max_pending = max(1, max_pending)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_sum = 0.0
+        self.wait_counts = [0] * len(WAIT_BUCKETS)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+            return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """func(*args) 를 풀에서 실행하고 결과를 기다림 (대기열이 가득 차면 503)"""
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="요청이 많아 잠시 후 다시 시도해 주세요.",
+                    headers={"Retry-After": "1"}
+                )
+            self.pending += 1
+
+        submitted_at = time.monotonic()
+        try:
+            return await asyncio.wrap_future(self._get_executor().submit(self._call, submitted_at, func, *args))
+        finally:
+            with self._lock:
+                self.pending -= 1
+
+    def _call(self, submitted_at: float, func: Callable[..., Any], *args: Any) -> Any:
+        waited = time.monotonic() - submitted_at
+        with self._lock:
+            self.running += 1
+            self.wait_sum += waited
+            for index, bound in enumerate(WAIT_BUCKETS):
+                if waited <= bound:
+                    self.wait_counts[index] += 1
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self.running -= 1
+                self.completed += 1
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def render_metrics(self) -> str:
+        """Prometheus 텍스트 형식 지표"""
+        with self._lock:
+            queued = self.pending - self.running
+            lines = [
+                "# HELP password_hash_queue_depth Password hashing jobs waiting for a worker thread.",
+                "# TYPE password_hash_queue_depth gauge",
+                f"password_hash_queue_depth {max(queued, 0)}",
+                "# HELP password_hash_in_progress Password hashing jobs currently running.",
+                "# TYPE password_hash_in_progress gauge",
+                f"password_hash_in_progress {self.running}",
+                "# HELP password_hash_max_pending Admission limit for queued plus running jobs.",
+                "# TYPE password_hash_max_pending gauge",
+                f"password_hash_max_pending {self.max_pending}",
+                "# HELP password_hash_completed_total Password hashing jobs finished.",
+                "# TYPE password_hash_completed_total counter",
+                f"password_hash_completed_total {self.completed}",
+                "# HELP password_hash_rejected_total Password hashing jobs rejected with 503.",
+                "# TYPE password_hash_rejected_total counter",
+                f"password_hash_rejected_total {self.rejected}",
+                "# HELP password_hash_wait_seconds Time a job waited in the queue before running.",
+                "# TYPE password_hash_wait_seconds histogram"
+            ]
+            for bound, count in zip(WAIT_BUCKETS, self.wait_counts):
+                lines.append(f'password_hash_wait_seconds_bucket{{le="{bound}"}} {count}')
+            started = self.completed + self.running
+            lines.append(f'password_hash_wait_seconds_bucket{{le="+Inf"}} {started}')
+            lines.append(f"password_hash_wait_seconds_sum {self.wait_sum:.6f}")
+            lines.append(f"password_hash_wait_seconds_count {started}")
+            return "\n".join(lines) + "\n"
+
+
+# 애플리케이션 전역 풀
+password_pool = PasswordHashingPool(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING
+)
@@ -0,0 +1,80 @@
+# backend/app/utils/responses.py
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Dict
+
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 모듈로 대체
+    orjson = None
+
+# pydantic 직렬화와 같은 형식 (UTC 는 Z, 정수가 아닌 키는 문자열로)
+_ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z) if orjson is not None else 0
+
+
+class RawJSON(bytes):
+    """이미 직렬화된 JSON (encode_object / as_response 가 다시 인코딩하지 않고 그대로 끼워 넣음)
+
+    캐시에 결과를 bytes 로 넣어 두면 적중할 때마다 같은 데이터를 다시 직렬화하지 않아도 됩니다.
+    """
+
+
+def _default(value: Any) -> Any:
+    """orjson/json 이 모르는 타입 (pydantic 의 JSON 직렬화 규칙을 따름)"""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    raise TypeError(f"JSON 으로 직렬화할 수 없는 타입: {type(value).__name__}")
+
+
+def dumps_bytes(value: Any) -> bytes:
+    """값 하나를 JSON bytes 로 (RawJSON 은 그대로, pydantic 모델은 검증 없이 필드만 꺼내서)"""
+    if isinstance(value, RawJSON):
+        return value
+    if orjson is not None:
+        # 한글이 많은 본문은 model_dump_json 보다 model_dump + orjson 이 빠름
+        if isinstance(value, BaseModel):
+            value = value.model_dump()
+        return orjson.dumps(value, default=_default, option=_ORJSON_OPTIONS)
+    return json.dumps(value, ensure_ascii=False, default=_default, separators=(",", ":")).encode("utf-8")
+
+
+def _join_object(fields: Dict[str, Any]) -> bytes:
+    # 큰 필드가 여러 번 복사되지 않도록 조각을 모아 한 번에 이어 붙임
+    parts = [b"{"]
+    for key, value in fields.items():
+        if len(parts) > 1:
+            parts.append(b",")
+        parts.extend((dumps_bytes(str(key)), b":", dumps_bytes(value)))
+    parts.append(b"}")
+    return b"".join(parts)
+
+
+def encode_object(fields: Dict[str, Any]) -> RawJSON:
+    """최상위 필드별로 직렬화해 JSON 객체로 이어 붙임 (RawJSON 필드는 재인코딩 없이 그대로)"""
+    return RawJSON(_join_object(fields))
+
+
+def json_response(fields: Dict[str, Any], status_code: int = 200) -> Response:
+    """검증/재직렬화 없이 바로 보내는 JSON 응답"""
+    return Response(content=_join_object(fields), status_code=status_code, media_type="application/json")
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 으로 렌더링하는 기본 응답 클래스 (response_model 이 없는 라우트용)
+
+    response_model 이 있는 라우트는 FastAPI 가 pydantic 으로 바로 bytes 를 만들므로 이 클래스를 거치지 않습니다.
+    fastapi.responses.ORJSONResponse 는 현재 FastAPI 에서 폐기 예정이라 대신 사용합니다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps_bytes(content)
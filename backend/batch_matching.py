@@ -0,0 +1,40 @@
+# backend/batch_matching.py
+"""
+프로젝트-연구실 일괄 매칭 스크립트 (야간 배치용)
+
+사용 예)
+    python batch_matching.py                      # 활성 프로젝트 전체
+    python batch_matching.py --project-ids 1 2 3  # 일부 프로젝트만
+    python batch_matching.py --workers 4 --min-score 0.2
+"""
+import argparse
+
+from app.services.batch_matching import run_batch_matching_job
+
+
+def main():
+    parser = argparse.ArgumentParser(description="프로젝트-연구실 일괄 매칭")
+    parser.add_argument("--project-ids", type=int, nargs="*", help="매칭할 프로젝트 ID (생략 시 전체)")
+    parser.add_argument("--max-results", type=int, default=10, help="프로젝트별 저장할 최대 연구실 수")
+    parser.add_argument("--min-score", type=float, default=0.3, help="최소 유사도 점수")
+    parser.add_argument("--workers", type=int, default=None, help="워커 프로세스 수 (기본: CPU 수)")
+    args = parser.parse_args()
+
+    print("🔬 프로젝트-연구실 일괄 매칭을 시작합니다...")
+    summary = run_batch_matching_job(
+        project_ids=args.project_ids,
+        max_results=args.max_results,
+        min_score=args.min_score,
+        workers=args.workers
+    )
+
+    print("\n📊 매칭 결과:")
+    print(f"   - 프로젝트: {summary['project_count']}개")
+    print(f"   - 연구실: {summary['lab_count']}개")
+    print(f"   - 저장된 매칭: {summary['total_matches']}건")
+    print(f"   - 소요 시간: {summary['elapsed_seconds']}초")
+    print("\n✅ 일괄 매칭 완료!")
+
+
+if __name__ == "__main__":
+    main()
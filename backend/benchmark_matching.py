@@ -0,0 +1,361 @@
+# backend/benchmark_matching.py
+"""
+연구실 매칭 엔진 벤치마크 스크립트
+
+lab_data_parser.py 의 학과/교수/연구실 데이터를 어휘로 삼아
+합성 연구실 카탈로그(기본 100 / 1,000 / 10,000개)와 프로젝트를 만들고,
+메모리 SQLite 에서 다음 항목의 p50/p99 지연 시간과 최대 메모리 할당량을 측정합니다.
+
+    - LabMatchingService.find_matching_labs
+    - LabMatchingService.calculate_similarity_score
+    - LabMatchingService.save_matching_results
+
+지연 시간은 같은 실행에서 잰 기준 작업(순수 파이썬 + SQLite, 저장소 코드와 무관)의
+p50 대비 배수(p50_x / p99_x)로 환산해 비교하므로, 기준값을 만든 머신과 속도가 달라도
+같은 기준값을 쓸 수 있습니다. 저장된 기준값(benchmark_baseline.json)보다 허용 오차 이상
+느려지거나 메모리를 더 쓰면 회귀로 표시하고 종료 코드 1을 반환합니다.
+
+사용 예)
+    python benchmark_matching.py
+    python benchmark_matching.py --sizes 100 1000 --projects 20
+    python benchmark_matching.py --update-baseline
+"""
+import argparse
+import gc
+import json
+import math
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models import User, Project, Department, Professor, ResearchLab
+from app.schemas.research_lab import ProjectMatchingRequest
+from app.services.lab_index import lab_feature_index
+from app.services.lab_matching import LabMatchingService
+from lab_data_parser import DEPARTMENTS_DATA, PROFESSORS_DATA, RESEARCH_LABS_DATA
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+
+SERVICE_TYPES = ['APP', 'WEB', 'AI', 'ETC']
+
+PROJECT_TEMPLATES = [
+    "{0}과 {1}을 활용한 {2} 서비스",
+    "{0} 기반 {1} 플랫폼으로 {2} 문제를 해결합니다",
+    "{0} 기술로 {1} 데이터를 분석하는 {2} 앱",
+    "A {0} powered {1} solution for {2}"
+]
+
+PROJECT_DOMAINS = ['헬스케어', '교육', '핀테크', '자율주행', '게임', '환경', '제조', '모바일 커머스', '웹 커뮤니티']
+
+
+class Vocabulary:
+    """lab_data_parser.py 데이터에서 뽑은 합성 데이터용 어휘"""
+
+    def __init__(self):
+        self.research_areas = sorted({area for lab in RESEARCH_LABS_DATA for area in json.loads(lab[7])})
+        self.keywords = sorted({kw for lab in RESEARCH_LABS_DATA for kw in lab[8].split(',')})
+        self.descriptions = [lab[9] for lab in RESEARCH_LABS_DATA]
+        self.techs = sorted({tech for lab in RESEARCH_LABS_DATA for tech in json.loads(lab[10])})
+        self.lab_names = [(lab[1], lab[2]) for lab in RESEARCH_LABS_DATA]
+        self.research_fields = sorted({
+            field.strip() for prof in PROFESSORS_DATA if prof[7] for field in prof[7].split(',')
+        })
+
+
+def build_catalog(db, vocab: Vocabulary, n_labs: int, n_projects: int, rng: random.Random) -> List[int]:
+    """합성 학과/교수/연구실/프로젝트 생성, 프로젝트 ID 목록 반환"""
+    db.bulk_insert_mappings(Department, [
+        {'department_id': i + 1, 'name': name, 'name_en': name_en, 'building': building, 'description': description}
+        for i, (name, name_en, building, description) in enumerate(DEPARTMENTS_DATA)
+    ])
+
+    db.bulk_insert_mappings(Professor, [
+        {
+            'professor_id': i + 1,
+            'department_id': rng.randint(1, len(DEPARTMENTS_DATA)),
+            'name': f"교수{i + 1}",
+            'position': rng.choice(['교수', '부교수', '조교수']),
+            'email': f"prof{i + 1}@sejong.ac.kr",
+            'phone': f"02-3408-{rng.randint(1000, 9999)}",
+            'research_fields': ", ".join(rng.sample(vocab.research_fields, 2)),
+            'is_active': True
+        }
+        for i in range(n_labs)
+    ])
+
+    labs = []
+    for i in range(n_labs):
+        name, name_en = rng.choice(vocab.lab_names)
+        labs.append({
+            'lab_id': i + 1,
+            'director_id': i + 1,
+            'name': f"{name} {i + 1}",
+            'name_en': f"{name_en} {i + 1}",
+            'research_areas': rng.sample(vocab.research_areas, 3),
+            'keywords': ",".join(rng.sample(vocab.keywords, 5)),
+            'description': " ".join(rng.sample(vocab.descriptions, 2)),
+            'tech_stack': rng.sample(vocab.techs, 4),
+            'is_active': True
+        })
+    db.bulk_insert_mappings(ResearchLab, labs)
+
+    db.add(User(user_id=1, email="bench@sejong.ac.kr", password_hash="-", name="벤치마크"))
+    projects = []
+    for i in range(n_projects):
+        terms = rng.sample(vocab.keywords + vocab.research_areas, 2)
+        description = rng.choice(PROJECT_TEMPLATES).format(terms[0], terms[1], rng.choice(PROJECT_DOMAINS))
+        projects.append({
+            'project_id': i + 1,
+            'owner_id': 1,
+            'name': f"프로젝트 {i + 1}",
+            'description': description,
+            'idea_name': rng.choice(vocab.research_areas),
+            'service_type': rng.choice(SERVICE_TYPES),
+            'target_type': 'B2C',
+            'is_active': True
+        })
+    db.bulk_insert_mappings(Project, projects)
+    db.commit()
+    return [project['project_id'] for project in projects]
+
+
+def _percentile(samples: List[float], percent: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, math.ceil(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def measure(calls: List[Callable[[], None]]) -> Dict[str, float]:
+    """호출 목록을 실행해 지연 시간(ms)과 호출당 최대 할당량(KiB) 측정
+
+    시간 측정과 메모리 측정은 tracemalloc 오버헤드가 섞이지 않도록 따로 수행하고,
+    시간 측정 중에는 timeit과 같이 GC를 꺼서 수집 시점에 따른 튐을 줄입니다.
+    """
+    timings = []
+    gc.collect()
+    gc.disable()
+    try:
+        for call in calls:
+            started = time.perf_counter()
+            call()
+            timings.append((time.perf_counter() - started) * 1000)
+    finally:
+        gc.enable()
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for call in calls:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            call()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append((peak - before) / 1024)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'p50_ms': round(statistics.median(timings), 4),
+        'p99_ms': round(_percentile(timings, 99), 4),
+        'peak_kib': round(statistics.median(peaks), 1),
+        'samples': len(calls)
+    }
+
+
+# 기준 작업 입력 (저장소 코드가 바뀌어도 기준 작업의 비용은 그대로 유지되어야 함)
+_REFERENCE_TEXT = " ".join(f"단어{i % 97} word{i % 89}" for i in range(2000)).split()
+_REFERENCE_CALLS = 200
+
+
+def measure_reference() -> Dict[str, float]:
+    """머신 속도 기준 작업 측정 (단어 빈도 집계 + 메모리 SQLite 조회)"""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE reference (value TEXT)")
+    conn.executemany("INSERT INTO reference VALUES (?)", [(token,) for token in _REFERENCE_TEXT])
+
+    def call() -> None:
+        counts: Dict[str, int] = {}
+        for token in _REFERENCE_TEXT:
+            counts[token] = counts.get(token, 0) + 1
+        sorted(counts.items(), key=lambda item: -item[1])
+        conn.execute("SELECT count(*), sum(length(value)) FROM reference WHERE value LIKE '%7%'").fetchone()
+
+    try:
+        return measure([call] * _REFERENCE_CALLS)
+    finally:
+        conn.close()
+
+
+def normalize(results: Dict[str, Dict[str, float]], reference: Dict[str, float]) -> Dict[str, Dict[str, float]]:
+    """지연 시간을 기준 작업 p50 대비 배수로 환산 (p50_x, p99_x)"""
+    unit = reference['p50_ms']
+    for metrics in results.values():
+        metrics['p50_x'] = round(metrics['p50_ms'] / unit, 3)
+        metrics['p99_x'] = round(metrics['p99_ms'] / unit, 3)
+    return results
+
+
+def run_size(n_labs: int, n_projects: int, pairs: int, repeat: int, seed: int) -> Dict[str, Dict[str, float]]:
+    """카탈로그 크기 하나에 대한 벤치마크 (지연 시간은 기준 작업 대비 배수 포함)"""
+    rng = random.Random(seed)
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    # 이전 카탈로그의 특징이 섞이지 않도록 초기화
+    lab_feature_index.invalidate()
+
+    try:
+        project_ids = build_catalog(db, Vocabulary(), n_labs, n_projects, rng)
+        service = LabMatchingService(db)
+
+        # 카탈로그 특징/색인 생성은 첫 요청에만 발생하므로 따로 측정
+        started = time.perf_counter()
+        service.find_matching_labs(ProjectMatchingRequest(project_id=project_ids[0], max_results=10, min_score=0.2))
+        cold_ms = (time.perf_counter() - started) * 1000
+
+        results: Dict[str, Dict[str, float]] = {}
+        results['find_matching_labs'] = measure([
+            lambda project_id=project_id: service.find_matching_labs(
+                ProjectMatchingRequest(project_id=project_id, max_results=10, min_score=0.2)
+            )
+            for _ in range(repeat) for project_id in project_ids
+        ])
+        results['find_matching_labs']['cold_ms'] = round(cold_ms, 2)
+
+        projects = db.query(Project).all()
+        labs = db.query(ResearchLab).limit(max(pairs, 1)).all()
+        results['calculate_similarity_score'] = measure([
+            lambda project=rng.choice(projects), lab=rng.choice(labs): service.calculate_similarity_score(project, lab)
+            for _ in range(pairs)
+        ])
+
+        # 첫 저장은 삽입, 이후 저장은 점수가 바뀐 행의 갱신 경로를 탐
+        matches = {
+            project_id: service.find_matching_labs(
+                ProjectMatchingRequest(project_id=project_id, max_results=10, min_score=0.2)
+            )
+            for project_id in project_ids
+        }
+
+        def save(project_id: int) -> None:
+            for match in matches[project_id]:
+                match['similarity_score'] = round(match['similarity_score'] + rng.random() * 1e-3, 6)
+            service.save_matching_results(project_id, matches[project_id])
+
+        results['save_matching_results'] = measure([
+            lambda project_id=project_id: save(project_id)
+            for _ in range(max(repeat, 2)) for project_id in project_ids
+        ])
+
+        # 기준 작업은 측정 직후 같은 조건에서 잼
+        reference = measure_reference()
+        normalize(results, reference)
+        results['reference'] = reference
+        return results
+    finally:
+        db.close()
+        engine.dispose()
+        lab_feature_index.invalidate()
+
+
+# 지표별 최소 차이 (측정 잡음이 큰 짧은 구간에서 오탐을 막기 위함, 시간은 기준 작업 배수)
+MIN_DELTA = {'p50_x': 0.5, 'p99_x': 0.5, 'peak_kib': 8.0}
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float, metrics_to_check=tuple(MIN_DELTA)) -> List[str]:
+    """기준값 대비 회귀 항목 목록 (상대 오차와 최소 차이를 모두 넘은 경우)
+
+    절대 시간(p50_ms 등)은 머신마다 다르므로 비교하지 않습니다.
+    """
+    regressions = []
+    for size, operations in results.items():
+        for operation, metrics in operations.items():
+            expected = baseline.get(size, {}).get(operation)
+            if not expected or operation == 'reference':
+                continue
+            for metric in metrics_to_check:
+                min_delta = MIN_DELTA[metric]
+                if metric not in expected:
+                    continue
+                if (metrics[metric] > expected[metric] * (1 + tolerance)
+                        and metrics[metric] - expected[metric] >= min_delta):
+                    regressions.append(
+                        f"{size}개 연구실 / {operation} / {metric}: "
+                        f"{metrics[metric]} (기준 {expected[metric]}, +{metrics[metric] / expected[metric] - 1:.0%})"
+                    )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="연구실 매칭 엔진 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000], help="연구실 카탈로그 크기")
+    parser.add_argument("--projects", type=int, default=30, help="카탈로그별 프로젝트 수")
+    parser.add_argument("--repeat", type=int, default=5, help="프로젝트별 반복 측정 횟수")
+    parser.add_argument("--pairs", type=int, default=200, help="calculate_similarity_score 측정 횟수")
+    parser.add_argument("--seed", type=int, default=42, help="합성 데이터 시드")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="회귀로 판단할 허용 오차 (0.5 = 50%%)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="기준값 JSON 경로")
+    parser.add_argument("--update-baseline", action="store_true", help="측정 결과를 기준값으로 저장")
+    args = parser.parse_args()
+
+    print("⏱️ 연구실 매칭 벤치마크를 시작합니다...")
+    results = {}
+    for size in args.sizes:
+        print(f"\n🔬 연구실 {size}개 카탈로그 측정 중...")
+        results[str(size)] = run_size(size, args.projects, args.pairs, args.repeat, args.seed)
+        for operation, metrics in results[str(size)].items():
+            line = f"   - {operation:28} p50 {metrics['p50_ms']:9.3f}ms  p99 {metrics['p99_ms']:9.3f}ms  peak {metrics['peak_kib']:9.1f}KiB"
+            if 'p50_x' in metrics:
+                line += f"  (기준 작업 x{metrics['p50_x']:.2f})"
+            if 'cold_ms' in metrics:
+                line += f"  (첫 요청 {metrics['cold_ms']:.1f}ms)"
+            print(line)
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)
+        # 머신마다 다른 절대 시간은 저장하지 않음
+        baseline.update({
+            size: {
+                operation: {metric: value for metric, value in metrics.items() if not metric.endswith('_ms')}
+                for operation, metrics in operations.items() if operation != 'reference'
+            }
+            for size, operations in results.items()
+        })
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, ensure_ascii=False, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\n💾 기준값을 저장했습니다: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("\n⚠️ 기준값 파일이 없습니다. --update-baseline 으로 먼저 생성하세요.")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print("\n❌ 성능 회귀가 감지되었습니다:")
+        for regression in regressions:
+            print(f"   - {regression}")
+        return 1
+
+    print("\n✅ 기준값 대비 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+# backend/benchmark_responses.py
+"""
+응답 직렬화 경로 벤치마크 (FastAPI 기본 경로 vs as_response)
+
+query_plan_audit.py 와 같은 합성 데이터를 임시 SQLite 에 채운 뒤, 응답이 가장 큰 API 의
+실제 응답 데이터로 두 직렬화 경로의 p50/p99 지연 시간과 최대 메모리 할당량을 비교합니다.
+
+    - before: FastAPI 기본 경로 (response_model 로 SuccessResponse 를 다시 검증한 뒤 pydantic 으로 직렬화,
+              /ai-reports/{id} 는 모델을 model_dump() 로 풀어서 넘기던 방식)
+    - after : SuccessResponse(...).as_response() (검증 없이 orjson 으로 바로 bytes)
+    - 추천 캐시 적중: 캐시에 목록을 두고 매번 직렬화(before) vs 직렬화한 bytes 를 캐시(after)
+
+직렬화 단계에는 핸들러가 SuccessResponse 를 만드는 비용과 Response 생성까지 포함합니다.
+
+마지막으로 각 API 를 TestClient 로 호출한 전체 요청 지연 시간도 출력합니다.
+API 응답을 다시 읽어 만든 데이터라 날짜 필드는 문자열입니다.
+
+사용 예)
+    python benchmark_responses.py
+    python benchmark_responses.py --repeat 500 --labs 1000
+"""
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+import query_plan_audit  # 임시 DB 로 환경 변수를 먼저 설정
+from benchmark_matching import _percentile
+from fastapi import APIRouter, Response
+from fastapi.routing import APIRoute, serialize_response
+from fastapi.testclient import TestClient
+
+from app import database
+from app.auth import create_access_token
+from app.main import app
+from app.migrations import upgrade
+from app.routers import ai_reports, research_labs
+from app.models import AIReport
+from app.schemas.ai_report import AIReportResponse
+from app.schemas.common import CursorPaginatedResponse, SuccessResponse
+from app.utils.responses import RawJSON, dumps_bytes, encode_object
+
+
+def measure(call: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """지연 시간(ms)과 호출 1회의 최대 할당량(KiB) - 시간은 GC 를 끄고, 메모리는 따로 측정"""
+    timings = []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            call()
+            timings.append((time.perf_counter() - started) * 1000)
+    finally:
+        gc.enable()
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        'p50_ms': _percentile(timings, 50),
+        'p99_ms': _percentile(timings, 99),
+        'peak_kib': peak / 1024
+    }
+
+
+def fastapi_serializer(router: APIRouter, path: str, build: Callable[[], Any]) -> Callable[[], Response]:
+    """핸들러 반환값 생성 + FastAPI 기본 경로(검증 + pydantic dump_json + Response)를 그대로 실행"""
+    route = next(route for route in router.routes if isinstance(route, APIRoute) and route.path == path)
+
+    def serialize():
+        # async 핸들러의 직렬화는 await 할 곳이 없으므로 이벤트 루프 없이 코루틴을 바로 완료
+        coroutine = serialize_response(field=route.response_field, response_content=build(), dump_json=True)
+        try:
+            coroutine.send(None)
+        except StopIteration as done:
+            return Response(content=done.value, media_type="application/json")
+        raise RuntimeError("serialize_response 가 완료되지 않았습니다.")
+    return serialize
+
+
+def prepare_report(report_id: int) -> None:
+    """합성 보고서 하나를 실제 생성 결과 크기로 채움"""
+    db = database.SessionLocal()
+    try:
+        report = db.get(AIReport, report_id)
+        report.status = "COMPLETED"
+        report.requester_id = 1
+        report.idea_info = {"idea_name": "캠퍼스 중고거래", "description": "학생 간 중고 거래 플랫폼 " * 20}
+        report.existing_services = {"services": [{"name": f"서비스{i}", "summary": "요약 " * 40} for i in range(15)]}
+        report.service_limitations = {"limitations": ["한계 " * 30 for _ in range(10)]}
+        report.lean_canvas_detailed = {block: "내용 " * 80 for block in (
+            "problem", "customer_segments", "unique_value_proposition", "solution", "channels",
+            "revenue_streams", "cost_structure", "key_metrics", "unfair_advantage"
+        )}
+        db.commit()
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="응답 직렬화 경로 벤치마크")
+    parser.add_argument("--users", type=int, default=50, help="합성 사용자 수")
+    parser.add_argument("--labs", type=int, default=300, help="합성 연구실 수")
+    parser.add_argument("--projects", type=int, default=500, help="합성 프로젝트 수")
+    parser.add_argument("--repeat", type=int, default=200, help="항목별 반복 측정 횟수")
+    parser.add_argument("--seed", type=int, default=42, help="합성 데이터 시드")
+    args = parser.parse_args()
+
+    print("⏱️ 응답 직렬화 벤치마크를 시작합니다...")
+    upgrade(database.engine)
+    with TestClient(app) as client:
+        ids = query_plan_audit.seed(args.users, args.labs, args.projects, random.Random(args.seed))
+        prepare_report(ids['report_id'])
+        headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(ids['user_id'])})}"}
+
+        routes = {
+            "/research-labs/?limit=100": (research_labs.router, "/"),
+            f"/research-labs/recommendations/{ids['project_id']}": (research_labs.router, "/recommendations/{project_id}"),
+            f"/ai-reports/{ids['report_id']}": (ai_reports.router, "/{report_id}"),
+        }
+        bodies = {url: client.get(url, headers=headers).json() for url in routes}
+
+        cases: List[tuple] = []
+        for url, (router, path) in routes.items():
+            body = bodies[url]
+            if router is ai_reports.router:
+                report = AIReportResponse(**body["data"])
+                before = lambda report=report, message=body["message"]: SuccessResponse(message=message, data=report.model_dump())
+                after = lambda report=report, message=body["message"]: SuccessResponse(message=message, data=report).as_response()
+            else:
+                model_class = CursorPaginatedResponse if "next_cursor" in body else SuccessResponse
+                before = lambda model_class=model_class, body=body: model_class(**body)
+                after = lambda model_class=model_class, body=body: model_class(**body).as_response()
+            cases.append((url, fastapi_serializer(router, path, before), after))
+
+        # 추천 캐시 적중: 목록을 캐시해 두고 매번 직렬화(before) vs 직렬화한 bytes 를 캐시(after)
+        recommendations = bodies[f"/research-labs/recommendations/{ids['project_id']}"]
+        cached = RawJSON(dumps_bytes(recommendations["data"]["recommendations"]))
+        cases.append((
+            "추천 캐시 적중",
+            fastapi_serializer(research_labs.router, "/recommendations/{project_id}", lambda: SuccessResponse(
+                message=recommendations["message"],
+                data={"project_name": recommendations["data"]["project_name"],
+                      "recommendations": recommendations["data"]["recommendations"]}
+            )),
+            lambda: SuccessResponse(
+                message=recommendations["message"],
+                data=encode_object({"project_name": recommendations["data"]["project_name"], "recommendations": cached})
+            ).as_response()
+        ))
+
+        print("\n🔬 직렬화 단계 (before → after)")
+        for url, before, after in cases:
+            size = len(after().body)
+            first, second = measure(before, args.repeat), measure(after, args.repeat)
+            print(f"   - {url:42} {size / 1024:7.1f}KiB")
+            for name, metrics in (("before", first), ("after", second)):
+                print(f"       {name:7} p50 {metrics['p50_ms']:8.3f}ms  p99 {metrics['p99_ms']:8.3f}ms  peak {metrics['peak_kib']:8.1f}KiB")
+            print(f"       → p50 {first['p50_ms'] / second['p50_ms']:.1f}배")
+
+        print("\n🌐 전체 요청 (TestClient, 현재 코드)")
+        for url in routes:
+            metrics = measure(lambda url=url: client.get(url, headers=headers), max(args.repeat // 4, 10))
+            print(f"   - {url:42} p50 {metrics['p50_ms']:8.3f}ms  p99 {metrics['p99_ms']:8.3f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+# backend/benchmark_token_cache.py
+"""
+검증된 토큰 캐시(app.services.token_cache) 마이크로 벤치마크
+
+app.auth.verify_token 을 직접 호출해 다음 두 경로의 p50/p99 지연 시간을 비교합니다.
+
+    - miss: 캐시에 없는 토큰 → jwt.decode (HMAC 서명 확인 + 클레임 검사) 후 캐시에 저장
+    - hit : 이미 검증한 토큰 → sha256 해시로 캐시 조회
+
+--tokens 로 서로 다른 토큰 수를 늘리면 캐시 크기(TOKEN_CACHE_MAX_ENTRIES)에 따른
+LRU 제거 비용까지 함께 볼 수 있습니다.
+
+사용 예)
+    python benchmark_token_cache.py
+    python benchmark_token_cache.py --tokens 50000 --repeat 5
+"""
+import argparse
+import gc
+import os
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+os.environ.setdefault("SECRET_KEY", "benchmark-token-cache")
+
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.auth import create_access_token, verify_token
+from app.services.token_cache import token_cache
+from benchmark_matching import _percentile
+
+
+def timed(calls: List[Callable[[], object]]) -> Dict[str, float]:
+    """호출별 지연 시간(µs) 측정 (측정 중 GC 끔)"""
+    timings = []
+    gc.collect()
+    gc.disable()
+    try:
+        for call in calls:
+            started = time.perf_counter()
+            call()
+            timings.append((time.perf_counter() - started) * 1_000_000)
+    finally:
+        gc.enable()
+    return {
+        'p50_us': _percentile(timings, 50),
+        'p99_us': _percentile(timings, 99),
+        'mean_us': statistics.fmean(timings)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="검증된 토큰 캐시 벤치마크")
+    parser.add_argument("--tokens", type=int, default=2000, help="서로 다른 토큰 수")
+    parser.add_argument("--repeat", type=int, default=3, help="hit 경로 반복 횟수 (토큰 수 × 반복)")
+    args = parser.parse_args()
+
+    print("⏱️ 토큰 검증 캐시 벤치마크를 시작합니다...")
+    credentials = [
+        HTTPAuthorizationCredentials(
+            scheme="Bearer",
+            credentials=create_access_token(data={"sub": str(user_id), "ver": 0})
+        )
+        for user_id in range(1, args.tokens + 1)
+    ]
+
+    token_cache.clear()
+    miss = timed([lambda c=c: verify_token(c) for c in credentials])
+    hit = timed([lambda c=c: verify_token(c) for c in credentials * args.repeat])
+    stats = token_cache.stats()
+
+    print(f"\n🔬 토큰 {args.tokens}개 (캐시 한도 {token_cache.max_entries}개)")
+    if args.tokens > token_cache.max_entries:
+        print("   ⚠️ 토큰 수가 캐시 한도보다 많아 hit 경로도 LRU 제거 후 다시 검증합니다.")
+    for name, metrics in (("miss (jwt.decode)", miss), ("hit (cache)", hit)):
+        print(f"   - {name:18} p50 {metrics['p50_us']:8.2f}µs  p99 {metrics['p99_us']:8.2f}µs  mean {metrics['mean_us']:8.2f}µs")
+    print(f"\n   hit 가 miss 보다 p50 기준 {miss['p50_us'] / hit['p50_us']:.1f}배 빠릅니다.")
+    print(f"   캐시 항목 {stats['entries']}개, hits {stats['hits']}, misses {stats['misses']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,8 @@ import sqlite3
 import json
 from datetime import datetime, timedelta
 
+from app.services.skill_tags import skill_tags
+
 def insert_dummy_data():
     # 데이터베이스 연결
     conn = sqlite3.connect('sejong_startup.db')
@@ -179,6 +181,12 @@ def insert_dummy_data():
                 INSERT INTO team_openings (project_id, role_name, description, required_skills, commitment_type, status, created_at)
                 VALUES (?, ?, ?, ?, ?, ?, datetime('now', ? || ' days'))
             """, opening_data)
+            # 기술스택 검색용 태그 (API 로 등록할 때와 같은 정규화)
+            opening_id = cursor.lastrowid
+            cursor.executemany(
+                "INSERT INTO team_opening_skills (opening_id, skill) VALUES (?, ?)",
+                [(opening_id, tag) for tag in skill_tags(opening_data[3])]
+            )
         
         print(f"✅ {len(openings_data)}개의 모집 공고가 추가되었습니다.")
         
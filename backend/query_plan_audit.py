@@ -0,0 +1,267 @@
+# backend/query_plan_audit.py
+"""
+라우터 쿼리 실행 계획 점검 스크립트
+
+임시 SQLite 파일에 마이그레이션을 적용하고 합성 데이터를 채운 뒤,
+주요 조회 API 를 실제로 호출하면서 실행된 SELECT 문을 모두 수집합니다.
+수집한 쿼리를 같은 파라미터로 EXPLAIN QUERY PLAN 에 넣어
+인덱스 없이 테이블 전체를 읽는(SCAN) 단계가 있는 API 를 보고합니다.
+
+사용 예)
+    python query_plan_audit.py
+    python query_plan_audit.py --verbose
+    python query_plan_audit.py --fail-on-scan projects team_openings
+"""
+import argparse
+import os
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+# app 모듈이 설정을 읽기 전에 임시 DB 를 가리키도록 지정
+_DB_DIR = tempfile.mkdtemp(prefix="query_plan_audit_")
+DB_PATH = os.path.join(_DB_DIR, "audit.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+os.environ.pop("DATABASE_READ_URL", None)
+os.environ.setdefault("SECRET_KEY", "query-plan-audit")
+os.environ["EVENT_LOOP_MONITOR_ENABLED"] = "false"
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app import database
+from app.auth import create_access_token
+from app.main import app
+from app.migrations import upgrade
+from app.models import User, Project, TeamOpening, TeamOpeningSkill, TeamApplication, AIReport, ProjectLabMatching
+from app.services.skill_tags import skill_tags
+from benchmark_matching import Vocabulary, build_catalog
+
+# 점검할 API (경로의 {project_id} 등은 합성 데이터의 ID 로 채움)
+AUDITED_ROUTES = [
+    "/projects/",
+    "/projects/public",
+    "/projects/{project_id}",
+    "/team/openings/",
+    "/team/openings/search?skills=Python,머신러닝&skills_mode=all",
+    "/team/openings/project/{project_id}",
+    "/team/openings/{opening_id}/applications",
+    "/team/applications/my",
+    "/team/statistics",
+    "/team/recommendations/{user_id}",
+    "/dashboard/personal",
+    "/dashboard/platform",
+    "/dashboard/trending",
+    "/research-labs/",
+    "/research-labs/?department=컴퓨터",
+    "/research-labs/?keyword=보안&research_area=인공지능",
+    "/research-labs/departments",
+    "/research-labs/statistics",
+    "/research-labs/{lab_id}",
+    "/research-labs/project/{project_id}/matches",
+    "/research-labs/recommendations/{project_id}",
+    "/ai-reports/my-projects",
+    "/ai-reports/project/{project_id}",
+    "/ai-reports/{report_id}",
+    "/users/me",
+    "/resumes/me",
+    "/lean-canvas/project/{project_id}",
+]
+
+SKILLS = ["Python, React", "Java, Spring", "Python, 머신러닝, PyTorch", "Figma", "Flutter, Firebase", "딥러닝, Python"]
+
+STATUSES = {
+    'opening': ['OPEN', 'OPEN', 'OPEN', 'CLOSED'],
+    'application': ['PENDING', 'PENDING', 'ACCEPTED', 'REJECTED'],
+    'report': ['COMPLETED', 'COMPLETED', 'GENERATING', 'FAILED'],
+}
+
+
+def seed(n_users: int, n_labs: int, n_projects: int, rng: random.Random) -> Dict[str, int]:
+    """합성 사용자/프로젝트/모집 공고/지원/보고서/매칭 데이터 생성"""
+    db = database.SessionLocal()
+    try:
+        project_ids = build_catalog(db, Vocabulary(), n_labs, n_projects, rng)
+        now = datetime.utcnow()
+
+        db.bulk_insert_mappings(User, [
+            {'user_id': user_id, 'email': f"user{user_id}@sejong.ac.kr", 'password_hash': "-",
+             'name': f"사용자{user_id}", 'major': rng.choice(['컴퓨터공학', '소프트웨어', '데이터사이언스']),
+             'user_type': rng.choice(['DREAMER', 'BUILDER', 'SPECIALIST'])}
+            for user_id in range(2, n_users + 1)
+        ])
+        db.bulk_update_mappings(Project, [
+            {'project_id': project_id, 'owner_id': rng.randint(1, n_users),
+             'is_public': rng.random() < 0.8, 'created_at': now - timedelta(minutes=project_id)}
+            for project_id in project_ids
+        ])
+
+        openings = []
+        for opening_id in range(1, n_projects * 2 + 1):
+            openings.append({
+                'opening_id': opening_id, 'project_id': rng.choice(project_ids),
+                'role_name': rng.choice(['백엔드', '프론트엔드', '디자이너', 'PM']),
+                'description': "함께할 팀원을 찾습니다", 'required_skills': rng.choice(SKILLS),
+                'status': rng.choice(STATUSES['opening']), 'created_at': now - timedelta(minutes=opening_id)
+            })
+        db.bulk_insert_mappings(TeamOpening, openings)
+        db.bulk_insert_mappings(TeamOpeningSkill, [
+            {'opening_id': opening['opening_id'], 'skill': tag}
+            for opening in openings for tag in skill_tags(opening['required_skills'])
+        ])
+
+        db.bulk_insert_mappings(TeamApplication, [
+            {'application_id': application_id, 'opening_id': rng.randint(1, len(openings)),
+             'applicant_id': rng.randint(1, n_users), 'message': "지원합니다",
+             'status': rng.choice(STATUSES['application']), 'applied_at': now - timedelta(minutes=application_id)}
+            for application_id in range(1, n_projects * 5 + 1)
+        ])
+
+        db.bulk_insert_mappings(AIReport, [
+            {'report_id': report_id, 'project_id': rng.choice(project_ids), 'requester_id': 1,
+             'report_type': 'LEAN_CANVAS', 'status': rng.choice(STATUSES['report']),
+             'created_at': now - timedelta(minutes=report_id)}
+            for report_id in range(1, n_projects + 1)
+        ])
+
+        db.bulk_insert_mappings(ProjectLabMatching, [
+            {'project_id': project_id, 'lab_id': lab_id, 'similarity_score': round(rng.random(), 4),
+             'status': 'SUGGESTED'}
+            for project_id in project_ids for lab_id in rng.sample(range(1, n_labs + 1), 10)
+        ])
+        db.commit()
+
+        owner_project = db.query(Project.project_id).filter(Project.owner_id == 1).first()
+        return {
+            'user_id': 1,
+            'project_id': owner_project.project_id if owner_project else project_ids[0],
+            'opening_id': 1,
+            'lab_id': 1,
+            'report_id': 1
+        }
+    finally:
+        db.close()
+
+
+class QueryRecorder:
+    """요청 처리 중 실행된 SELECT 문과 파라미터를 API 별로 수집"""
+
+    def __init__(self):
+        self.route: Optional[str] = None
+        self.queries: Dict[str, List[Tuple[str, tuple]]] = {}
+
+    def attach(self, engines) -> None:
+        for engine in engines:
+            event.listen(engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        if self.route is None or executemany:
+            return
+        if not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            return
+        recorded = self.queries.setdefault(self.route, [])
+        entry = (statement, tuple(parameters or ()))
+        if entry not in recorded:
+            recorded.append(entry)
+
+
+def explain(conn: sqlite3.Connection, statement: str, parameters: tuple) -> List[str]:
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+
+
+def full_scans(plan: List[str]) -> List[str]:
+    """인덱스를 쓰지 않는 테이블 전체 스캔 단계 (SCAN 테이블명)"""
+    scans = []
+    # 서브쿼리 결과(이미 걸러진 임시 테이블)를 읽는 단계는 제외
+    derived = {detail.split()[1] for detail in plan if detail.startswith(("MATERIALIZE ", "CO-ROUTINE "))}
+    for detail in plan:
+        if not detail.startswith("SCAN ") or " USING " in detail or detail.startswith("SCAN CONSTANT"):
+            continue
+        # FTS5 등 가상 테이블은 자체 색인으로 조회
+        if " VIRTUAL TABLE " in detail or detail.split()[1] in derived:
+            continue
+        scans.append(detail.split()[1])
+    return scans
+
+
+def main():
+    parser = argparse.ArgumentParser(description="라우터 쿼리 실행 계획 점검")
+    parser.add_argument("--users", type=int, default=50, help="합성 사용자 수")
+    parser.add_argument("--labs", type=int, default=300, help="합성 연구실 수")
+    parser.add_argument("--projects", type=int, default=500, help="합성 프로젝트 수")
+    parser.add_argument("--seed", type=int, default=42, help="합성 데이터 시드")
+    parser.add_argument("--analyze", action="store_true", help="점검 전에 ANALYZE 로 통계 수집")
+    parser.add_argument("--verbose", action="store_true", help="모든 쿼리의 실행 계획 출력")
+    parser.add_argument("--fail-on-scan", nargs="*", metavar="TABLE",
+                        help="이 테이블(생략하면 전체)에 전체 스캔이 있으면 종료 코드 1")
+    args = parser.parse_args()
+
+    print(f"🔍 쿼리 실행 계획 점검을 시작합니다... (임시 DB: {DB_PATH})")
+    # 서버 시작 시에는 버전 확인만 하므로 먼저 스키마를 적용
+    upgrade(database.engine)
+    recorder = QueryRecorder()
+    with TestClient(app) as client:
+        ids = seed(args.users, args.labs, args.projects, random.Random(args.seed))
+        if args.analyze:
+            with sqlite3.connect(DB_PATH) as conn:
+                conn.execute("ANALYZE")
+
+        recorder.attach([
+            database.engine, database.read_engine,
+            database.async_engine.sync_engine, database.async_read_engine.sync_engine
+        ])
+        headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(ids['user_id'])})}"}
+        for route in AUDITED_ROUTES:
+            recorder.route = route
+            response = client.get(route.format(**ids), headers=headers)
+            recorder.route = None
+            if response.status_code >= 400:
+                print(f"   ⚠️ {route}: HTTP {response.status_code}")
+
+    flagged: Dict[str, List[str]] = {}
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        for route in AUDITED_ROUTES:
+            scanned = []
+            for statement, parameters in recorder.queries.get(route, []):
+                plan = explain(conn, statement, parameters)
+                scans = full_scans(plan)
+                scanned.extend(table for table in scans if table not in scanned)
+                if args.verbose or scans:
+                    print(f"\n   [{route}] {' '.join(statement.split())[:160]}")
+                    for detail in plan:
+                        print(f"      {'❌' if detail.startswith('SCAN ') and detail.split()[1] in scans else '  '} {detail}")
+            if scanned:
+                flagged[route] = scanned
+    finally:
+        conn.close()
+
+    print("\n📋 API 별 결과")
+    for route in AUDITED_ROUTES:
+        count = len(recorder.queries.get(route, []))
+        if route in flagged:
+            print(f"   ❌ {route:45} 쿼리 {count}개, 전체 스캔: {', '.join(flagged[route])}")
+        else:
+            print(f"   ✅ {route:45} 쿼리 {count}개")
+
+    if args.fail_on_scan is not None:
+        watched = set(args.fail_on_scan)
+        failing = {
+            route: [table for table in tables if not watched or table in watched]
+            for route, tables in flagged.items()
+        }
+        if any(failing.values()):
+            print("\n❌ 전체 스캔이 남아 있습니다.")
+            return 1
+    print("\n✅ 점검 완료")
+    return 0
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    shutil.rmtree(_DB_DIR, ignore_errors=True)
+    sys.exit(exit_code)
@@ -0,0 +1,157 @@
+# backend/tests/conftest.py
+"""
+공용 pytest 픽스처
+
+app 모듈이 설정을 읽기 전에 임시 SQLite 파일을 가리키도록 지정하고,
+세션 시작 시 마이그레이션을 한 번 적용합니다. 테스트마다 모든 테이블을 비우고
+프로세스 내 캐시(연구실 특징, 추천, 인증 주체, 토큰)를 초기화합니다.
+"""
+import os
+import random
+import shutil
+import tempfile
+
+_DB_DIR = tempfile.mkdtemp(prefix="sejong_tests_")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_DB_DIR, 'test.db')}"
+os.environ.pop("DATABASE_READ_URL", None)
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ["EVENT_LOOP_MONITOR_ENABLED"] = "false"
+# 테스트에서는 해싱 비용을 최소로
+os.environ["BCRYPT_ROUNDS"] = "4"
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app import database
+from app.auth import create_access_token
+from app.migrations import upgrade
+from app.models import User
+from app.services.lab_index import lab_feature_index
+from app.services.principal_cache import principal_cache
+from app.services.recommendation_cache import recommendation_cache
+from app.services.token_cache import token_cache
+from benchmark_matching import Vocabulary, build_catalog
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(_DB_DIR, ignore_errors=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def schema():
+    """임시 DB 에 최신 스키마 적용 (세션당 한 번)"""
+    upgrade(database.engine)
+    yield
+
+
+def _clear_tables() -> None:
+    with database.engine.begin() as conn:
+        for table in reversed(database.Base.metadata.sorted_tables):
+            conn.execute(table.delete())
+
+
+def _clear_caches() -> None:
+    lab_feature_index.invalidate()
+    recommendation_cache.clear()
+    principal_cache.clear()
+    token_cache.clear()
+
+
+def reset_state() -> None:
+    """모든 테이블과 프로세스 내 캐시 초기화"""
+    _clear_tables()
+    _clear_caches()
+
+
+@pytest.fixture(autouse=True)
+def clean_state(schema):
+    reset_state()
+    yield
+    _clear_caches()
+
+
+@pytest.fixture
+def reset():
+    """한 테스트 안에서 여러 데이터 크기를 비교할 때 상태를 처음으로 되돌림"""
+    return reset_state
+
+
+@pytest.fixture
+def db():
+    session = database.SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client():
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def user(db):
+    account = User(email="tester@sejong.ac.kr", password_hash="-", name="테스터")
+    db.add(account)
+    db.commit()
+    return account
+
+
+@pytest.fixture
+def headers_for():
+    """사용자의 Bearer 인증 헤더 생성기"""
+    def make(account: User) -> dict:
+        token = create_access_token(data={"sub": str(account.user_id), "ver": account.token_version})
+        return {"Authorization": f"Bearer {token}"}
+    return make
+
+
+@pytest.fixture
+def auth_headers(user, headers_for):
+    return headers_for(user)
+
+
+@pytest.fixture
+def make_catalog(db):
+    """합성 연구실/프로젝트 카탈로그 생성기 (benchmark_matching.build_catalog, 소유자는 user_id 1)"""
+    def make(n_labs: int, n_projects: int = 3, seed: int = 42):
+        return build_catalog(db, Vocabulary(), n_labs, n_projects, random.Random(seed))
+    return make
+
+
+class QueryCounter:
+    """요청 처리 중 실행된 SQL 문 개수 (읽기/쓰기, 동기/비동기 엔진 모두)"""
+
+    def __init__(self):
+        self.count = 0
+        self.statements = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        # 연결 시 PRAGMA 는 풀 상태에 따라 달라지므로 제외
+        if statement.lstrip().upper().startswith("PRAGMA"):
+            return
+        self.count += 1
+        self.statements.append(statement)
+
+    def reset(self) -> None:
+        self.count = 0
+        self.statements = []
+
+
+@pytest.fixture
+def query_counter():
+    counter = QueryCounter()
+    engines = {
+        database.engine, database.read_engine,
+        database.async_engine.sync_engine, database.async_read_engine.sync_engine
+    }
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", counter._record)
+    yield counter
+    for engine in engines:
+        event.remove(engine, "before_cursor_execute", counter._record)
@@ -0,0 +1,79 @@
+# backend/tests/test_lab_index.py
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models import ResearchLab
+from app.services.lab_index import LabFeatureIndex
+from app.services.lab_scoring import get_batch_scorer, np
+from app.services.text_index import get_description_index
+
+
+def _touch(db, lab_id: int, description: str) -> None:
+    lab = db.get(ResearchLab, lab_id)
+    lab.description = description
+    # SQLite func.now() 는 초 단위라 같은 초 안의 수정은 구분되지 않으므로 직접 지정
+    lab.updated_at = datetime.utcnow() + timedelta(minutes=1)
+    db.commit()
+
+
+def test_refresh_returns_same_snapshot_until_catalog_changes(db, make_catalog):
+    make_catalog(5)
+    index = LabFeatureIndex()
+
+    first = index.refresh(db)
+    assert index.refresh(db) is first
+    assert [lab.lab_id for lab in first.labs] == [1, 2, 3, 4, 5]
+
+    _touch(db, 3, "양자컴퓨팅 연구")
+    second = index.refresh(db)
+    assert second is not first
+    assert second.version > first.version
+    # 이전 스냅숏은 그대로 유지
+    assert first.labs[2].description != "양자컴퓨팅 연구"
+    assert second.labs[2].description == "양자컴퓨팅 연구"
+
+
+def test_invalidate_produces_new_snapshot(db, make_catalog):
+    make_catalog(3)
+    index = LabFeatureIndex()
+
+    first = index.refresh(db)
+    index.invalidate(2)
+    second = index.refresh(db)
+    assert second is not first
+    assert second.version > first.version
+
+
+def test_description_index_follows_snapshot(db, make_catalog):
+    make_catalog(4)
+    index = LabFeatureIndex()
+
+    old = index.refresh(db)
+    _touch(db, 1, "양자컴퓨팅 연구")
+    new = index.refresh(db)
+
+    # 새 스냅숏의 색인을 먼저 만든 뒤 이전 스냅숏으로 호출해도 섞이지 않음
+    new_index = get_description_index(new)
+    old_index = get_description_index(old)
+    assert old_index is not new_index
+    assert get_description_index(new) is not old_index
+    assert get_description_index(new) is get_description_index(new)
+
+
+@pytest.mark.skipif(np is None, reason="numpy 미설치")
+def test_batch_scorer_follows_snapshot(db, make_catalog):
+    make_catalog(4)
+    index = LabFeatureIndex()
+
+    old = index.refresh(db)
+    _touch(db, 1, "양자컴퓨팅 연구")
+    new = index.refresh(db)
+
+    scorer = get_batch_scorer(new)
+    assert get_batch_scorer(new) is scorer
+    assert scorer.labs is new.labs
+
+    # 이전 스냅숏을 늦게 읽은 호출은 자신의 연구실 목록으로 계산
+    assert get_batch_scorer(old).labs is old.labs
+    assert get_batch_scorer(new).labs is new.labs
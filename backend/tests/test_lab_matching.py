@@ -0,0 +1,83 @@
+# backend/tests/test_lab_matching.py
+"""
+상위 k개 매칭(top_matches)이 연구실별 계산(calculate_similarity_score)과 같은 결과를 내는지
+"""
+import pytest
+
+from app.models import Project
+from app.services import lab_matching
+from app.services.lab_index import ProjectFeatures, lab_feature_index
+from app.services.lab_matching import LabMatchingService
+from app.services.lab_scoring import BatchLabScorer, get_batch_scorer, np
+from app.services.text_index import get_description_index
+
+
+def _brute_force(service, project, catalog, k, min_score):
+    scored = []
+    for row, lab in enumerate(catalog.labs):
+        score, details = service.calculate_similarity_score(project, lab)
+        if score >= min_score:
+            scored.append((-score, row, lab.lab_id, details))
+    scored.sort(key=lambda entry: entry[:2])
+    return [(lab_id, -score, details) for score, _, lab_id, details in scored[:k]]
+
+
+def _assert_same(actual, expected):
+    # matching_details 까지 연구실별 계산과 정확히 같아야 함
+    assert [(lab.lab_id, score, details) for lab, score, details in actual] == expected
+
+
+@pytest.fixture
+def catalog(db, make_catalog):
+    project_ids = make_catalog(80, n_projects=4)
+    projects = [ProjectFeatures(db.get(Project, project_id)) for project_id in project_ids]
+    return projects, lab_feature_index.refresh(db)
+
+
+@pytest.mark.parametrize("batch", [True, False], ids=["numpy", "per-lab"])
+@pytest.mark.parametrize("k, min_score", [(5, 0.0), (10, 0.2), (80, 0.0), (3, 0.9)])
+def test_top_matches_equals_brute_force(db, catalog, monkeypatch, batch, k, min_score):
+    if not batch:
+        monkeypatch.setattr(lab_matching, "get_batch_scorer", lambda catalog: None)
+    projects, snapshot = catalog
+    service = LabMatchingService(db)
+
+    for project in projects:
+        _assert_same(
+            service.top_matches(project, snapshot, k, min_score),
+            _brute_force(service, project, snapshot, k, min_score)
+        )
+
+
+def test_score_all_equals_per_document_similarity(catalog):
+    projects, snapshot = catalog
+    index = get_description_index(snapshot)
+
+    for project in projects:
+        query = project.description_query(index)
+        scores = index.score_all(query)
+        for lab in snapshot.labs:
+            expected = index.similarity(query, index.document_vector(lab.lab_id, lab.description_terms))
+            assert scores.get(lab.lab_id, 0.0) == expected
+
+
+@pytest.mark.skipif(np is None, reason="numpy 미설치")
+def test_description_matrix_product_equals_posting_traversal(catalog):
+    projects, snapshot = catalog
+    index = get_description_index(snapshot)
+    scorer = get_batch_scorer(snapshot)
+
+    for project in projects:
+        query = project.description_query(index)
+        expected = index.score_all(query)
+        assert scorer.description_scores(query).tolist() == [expected.get(lab.lab_id, 0.0) for lab in snapshot.labs]
+    assert scorer.description_scores({}).tolist() == [0.0] * len(snapshot.labs)
+
+
+@pytest.mark.skipif(np is None, reason="numpy 미설치")
+def test_top_rows_breaks_ties_by_catalog_order():
+    total = np.array([0.5, 0.7, 0.5, 0.1, 0.7, 0.5])
+    assert BatchLabScorer.top_rows(total, 3, 0.0) == [1, 4, 0]
+    assert BatchLabScorer.top_rows(total, 4, 0.0) == [1, 4, 0, 2]
+    assert BatchLabScorer.top_rows(total, 10, 0.5) == [1, 4, 0, 2, 5]
+    assert BatchLabScorer.top_rows(total, 2, 0.8) == []
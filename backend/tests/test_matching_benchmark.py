@@ -0,0 +1,37 @@
+# backend/tests/test_matching_benchmark.py
+"""
+매칭 엔진 성능 회귀 점검 (benchmark_matching.py 의 작은 카탈로그 버전)
+
+기본 실행에서는 결정적인 메모리 사용량(peak_kib)만 비교합니다.
+지연 시간(같은 실행에서 잰 기준 작업 대비 배수)은 부하가 있는 CI 에서 흔들리므로
+BENCHMARK_TIMING=1 일 때만 비교합니다. 전체 측정은 python benchmark_matching.py 로 실행합니다.
+"""
+import json
+import os
+
+import pytest
+
+from benchmark_matching import BASELINE_PATH, compare, run_size
+
+TIMING = os.environ.get("BENCHMARK_TIMING", "").lower() in ("1", "true")
+
+
+@pytest.fixture(scope="module")
+def measured():
+    with open(BASELINE_PATH, encoding="utf-8") as f:
+        baseline = json.load(f)
+    return {"100": run_size(100, n_projects=10, pairs=50, repeat=2, seed=42)}, baseline
+
+
+def test_matching_memory_within_baseline(measured):
+    results, baseline = measured
+    regressions = compare(results, baseline, tolerance=1.0, metrics_to_check=('peak_kib',))
+    assert not regressions, regressions
+
+
+@pytest.mark.skipif(not TIMING, reason="지연 시간 비교는 BENCHMARK_TIMING=1 일 때만")
+def test_matching_latency_within_baseline_ratio(measured):
+    results, baseline = measured
+    # 짧은 측정이라 p99 는 잡음이 커서 제외하고, 허용 오차도 스크립트 기본값의 두 배로
+    regressions = compare(results, baseline, tolerance=1.0, metrics_to_check=('p50_x',))
+    assert not regressions, regressions
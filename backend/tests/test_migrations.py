@@ -0,0 +1,116 @@
+# backend/tests/test_migrations.py
+import pytest
+from sqlalchemy import Column, Integer, String, inspect, text
+
+from app.database import Base, create_db_engine
+from app.migrations import (
+    SchemaOutdatedError, check_schema, current_version, latest_version, load_migrations, upgrade
+)
+from app.migrations.operations import add_column, create_index, drop_index
+
+# 마이그레이션만 관리하는 테이블 (모델 없음)
+_UNMODELED = {"schema_migrations"}
+
+
+@pytest.fixture
+def engine(tmp_path):
+    db_engine = create_db_engine(f"sqlite:///{tmp_path / 'migrations.db'}")
+    yield db_engine
+    db_engine.dispose()
+
+
+def _model_tables(engine):
+    """FTS5 가상 테이블/섀도 테이블을 제외한 실제 테이블 → 컬럼 집합"""
+    inspector = inspect(engine)
+    return {
+        name: {column["name"] for column in inspector.get_columns(name)}
+        for name in inspector.get_table_names()
+        if not name.startswith("research_labs_fts") and name not in _UNMODELED
+    }
+
+
+def test_versions_are_contiguous():
+    versions = [migration.version for migration in load_migrations()]
+    assert versions == list(range(1, len(versions) + 1))
+    assert latest_version() == versions[-1]
+
+
+def test_upgrade_from_empty_matches_models(engine):
+    applied = upgrade(engine)
+
+    assert [migration.version for migration in applied] == list(range(1, latest_version() + 1))
+    assert current_version(engine) == latest_version()
+    assert check_schema(engine) == latest_version()
+    assert _model_tables(engine) == {
+        table.name: {column.name for column in table.columns}
+        for table in Base.metadata.sorted_tables
+    }
+
+
+def test_upgrade_is_idempotent(engine):
+    upgrade(engine)
+    assert upgrade(engine) == []
+    assert current_version(engine) == latest_version()
+
+
+def test_check_schema_rejects_outdated_db(engine):
+    with pytest.raises(SchemaOutdatedError):
+        check_schema(engine)
+
+    upgrade(engine, target=2)
+    assert current_version(engine) == 2
+    with pytest.raises(SchemaOutdatedError):
+        check_schema(engine)
+
+
+def test_upgrade_backfills_existing_rows(engine):
+    upgrade(engine, target=2)
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO departments (department_id, name) VALUES (1, '컴퓨터공학과')"))
+        conn.execute(text("INSERT INTO professors (professor_id, department_id, name) VALUES (1, 1, '홍길동')"))
+        conn.execute(text(
+            "INSERT INTO research_labs (lab_id, director_id, name, keywords) VALUES (1, 1, '보안 연구실', '보안,암호')"
+        ))
+        conn.execute(text("INSERT INTO users (user_id, email, password_hash, name) VALUES (1, 'a@sejong.ac.kr', '-', '가')"))
+        conn.execute(text(
+            "INSERT INTO projects (project_id, owner_id, name, description, service_type, target_type) "
+            "VALUES (1, 1, '프로젝트', '설명', 'WEB', 'B2C')"
+        ))
+        conn.execute(text(
+            "INSERT INTO team_openings (opening_id, project_id, role_name, description, required_skills) "
+            "VALUES (1, 1, '백엔드', '팀원 모집', 'Python, React')"
+        ))
+
+    upgrade(engine)
+
+    with engine.connect() as conn:
+        # 0003: is_active NULL → 활성
+        assert conn.execute(text("SELECT is_active FROM research_labs WHERE lab_id = 1")).scalar() == 1
+        # 0005: 기존 연구실 색인 (trigram)
+        assert conn.execute(text(
+            "SELECT rowid FROM research_labs_fts WHERE research_labs_fts MATCH '\"연구실\"'"
+        )).scalars().all() == [1]
+        # 0006: 기존 공고 태그 (기술 이름 그대로)
+        assert sorted(conn.execute(text(
+            "SELECT skill FROM team_opening_skills WHERE opening_id = 1"
+        )).scalars()) == ["python", "react"]
+        # 0007: 기존 사용자 토큰 버전
+        assert conn.execute(text("SELECT token_version FROM users WHERE user_id = 1")).scalar() == 0
+
+
+def test_operations_are_idempotent(engine):
+    upgrade(engine)
+    with engine.begin() as conn:
+        assert add_column(conn, "users", Column("nickname", String(50))) is True
+        assert add_column(conn, "users", Column("nickname", String(50))) is False
+        assert create_index(conn, "ix_users_nickname", "users", ["nickname"]) is True
+        assert create_index(conn, "ix_users_nickname", "users", ["nickname"]) is False
+        assert drop_index(conn, "ix_users_nickname", "users") is True
+        assert drop_index(conn, "ix_users_nickname", "users") is False
+
+
+def test_add_column_rejects_not_null_without_default(engine):
+    upgrade(engine)
+    with engine.begin() as conn:
+        with pytest.raises(ValueError):
+            add_column(conn, "users", Column("level", Integer, nullable=False))
@@ -0,0 +1,47 @@
+# backend/tests/test_operator_endpoints.py
+"""
+운영용 엔드포인트(/metrics, /debug/event-loop) 접근 제한
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import settings
+
+
+@pytest.fixture
+def loop_debug(monkeypatch):
+    monkeypatch.setattr(settings, "LOOP_DEBUG_ENDPOINT", True)
+
+
+@pytest.fixture
+def admin(monkeypatch, user):
+    monkeypatch.setattr(settings, "ADMIN_EMAILS", frozenset({user.email}))
+
+
+def test_loop_debug_endpoint_is_off_by_default(client, auth_headers, admin):
+    assert client.get("/debug/event-loop", headers=auth_headers).status_code == 404
+
+
+def test_operator_endpoints_require_token(client, loop_debug):
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/debug/event-loop").status_code == 401
+
+
+def test_operator_endpoints_reject_non_admin(client, auth_headers, loop_debug):
+    assert client.get("/metrics", headers=auth_headers).status_code == 403
+    assert client.get("/debug/event-loop", headers=auth_headers).status_code == 403
+
+
+def test_operator_endpoints_allow_admin(client, auth_headers, admin, loop_debug):
+    assert client.get("/metrics", headers=auth_headers).status_code == 200
+    assert client.get("/debug/event-loop", headers=auth_headers).status_code == 200
+
+
+def test_operator_endpoints_allow_direct_localhost(loop_debug):
+    from app.main import app
+
+    with TestClient(app, client=("127.0.0.1", 50000)) as local:
+        assert local.get("/metrics").status_code == 200
+        assert local.get("/debug/event-loop").status_code == 200
+        # 프록시를 거쳐 들어온 요청은 localhost 로 보지 않음
+        assert local.get("/metrics", headers={"X-Forwarded-For": "203.0.113.7"}).status_code == 401
@@ -0,0 +1,114 @@
+# backend/tests/test_pagination.py
+"""
+커서 기반(keyset) 페이지네이션 - 커서 형식과 목록 API 페이지 이어 읽기
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import text
+
+from app.models import AIReport, Project, TeamOpening, TeamOpeningSkill
+from app.routers.ai_reports import REPORTS_KEYSET
+from app.routers.research_labs import LABS_KEYSET
+from app.services.lab_repository import LabRepository
+from app.utils.pagination import decode_cursor, encode_cursor
+
+# 같은 시각에 만든 행이 있어도 두 번째 키(id)로 순서가 정해져야 함
+CREATED = datetime(2025, 3, 1, 12, 0, 0)
+PROJECT_TIMES = [CREATED, CREATED, CREATED - timedelta(hours=1), CREATED, CREATED - timedelta(days=1),
+                 CREATED - timedelta(hours=1), CREATED + timedelta(minutes=5)]
+
+
+def _pages(client, path: str, limit: int, **params):
+    """next_cursor 를 따라 모든 페이지를 읽음 → 페이지별 응답 목록"""
+    pages, cursor = [], None
+    while True:
+        query = {"limit": limit, **params}
+        if cursor:
+            query["cursor"] = cursor
+        response = client.get(path, params=query)
+        assert response.status_code == 200, response.text
+        body = response.json()
+        pages.append(body["data"])
+        cursor = body["next_cursor"]
+        assert body["has_more"] == (cursor is not None)
+        if cursor is None:
+            return pages
+
+
+@pytest.fixture
+def projects(db, user):
+    for project_id, created_at in enumerate(PROJECT_TIMES, start=1):
+        db.add(Project(
+            project_id=project_id, owner_id=user.user_id, name=f"프로젝트{project_id}", description="설명",
+            service_type="WEB", target_type="B2C", is_active=True, is_public=True, created_at=created_at
+        ))
+    db.commit()
+    # 최신순, 같은 시각이면 id 내림차순
+    return [project_id for _, project_id in sorted(
+        ((created_at, project_id) for project_id, created_at in enumerate(PROJECT_TIMES, start=1)), reverse=True
+    )]
+
+
+def test_cursor_round_trip():
+    values = [datetime(2025, 3, 1, 12, 0, 0, 123456), 42, "abc", 0.5]
+    assert decode_cursor(encode_cursor(values), len(values)) == values
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor([1]), encode_cursor([{"x": 1}, 2]), "!!!!"])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor, 2)
+    assert error.value.status_code == 400
+
+
+def test_pages_follow_on_without_gaps_or_duplicates(client, projects):
+    pages = _pages(client, "/projects/public", limit=3)
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert [project["project_id"] for page in pages for project in page] == projects
+
+
+def test_exact_multiple_of_limit_has_no_empty_last_page(client, projects):
+    pages = _pages(client, "/projects/public", limit=7)
+    assert len(pages) == 1
+    assert len(pages[0]) == 7
+
+
+def test_invalid_cursor_returns_400(client, projects):
+    response = client.get("/projects/public", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+def test_skill_search_pages_by_overlap_then_recency(client, db, projects):
+    skills = ["python", "python,react", "react", "python,react", "python"]
+    for opening_id, tags in enumerate(skills, start=1):
+        db.add(TeamOpening(
+            opening_id=opening_id, project_id=1, role_name="개발자", description="팀원 모집",
+            required_skills=tags, status="OPEN", created_at=CREATED
+        ))
+        db.add_all(TeamOpeningSkill(opening_id=opening_id, skill=tag) for tag in tags.split(","))
+    db.commit()
+
+    pages = _pages(client, "/team/openings/search", limit=2, skills="Python,React")
+    found = [(opening["matched_skills"], opening["opening_id"]) for page in pages for opening in page]
+    assert found == [(2, 4), (2, 2), (1, 5), (1, 3), (1, 1)]
+
+
+def _plan(db, query) -> str:
+    statement = query.statement.compile(db.bind, compile_kwargs={"literal_binds": True})
+    return "\n".join(row.detail for row in db.execute(text(f"EXPLAIN QUERY PLAN {statement}")))
+
+
+@pytest.mark.parametrize("cursor", [None, encode_cursor(["2025-03-01 12:00:00", 5])], ids=["first", "deep"])
+def test_keyset_pages_read_in_index_order(db, cursor):
+    keysets = [
+        ("research_labs", LABS_KEYSET, LabRepository(db).active_labs_query()),
+        ("ai_reports", REPORTS_KEYSET, db.query(AIReport).filter(AIReport.project_id == 1)),
+    ]
+    for table, keyset, query in keysets:
+        plan = _plan(db, keyset.page(query, cursor, 20))
+        # 전체 스캔 + 정렬 없이 인덱스 순서로 limit + 1 행만 읽음
+        assert f"SEARCH {table} USING INDEX" in plan, plan
+        assert "TEMP B-TREE" not in plan, plan
@@ -0,0 +1,84 @@
+# backend/tests/test_principal_cache.py
+"""
+get_current_user 인증 주체 캐시 (TTL + LRU, 키는 user_id + token_version)
+"""
+from app.services import principal_cache as principal_cache_module
+from app.services.principal_cache import PrincipalCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_get_returns_copy_until_ttl(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(principal_cache_module.time, "monotonic", clock)
+    cache = PrincipalCache(max_entries=10, ttl_seconds=60)
+
+    cache.put(1, 0, {"user_id": 1, "name": "가"})
+    cached = cache.get(1, 0)
+    assert cached == {"user_id": 1, "name": "가"}
+    cached["name"] = "나"
+    assert cache.get(1, 0)["name"] == "가"
+    # 다른 토큰 버전은 다른 항목
+    assert cache.get(1, 1) is None
+
+    clock.now += 60
+    assert cache.get(1, 0) is None
+    assert cache.stats() == {"entries": 0, "hits": 2, "misses": 2}
+
+
+def test_invalidate_user_and_lru_eviction():
+    cache = PrincipalCache(max_entries=2, ttl_seconds=60)
+    cache.put(1, 0, {"user_id": 1})
+    cache.put(1, 1, {"user_id": 1})
+    cache.put(2, 0, {"user_id": 2})
+
+    # 가장 오래 쓰지 않은 (1, 0) 이 밀려남
+    assert cache.get(1, 0) is None
+    assert cache.get(1, 1) is not None
+
+    cache.invalidate_user(1)
+    assert cache.get(1, 1) is None
+    assert cache.get(2, 0) is not None
+
+
+def test_disabled_cache_stores_nothing():
+    cache = PrincipalCache(max_entries=10, ttl_seconds=0)
+    cache.put(1, 0, {"user_id": 1})
+    assert cache.get(1, 0) is None
+
+
+def test_repeated_requests_skip_user_lookup(client, auth_headers, query_counter):
+    assert client.get("/users/me", headers=auth_headers).status_code == 200
+
+    query_counter.reset()
+    response = client.get("/users/me", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["data"]["email"] == "tester@sejong.ac.kr"
+    assert query_counter.count == 0
+
+
+def test_profile_update_is_visible_immediately(client, auth_headers):
+    client.get("/users/me", headers=auth_headers)
+
+    response = client.put("/users/me/profile", json={"name": "새이름"}, headers=auth_headers)
+    assert response.status_code == 200, response.text
+    assert client.get("/users/me", headers=auth_headers).json()["data"]["name"] == "새이름"
+
+
+def test_logout_all_revokes_issued_tokens(client, db, user, auth_headers, headers_for):
+    assert client.get("/users/me", headers=auth_headers).status_code == 200
+
+    response = client.post("/auth/logout-all", headers=auth_headers)
+    assert response.status_code == 200, response.text
+
+    # 캐시에 있던 인증 주체도 지워져 이전 토큰은 바로 거부됨
+    assert client.get("/users/me", headers=auth_headers).status_code == 401
+    db.refresh(user)
+    assert user.token_version == 1
+    assert client.get("/users/me", headers=headers_for(user)).status_code == 200
@@ -0,0 +1,127 @@
+# backend/tests/test_recommendations.py
+"""
+연구실 추천 API 가 저장된 매칭 결과/캐시를 쓸 때도 다시 계산한 결과와 같은지 확인
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from app import database
+from app.models import User
+from app.schemas.research_lab import ProjectMatchingRequest
+from app.services.batch_matching import run_batch_matching
+from app.services.lab_matching import LabMatchingService
+from app.services.recommendation_cache import recommendation_cache
+
+
+def _recommended(client, headers, project_id: int, limit: int = 5):
+    response = client.get(f"/research-labs/recommendations/{project_id}?limit={limit}", headers=headers)
+    assert response.status_code == 200, response.text
+    return [(rec["lab_id"], rec["similarity_score"]) for rec in response.json()["data"]["recommendations"]]
+
+
+def _expected(project_id: int, limit: int = 5):
+    db = database.SessionLocal()
+    try:
+        matches = LabMatchingService(db).find_matching_labs(
+            ProjectMatchingRequest(project_id=project_id, max_results=limit, min_score=0.2)
+        )
+        return [(match["lab_id"], match["similarity_score"]) for match in matches]
+    finally:
+        db.close()
+
+
+def _execute(statement: str, **params) -> None:
+    # ORM 이벤트(재매칭 큐)를 거치지 않는 변경 = 다른 프로세스의 변경
+    with database.engine.begin() as conn:
+        conn.execute(text(statement), params)
+
+
+@pytest.fixture
+def project(client, db, make_catalog, headers_for):
+    project_ids = make_catalog(40, n_projects=1)
+    return project_ids[0], headers_for(db.get(User, 1))
+
+
+def _forbid_recompute(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("저장된 결과를 써야 하는데 다시 계산함")
+    monkeypatch.setattr(LabMatchingService, "find_matching_labs", fail)
+
+
+def test_uses_stored_matches_computed_for_current_fingerprint(client, project, monkeypatch):
+    project_id, headers = project
+    response = client.post(
+        "/research-labs/match-project",
+        json={"project_id": project_id, "max_results": 20, "min_score": 0.1}, headers=headers
+    )
+    assert response.status_code == 200, response.text
+    expected = _expected(project_id)
+
+    recommendation_cache.clear()
+    _forbid_recompute(monkeypatch)
+    assert _recommended(client, headers, project_id) == expected
+
+
+def test_recomputes_when_project_changed_after_matching(client, project):
+    project_id, headers = project
+    client.post(
+        "/research-labs/match-project",
+        json={"project_id": project_id, "max_results": 20, "min_score": 0.1}, headers=headers
+    )
+    _execute(
+        "UPDATE projects SET description = :description, service_type = 'APP' WHERE project_id = :project_id",
+        description="모바일 앱으로 보안 취약점을 분석하는 서비스", project_id=project_id
+    )
+
+    assert _recommended(client, headers, project_id) == _expected(project_id)
+
+
+def test_recomputes_when_catalog_changed_in_another_process(client, project):
+    project_id, headers = project
+    client.post(
+        "/research-labs/match-project",
+        json={"project_id": project_id, "max_results": 20, "min_score": 0.1}, headers=headers
+    )
+    before = _recommended(client, headers, project_id)
+
+    top_lab = before[0][0]
+    _execute(
+        "UPDATE research_labs SET is_active = 0, updated_at = :updated_at WHERE lab_id = :lab_id",
+        updated_at=datetime.utcnow() + timedelta(minutes=1), lab_id=top_lab
+    )
+
+    after = _recommended(client, headers, project_id)
+    assert top_lab not in [lab_id for lab_id, _ in after]
+    assert after == _expected(project_id)
+
+
+def test_recomputes_when_stored_run_used_stricter_limits(client, db, project):
+    project_id, headers = project
+    # 일괄 매칭 기본값 (상위 3개, 0.3 이상) 은 추천(상위 10개, 0.2 이상)을 채우지 못할 수 있음
+    run_batch_matching(db, max_results=3, min_score=0.3, workers=1)
+
+    assert _recommended(client, headers, project_id, limit=10) == _expected(project_id, limit=10)
+
+
+def test_stored_rows_with_stricter_threshold_are_used_when_limit_is_filled(client, db, project, monkeypatch):
+    project_id, headers = project
+    run_batch_matching(db, max_results=10, min_score=0.0, workers=1)
+    expected = _expected(project_id, limit=3)
+
+    _forbid_recompute(monkeypatch)
+    assert _recommended(client, headers, project_id, limit=3) == expected
+
+
+def test_cached_response_follows_project_fingerprint(client, project):
+    project_id, headers = project
+    first = _recommended(client, headers, project_id)
+    assert _recommended(client, headers, project_id) == first
+    assert recommendation_cache.stats()["hits"] >= 1
+
+    _execute(
+        "UPDATE projects SET description = :description, service_type = 'WEB' WHERE project_id = :project_id",
+        description="웹 프론트엔드 React 커뮤니티 플랫폼", project_id=project_id
+    )
+    assert _recommended(client, headers, project_id) == _expected(project_id)
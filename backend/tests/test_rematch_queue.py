@@ -0,0 +1,47 @@
+# backend/tests/test_rematch_queue.py
+"""
+연구실 하나가 바뀌었을 때(rematch_lab) 저장된 매칭이 있는 모든 프로젝트가 다시 계산되는지
+"""
+from app.models import Project, ProjectLabMatching, ResearchLab
+from app.schemas.research_lab import ProjectMatchingRequest
+from app.services import rematch_queue
+from app.services.lab_index import lab_feature_index
+from app.services.lab_matching import LabMatchingService
+
+
+def _stored(db, lab_id):
+    rows = db.query(ProjectLabMatching.project_id, ProjectLabMatching.similarity_score).filter(
+        ProjectLabMatching.lab_id == lab_id
+    ).all()
+    return dict(rows)
+
+
+def test_rematch_lab_updates_projects_across_chunks(db, make_catalog, monkeypatch):
+    # 프로젝트 5개를 2개씩 나눠 조회/저장 (IN 절 묶음 3개)
+    monkeypatch.setattr(rematch_queue, "_WRITE_CHUNK_SIZE", 2)
+    project_ids = make_catalog(20, n_projects=5)
+    service = LabMatchingService(db)
+    for project_id in project_ids:
+        service.match_and_save(ProjectMatchingRequest(project_id=project_id, max_results=20, min_score=0.0))
+    lab_id = db.query(ResearchLab.lab_id).order_by(ResearchLab.lab_id).first().lab_id
+    assert set(_stored(db, lab_id)) == set(project_ids)
+
+    lab = db.get(ResearchLab, lab_id)
+    lab.research_areas = "양자컴퓨팅,블록체인"
+    lab.description = "양자 암호와 분산 원장을 연구합니다"
+    db.commit()
+    rematch_queue.rematch_lab(db, lab_id)
+
+    features = next(features for features in lab_feature_index.refresh(db).labs if features.lab_id == lab_id)
+    scores = {
+        project_id: service.calculate_similarity_score(db.get(Project, project_id), features)[0]
+        for project_id in project_ids
+    }
+    assert _stored(db, lab_id) == {
+        project_id: score for project_id, score in scores.items() if score >= rematch_queue.REMATCH_MIN_SCORE
+    }
+
+    lab.is_active = False
+    db.commit()
+    rematch_queue.rematch_lab(db, lab_id)
+    assert _stored(db, lab_id) == {}
@@ -0,0 +1,70 @@
+# backend/tests/test_research_labs_offload.py
+"""
+연구실 라우터의 동기 서비스(매칭, 카탈로그 색인, 저장소 조회)가 이벤트 루프 스레드가 아닌 스레드풀에서 실행되는지
+"""
+import asyncio
+
+import pytest
+
+from app.models import User
+from app.services.lab_index import lab_feature_index
+from app.services.lab_matching import LabMatchingService
+from app.services.lab_repository import LabRepository
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """감시할 동기 함수 이름 → 호출될 때마다 이벤트 루프 스레드에서 실행됐는지 기록"""
+    seen = {}
+
+    def spy(owner, name):
+        original = getattr(owner, name)
+
+        def wrapper(*args, **kwargs):
+            seen.setdefault(name, []).append(_on_event_loop())
+            return original(*args, **kwargs)
+        monkeypatch.setattr(owner, name, wrapper)
+
+    spy(LabMatchingService, "match_and_save")
+    spy(LabMatchingService, "find_matching_labs")
+    spy(LabMatchingService, "get_project_matching_history")
+    spy(lab_feature_index, "refresh")
+    spy(LabRepository, "get_lab_detail")
+    spy(LabRepository, "active_labs_query")
+    return seen
+
+
+@pytest.fixture
+def project(client, db, make_catalog, headers_for):
+    project_ids = make_catalog(10, n_projects=1)
+    return project_ids[0], headers_for(db.get(User, 1))
+
+
+def test_matching_and_recommendations_run_off_event_loop(client, project, calls):
+    project_id, headers = project
+    response = client.post(
+        "/research-labs/match-project", json={"project_id": project_id, "max_results": 5, "min_score": 0.0},
+        headers=headers
+    )
+    assert response.status_code == 200, response.text
+    assert client.get(f"/research-labs/recommendations/{project_id}?limit=10", headers=headers).status_code == 200
+    assert client.get(f"/research-labs/project/{project_id}/matches", headers=headers).status_code == 200
+
+    assert set(calls) >= {"match_and_save", "find_matching_labs", "refresh", "get_project_matching_history"}
+    assert not any(on_loop for seen in calls.values() for on_loop in seen)
+
+
+def test_lab_listing_runs_off_event_loop(client, project, calls):
+    assert client.get("/research-labs/").status_code == 200
+    assert client.get("/research-labs/1").status_code == 200
+
+    assert calls["active_labs_query"] == [False]
+    assert calls["get_lab_detail"] == [False]
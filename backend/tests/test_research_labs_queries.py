@@ -0,0 +1,70 @@
+# backend/tests/test_research_labs_queries.py
+"""
+연구실 조회/매칭 API 의 쿼리 수가 연구실 수와 무관한지 확인 (N+1 회귀 방지)
+
+같은 요청을 두 가지 카탈로그 크기에서 실행하고 실행된 SQL 문 개수가 같은지 비교합니다.
+"""
+import pytest
+
+from app.models import User
+
+SIZES = (5, 60)
+
+
+def _count(client, query_counter, method: str, url: str, **kwargs) -> int:
+    query_counter.reset()
+    response = getattr(client, method)(url, **kwargs)
+    assert response.status_code == 200, response.text
+    return query_counter.count
+
+
+@pytest.fixture
+def measure(client, db, make_catalog, query_counter, reset, headers_for):
+    """카탈로그 크기별로 request(headers, project_id) 를 실행한 쿼리 수"""
+    def run(request):
+        counts = {}
+        for n_labs in SIZES:
+            reset()
+            project_ids = make_catalog(n_labs)
+            headers = headers_for(db.get(User, 1))
+            counts[n_labs] = request(headers, project_ids[0])
+        return counts
+    return run
+
+
+def _match(client, query_counter, headers, project_id) -> int:
+    return _count(
+        client, query_counter, "post", "/research-labs/match-project",
+        json={"project_id": project_id, "max_results": 50, "min_score": 0.0}, headers=headers
+    )
+
+
+def test_list_query_count_is_constant(client, query_counter, measure):
+    counts = measure(lambda headers, project_id: _count(client, query_counter, "get", "/research-labs/?limit=50"))
+    assert len(set(counts.values())) == 1, counts
+
+
+def test_search_query_count_is_constant(client, query_counter, measure):
+    counts = measure(lambda headers, project_id: _count(
+        client, query_counter, "get", "/research-labs/?keyword=AI&limit=50"
+    ))
+    assert len(set(counts.values())) == 1, counts
+
+
+def test_detail_query_count_is_constant(client, query_counter, measure):
+    counts = measure(lambda headers, project_id: _count(client, query_counter, "get", "/research-labs/1"))
+    assert len(set(counts.values())) == 1, counts
+
+
+def test_match_query_count_is_constant(client, query_counter, measure):
+    counts = measure(lambda headers, project_id: _match(client, query_counter, headers, project_id))
+    assert len(set(counts.values())) == 1, counts
+
+
+def test_history_query_count_is_constant(client, query_counter, measure):
+    def history(headers, project_id):
+        _match(client, query_counter, headers, project_id)
+        return _count(client, query_counter, "get", f"/research-labs/project/{project_id}/matches", headers=headers)
+
+    counts = measure(history)
+    assert len(set(counts.values())) == 1, counts
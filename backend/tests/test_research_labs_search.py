@@ -0,0 +1,78 @@
+# backend/tests/test_research_labs_search.py
+"""
+연구실 전문 검색 (FTS5 trigram 색인 + 세 글자 미만 단어 LIKE)
+"""
+import pytest
+
+from app.models import Department, Professor, ResearchLab
+
+LABS = [
+    # (lab_id, 이름, 연구 분야, 키워드, 설명)
+    (1, "음식AI 연구실", ["푸드테크"], "음식AI,추천", "식단 추천 모델을 연구합니다"),
+    (2, "정보보안공학 연구실", ["사이버보안"], "보안,암호", "네트워크 침입 탐지"),
+    (3, "생성형인공지능 연구실", ["인공지능"], "생성모델", "디지털헬스케어 AI 응용"),
+    (4, "로봇 연구실", ["로보틱스"], "로봇,제어", "자율주행 로봇"),
+]
+
+
+@pytest.fixture
+def labs(db):
+    db.add(Department(department_id=1, name="컴퓨터공학과"))
+    db.add(Professor(professor_id=1, department_id=1, name="홍길동", is_active=True))
+    for lab_id, name, areas, keywords, description in LABS:
+        db.add(ResearchLab(
+            lab_id=lab_id, director_id=1, name=name, research_areas=areas,
+            keywords=keywords, description=description, is_active=True
+        ))
+    db.commit()
+
+
+def _search(client, **params):
+    response = client.get("/research-labs/", params={"limit": 50, **params})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _ids(body):
+    return sorted(lab["lab_id"] for lab in body["data"])
+
+
+def test_short_term_matches_inside_compound_word(client, labs):
+    # "음식AI" 안쪽의 AI, 설명의 "AI" 모두 일치
+    assert _ids(_search(client, keyword="AI")) == [1, 3]
+
+
+def test_long_term_matches_infix(client, labs):
+    body = _search(client, keyword="인공지능")
+    assert _ids(body) == [3]
+    assert "<mark>" in body["data"][0]["snippet"]
+
+
+def test_two_syllable_hangul_matches_infix(client, labs):
+    assert _ids(_search(client, keyword="보안")) == [2]
+
+
+def test_all_terms_must_match(client, labs):
+    assert _ids(_search(client, keyword="AI 헬스케어")) == [3]
+    assert _ids(_search(client, keyword="로봇 AI")) == []
+
+
+def test_research_area_search(client, labs):
+    assert _ids(_search(client, research_area="보틱")) == [4]
+    assert _ids(_search(client, keyword="AI", research_area="인공지능")) == [3]
+
+
+def test_short_term_search_pages_with_cursor(client, labs):
+    seen = []
+    cursor = None
+    while True:
+        params = {"keyword": "연구", "limit": 1}
+        if cursor:
+            params["cursor"] = cursor
+        body = client.get("/research-labs/", params=params).json()
+        seen.extend(lab["lab_id"] for lab in body["data"])
+        cursor = body["next_cursor"]
+        if not cursor:
+            break
+    assert sorted(seen) == [1, 2, 3, 4]
+    assert len(seen) == len(set(seen))
@@ -0,0 +1,93 @@
+# backend/tests/test_team_opening_search.py
+"""
+팀원 모집 공고 기술스택 검색 (team_opening_skills 태그)
+"""
+import sqlite3
+
+import pytest
+
+import dummy_data
+import lab_data_parser
+from app import database
+from app.models import Project
+from app.services.skill_tags import skill_tags
+
+
+def _search(client, **params):
+    response = client.get("/team/openings/search", params={"limit": 50, **params})
+    assert response.status_code == 200, response.text
+    return response.json()["data"]
+
+
+@pytest.fixture
+def seeded(monkeypatch):
+    """마이그레이션 → lab_data_parser.py → dummy_data.py 순서의 초기 데이터 (스크립트는 테스트 DB 로 연결)"""
+    connect = sqlite3.connect
+
+    def connect_test_db(path, *args, **kwargs):
+        if path == "sejong_startup.db":
+            path = database.engine.url.database
+        return connect(path, *args, **kwargs)
+
+    monkeypatch.setattr(sqlite3, "connect", connect_test_db)
+    lab_data_parser.parse_and_insert_lab_data()
+    dummy_data.insert_dummy_data()
+
+
+@pytest.fixture
+def openings(client, db, user, auth_headers):
+    db.add(Project(
+        project_id=1, owner_id=user.user_id, name="프로젝트", description="설명",
+        service_type="WEB", target_type="B2C", is_active=True, is_public=True
+    ))
+    db.commit()
+    for role, skills in [("프론트엔드", "ReactJS, TypeScript"), ("프론트엔드", "Vue, JavaScript"), ("백엔드", "Node.js")]:
+        response = client.post(
+            "/team/openings/",
+            json={"project_id": 1, "role_name": role, "description": "팀원 모집", "required_skills": skills},
+            headers=auth_headers
+        )
+        assert response.status_code == 200, response.text
+
+
+def test_skill_tags_keep_distinct_technologies():
+    assert skill_tags("React, Node.js / JavaScript; Vue") == ["react", "node.js", "javascript", "vue.js"]
+    assert skill_tags("ReactJS, react.js, 리액트") == ["react"]
+    assert skill_tags(" Machine   Learning , ML ") == ["머신러닝"]
+    assert skill_tags(None) == []
+
+
+def test_seeded_openings_are_searchable_by_skill(client, seeded):
+    found = _search(client, skills="Python")
+
+    assert found
+    assert all("python" in skill_tags(opening["required_skills"]) for opening in found)
+
+
+def test_search_does_not_match_other_technologies_in_same_field(client, openings):
+    found = _search(client, skills="React")
+    assert [opening["required_skills"] for opening in found] == ["ReactJS, TypeScript"]
+
+    found = _search(client, skills="vue.js")
+    assert [opening["required_skills"] for opening in found] == ["Vue, JavaScript"]
+
+
+def test_search_orders_by_matched_skills(client, openings):
+    found = _search(client, skills="React,TypeScript,Node.js")
+    assert [opening["matched_skills"] for opening in found] == [2, 1]
+
+    found = _search(client, skills="React,TypeScript", skills_mode="all")
+    assert [opening["required_skills"] for opening in found] == ["ReactJS, TypeScript"]
+
+
+def test_updating_required_skills_replaces_tags(client, openings, auth_headers):
+    opening_id = _search(client, skills="Node.js")[0]["opening_id"]
+    response = client.put(
+        f"/team/openings/{opening_id}",
+        json={"project_id": 1, "role_name": "백엔드", "description": "팀원 모집", "required_skills": "Go, Kubernetes"},
+        headers=auth_headers
+    )
+    assert response.status_code == 200, response.text
+
+    assert _search(client, skills="Node.js") == []
+    assert [opening["opening_id"] for opening in _search(client, skills="golang")] == [opening_id]
@@ -0,0 +1,53 @@
+# backend/tests/test_token_cache.py
+"""
+서명 검증을 마친 JWT 클레임 캐시 (토큰 해시 → 클레임, exp 까지)
+"""
+from app import auth
+from app.services import token_cache as token_cache_module
+from app.services.token_cache import TokenCache, token_cache, token_digest
+
+
+def test_entries_expire_at_token_exp(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(token_cache_module.time, "time", lambda: now[0])
+    cache = TokenCache(max_entries=10)
+
+    cache.put("token-a", {"sub": "1", "exp": 1060})
+    assert cache.get("token-a") == {"sub": "1", "exp": 1060}
+    assert cache.get("token-b") is None
+
+    now[0] = 1060
+    assert cache.get("token-a") is None
+    assert cache.stats() == {"entries": 0, "hits": 1, "misses": 2}
+
+
+def test_tokens_without_exp_are_not_cached():
+    cache = TokenCache(max_entries=10)
+    cache.put("token", {"sub": "1"})
+    assert cache.get("token") is None
+
+
+def test_keys_are_digests_and_lru_bounded():
+    cache = TokenCache(max_entries=2)
+    for token in ["token-a", "token-b", "token-c"]:
+        cache.put(token, {"sub": "1", "exp": 2 ** 40})
+
+    assert list(cache._entries) == [token_digest("token-b"), token_digest("token-c")]
+    assert cache.get("token-a") is None
+
+
+def test_repeated_requests_skip_signature_check(client, auth_headers, monkeypatch):
+    assert client.get("/users/me", headers=auth_headers).status_code == 200
+
+    def fail(*args, **kwargs):
+        raise AssertionError("캐시된 토큰을 다시 검증함")
+    monkeypatch.setattr(auth.jwt, "decode", fail)
+
+    assert client.get("/users/me", headers=auth_headers).status_code == 200
+    assert token_cache.stats()["hits"] >= 1
+
+
+def test_invalid_token_is_rejected_and_not_cached(client):
+    response = client.get("/users/me", headers={"Authorization": "Bearer not-a-jwt"})
+    assert response.status_code == 401
+    assert token_cache.stats()["entries"] == 0